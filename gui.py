@@ -74,6 +74,12 @@ def _build_engine():
         engine.script_engine.register(BuffScript())
         engine.script_engine.register(CavebotScript())
 
+        # Mapa aprendido em data/map/, compartilhado entre bots do host
+        try:
+            engine.open_map_store()
+        except OSError as exc:
+            logging.getLogger("gui").warning(f"Mapa persistente indisponivel: {exc}")
+
         return engine
     except Exception as exc:
         logging.getLogger("gui").error(f"Falha ao criar BotEngine: {exc}", exc_info=True)
@@ -0,0 +1,119 @@
+"""
+Benchmark de pathfinding: AStar x JumpPointSearch em areas grandes.
+
+Cenarios (andar 7, coordenadas proximas das do mapa real):
+  - aberto:   chao sem obstaculos conhecidos (free-walk)
+  - pilares:  chao aberto com pilares/pedras espalhados (densidade --density)
+  - salas:    grade de salas ligadas por portas (caverna de corredores)
+
+Para cada cenario roda --routes rotas aleatorias de --distance tiles e
+mostra tempo medio/p95 por rota, nos expandidos e se o custo dos dois
+caminhos bate (os dois sao otimos).
+
+Uso:
+    python scripts/benchmark_pathfinding.py
+    python scripts/benchmark_pathfinding.py --distance 400 --routes 20 --density 0.1
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.ai.pathfinding.astar import AStar  # noqa: E402
+from src.ai.pathfinding.jps import JumpPointSearch  # noqa: E402
+from src.ai.pathfinding.tile_grid import TileGrid  # noqa: E402
+from src.core.value_objects.position import Position  # noqa: E402
+
+ORIGIN = 32000
+Z = 7
+
+
+def build_open(size: int, rnd: random.Random, density: float) -> TileGrid:
+    return TileGrid()
+
+
+def build_pillars(size: int, rnd: random.Random, density: float) -> TileGrid:
+    grid = TileGrid()
+    for _ in range(int(size * size * density)):
+        grid.mark_blocked(ORIGIN + rnd.randrange(size), ORIGIN + rnd.randrange(size), Z)
+    return grid
+
+
+def build_rooms(size: int, rnd: random.Random, density: float, room: int = 24) -> TileGrid:
+    """Paredes a cada `room` tiles; cada lado de sala tem uma porta de 3 tiles."""
+    grid = TileGrid()
+    for wall in range(0, size, room):
+        doors = set()
+        # uma porta por trecho entre paredes cruzadas: toda sala e alcancavel
+        for segment in range(0, size, room):
+            start = segment + 1 + rnd.randrange(max(1, min(room, size - segment) - 4))
+            doors.update(range(start, start + 3))
+        for i in range(size):
+            if i not in doors:
+                grid.mark_blocked(ORIGIN + wall, ORIGIN + i, Z)
+                grid.mark_blocked(ORIGIN + i, ORIGIN + wall, Z)
+    return grid
+
+
+SCENARIOS = {"aberto": build_open, "pilares": build_pillars, "salas": build_rooms}
+
+
+def _cost(path) -> int:
+    return sum(14 if a.x != b.x and a.y != b.y else 10 for a, b in zip(path, path[1:]))
+
+
+def _routes(grid: TileGrid, size: int, distance: int, count: int, rnd: random.Random):
+    routes = []
+    while len(routes) < count:
+        sx, sy = rnd.randrange(size), rnd.randrange(size)
+        dx = min(distance, size - 1)
+        tx = sx + dx if sx + dx < size else sx - dx
+        ty = rnd.randrange(size)
+        start = Position(ORIGIN + sx, ORIGIN + sy, Z)
+        goal = Position(ORIGIN + tx, ORIGIN + ty, Z)
+        if not grid.is_blocked(start.x, start.y, Z) and not grid.is_blocked(goal.x, goal.y, Z):
+            routes.append((start, goal))
+    return routes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--size", type=int, default=512, help="lado da area em tiles")
+    parser.add_argument("--distance", type=int, default=300, help="distancia em x das rotas")
+    parser.add_argument("--routes", type=int, default=10)
+    parser.add_argument("--density", type=float, default=0.08, help="densidade dos pilares")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"area={args.size}x{args.size} distancia={args.distance} rotas={args.routes}")
+    for name, build in SCENARIOS.items():
+        rnd = random.Random(args.seed)
+        grid = build(args.size, rnd, args.density)
+        routes = _routes(grid, args.size, args.distance, args.routes, rnd)
+        results = {}
+        for label, finder in (("astar", AStar(grid)), ("jps", JumpPointSearch(grid))):
+            times, expanded, costs = [], [], []
+            for start, goal in routes:
+                t0 = time.perf_counter()
+                # limite alto: compara os algoritmos, nao o corte do engine
+                path = finder.find_path(start, goal, max_iterations=200_000)
+                times.append((time.perf_counter() - t0) * 1000)
+                expanded.append(finder.last_expanded)
+                costs.append(_cost(path) if path else None)
+            results[label] = (np.array(times), expanded, costs)
+        same = results["astar"][2] == results["jps"][2]
+        print(f"{name}: custos iguais={same}")
+        for label, (times, expanded, _) in results.items():
+            print(
+                f"  {label:<6} media={times.mean():8.2f} ms  p95={np.percentile(times, 95):8.2f} ms"
+                f"  expandidos/rota={sum(expanded) / len(expanded):9.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Benchmark de BotEngine.tick contra o processo 8.60 simulado.
+
+Roda N instancias do bot (cada uma com seu SimulatedBackend) com a
+BattleList cheia e mede a latencia de tick (media, p50, p95, p99) e a
+vazao total. Com --workers > 1 as instancias sao divididas entre
+processos, como varios bots rodando na mesma maquina.
+
+Uso:
+    python scripts/benchmark_tick.py --instances 20 --ticks 500
+    python scripts/benchmark_tick.py --instances 64 --workers 4 --creatures 249
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+from multiprocessing import Pool
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.application.bot_engine import BotEngine  # noqa: E402
+from src.application.scripts.aimbot_script import AimbotScript  # noqa: E402
+from src.application.scripts.healing_script import HealingScript  # noqa: E402
+from src.core.constants.addresses_860 import (  # noqa: E402
+    BATTLE_LIST, CREATURE, PLAYER, PLAYER_EXTRA,
+)
+from src.infrastructure.injection.simulated_injector import SimulatedInjector  # noqa: E402
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend  # noqa: E402
+from src.infrastructure.memory.memory_reader import MemoryReader  # noqa: E402
+from src.infrastructure.memory.process_manager import ProcessManager  # noqa: E402
+
+
+def build_engine(seed: int, creatures: int, with_scripts: bool) -> BotEngine:
+    """BotEngine completo sobre um SimulatedBackend proprio."""
+    backend = SimulatedBackend(creatures=creatures, seed=seed)
+    pm = ProcessManager(backend=backend)
+    engine = BotEngine(
+        process_manager=pm,
+        memory_reader=MemoryReader(pm),
+        keyboard_injector=SimulatedInjector(backend),
+        player_addresses={**PLAYER, **PLAYER_EXTRA},
+        battle_list_addresses=BATTLE_LIST,
+        creature_offsets=CREATURE,
+    )
+    if with_scripts:
+        for script in (HealingScript(), AimbotScript()):
+            script.enabled = True
+            engine.script_engine.register(script)
+    engine.clock = lambda: backend.time  # scripts vencem pelo tempo simulado
+    engine.config["async_input"] = False  # comandos aplicados no proprio tick
+    engine.start()
+    engine.enabled = with_scripts
+    return engine
+
+
+def run_instances(args) -> tuple:
+    """
+    Roda `count` instancias em round-robin; devolve (latencias ms, stats do
+    mundo, fases do TickProfiler da primeira instancia).
+    """
+    first_seed, count, ticks, creatures, with_scripts = args
+    logging.disable(logging.CRITICAL)
+    engines = [build_engine(first_seed + i, creatures, with_scripts) for i in range(count)]
+    latencies = np.empty(count * ticks)
+    n = 0
+    for _ in range(ticks):
+        for engine in engines:
+            start = time.perf_counter()
+            engine.tick()
+            latencies[n] = time.perf_counter() - start
+            n += 1
+    stats = [{**engine._pm.backend.stats, **engine.arbiter.snapshot()} for engine in engines]
+    return latencies * 1000.0, stats, engines[0].profiler.snapshot()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--instances", type=int, default=10)
+    parser.add_argument("--ticks", type=int, default=300)
+    parser.add_argument("--creatures", type=int, default=249)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--no-scripts", action="store_true",
+                        help="so leitura de memoria + eventos, sem scripts")
+    args = parser.parse_args()
+
+    workers = max(1, min(args.workers, args.instances))
+    share, extra = divmod(args.instances, workers)
+    jobs, seed = [], 0
+    for w in range(workers):
+        count = share + (1 if w < extra else 0)
+        jobs.append((seed, count, args.ticks, args.creatures, not args.no_scripts))
+        seed += count
+
+    wall = time.perf_counter()
+    if workers == 1:
+        results = [run_instances(jobs[0])]
+    else:
+        with Pool(workers) as pool:
+            results = pool.map(run_instances, jobs)
+    wall = time.perf_counter() - wall
+
+    latencies = np.concatenate([r[0] for r in results])
+    stats = [s for r in results for s in r[1]]
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    print(f"instancias={args.instances} workers={workers} ticks={args.ticks} "
+          f"criaturas={args.creatures} scripts={'nao' if args.no_scripts else 'sim'}")
+    print(f"tick ms: media={latencies.mean():.3f} p50={p50:.3f} "
+          f"p95={p95:.3f} p99={p99:.3f} max={latencies.max():.3f}")
+    print(f"vazao: {len(latencies) / wall:,.0f} ticks/s em {wall:.2f}s")
+    print(f"mundo: kills={sum(s['kills'] for s in stats)} "
+          f"ataques={sum(s['attacks'] for s in stats)} "
+          f"magias={sum(s['spells_cast'] for s in stats)} "
+          f"mortes={sum(s['deaths'] for s in stats)}")
+    print(f"acoes: pedidas={sum(s['requested'] for s in stats)} "
+          f"enviadas={sum(s['sent'] for s in stats)} "
+          f"adiadas={sum(s['deferred'] for s in stats)} "
+          f"coalescidas={sum(s['coalesced'] for s in stats)} "
+          f"exhaust={sum(s['exhausted'] for s in stats)}")
+    print("fases (instancia 0):")
+    for phase, st in results[0][2].items():
+        print(f"  {phase:<24} p50={st['p50_ms']:.3f} p95={st['p95_ms']:.3f} "
+              f"p99={st['p99_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,9 @@ AI de combate inteligente.
 from typing import List, Optional
 from src.core.entities.player import Player
 from src.core.entities.creature import Creature
+from src.core.entities.creature_table import CreatureTable
 from src.core.value_objects.position import Position
-from .threat_analyzer import ThreatAnalyzer
+from .threat_analyzer import ThreatAnalyzer, aligned_table
 from .skill_rotation import Skill, SkillRotation, DruidRotation, SorcererRotation, KnightRotation, PaladinRotation
 from src.infrastructure.logging.logger import get_logger
 
@@ -40,17 +41,22 @@ class CombatAI:
     def analyze_situation(
         self,
         player: Player,
-        creatures: List[Creature]
+        creatures: List[Creature],
+        table: Optional[CreatureTable] = None,
     ) -> dict:
         """
         Analisa situação de combate.
+
+        `table`: CreatureTable do tick alinhada com `creatures` (senao e
+        montada uma vez aqui e usada pelas duas analises).
         
         Returns:
             Dicionário com análise completa
         """
         # Analisa ameaças
-        should_flee = self.threat_analyzer.should_flee(player, creatures)
-        highest_threat = self.threat_analyzer.get_highest_threat(creatures, player)
+        table = aligned_table(creatures, table) if creatures else table
+        should_flee = self.threat_analyzer.should_flee(player, creatures, table)
+        highest_threat = self.threat_analyzer.get_highest_threat(creatures, player, table)
         
         # Próxima skill
         next_skill = self.skill_rotation.get_next_skill(player, highest_threat)
@@ -73,7 +79,8 @@ class CombatAI:
     def decide_action(
         self,
         player: Player,
-        creatures: List[Creature]
+        creatures: List[Creature],
+        table: Optional[CreatureTable] = None,
     ) -> str:
         """
         Decide ação baseado na situação.
@@ -84,7 +91,7 @@ class CombatAI:
         if not self.enabled:
             return "idle"
         
-        analysis = self.analyze_situation(player, creatures)
+        analysis = self.analyze_situation(player, creatures, table)
         
         # Prioridade 1: Fugir se necessário
         if self.auto_flee and analysis["should_flee"]:
@@ -107,10 +114,11 @@ class CombatAI:
     def get_target(
         self,
         player: Player,
-        creatures: List[Creature]
+        creatures: List[Creature],
+        table: Optional[CreatureTable] = None,
     ) -> Optional[Creature]:
         """Retorna melhor alvo baseado em análise de ameaças."""
-        return self.threat_analyzer.get_highest_threat(creatures, player)
+        return self.threat_analyzer.get_highest_threat(creatures, player, table)
 
     def mark_skill_used(self, skill_name: str) -> None:
         """Marca skill como usada para iniciar cooldown."""
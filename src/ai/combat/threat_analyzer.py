@@ -1,12 +1,30 @@
 """
 Análise de ameaças em combate.
 """
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+import numpy as np
+
 from src.core.entities.player import Player
 from src.core.entities.creature import Creature
+from src.core.entities.creature_table import CreatureTable
 from src.core.value_objects.position import Position
 
 
+def aligned_table(creatures: List[Creature], table: Optional[CreatureTable]) -> CreatureTable:
+    """
+    `table` se estiver alinhada com `creatures` (as mesmas entidades, na
+    mesma ordem); senao monta uma nova.
+    """
+    if (
+        table is None
+        or len(table) != len(creatures)
+        or not all(a is b for a, b in zip(table.creatures, creatures))
+    ):
+        return CreatureTable.from_creatures(creatures)
+    return table
+
+
 class ThreatLevel:
     """Níveis de ameaça."""
     NONE = 0
@@ -66,33 +84,57 @@ class ThreatAnalyzer:
             threat += 5
         
         return min(int(threat), 100)
-    
+
+    def threat_scores(self, table: CreatureTable, player: Player) -> np.ndarray:
+        """
+        Versao vetorizada de analyze_creature para todas as linhas da tabela.
+
+        Returns:
+            Array de ameaca (0-100), alinhado com table.creatures
+        """
+        levels = self.creature_threat_levels
+        base = np.fromiter(
+            (levels.get(c.name, ThreatLevel.MEDIUM) for c in table.creatures),
+            dtype=np.float64,
+            count=len(table),
+        ) * 15
+        rows = table.rows
+        distance = table.distances(player.position)
+        threat = (
+            base
+            + (rows["hp_bar"] / 100) * 10
+            + np.select([distance <= 1, distance <= 3, distance <= 5], [30, 20, 10], 0)
+            + np.where((rows["visible"] != 0) & (rows["walking"] != 0), 5, 0)
+        )
+        return np.minimum(threat.astype(np.int64), 100)
+
     def get_highest_threat(
         self,
         creatures: List[Creature],
-        player: Player
+        player: Player,
+        table: Optional[CreatureTable] = None,
     ) -> Creature | None:
-        """Retorna criatura com maior ameaça."""
+        """
+        Retorna criatura com maior ameaça.
+
+        `table` e a CreatureTable do tick alinhada com `creatures`; sem ela
+        a tabela e montada aqui.
+        """
         if not creatures:
             return None
-        
-        threats = [
-            (creature, self.analyze_creature(creature, player))
-            for creature in creatures
-        ]
-        
-        # Ordena por ameaça (maior primeiro)
-        threats.sort(key=lambda x: x[1], reverse=True)
-        
-        return threats[0][0] if threats else None
+
+        table = aligned_table(creatures, table)
+        # argmax devolve a primeira de maior ameaca (mesmo desempate do sort estavel)
+        return table.best(self.threat_scores(table, player))
     
     def should_flee(
         self,
         player: Player,
-        creatures: List[Creature]
+        creatures: List[Creature],
+        table: Optional[CreatureTable] = None,
     ) -> bool:
         """
-        Decide se deve fugir.
+        Decide se deve fugir (`table` como em get_highest_threat).
         
         Returns:
             True se deve fugir
@@ -101,14 +143,15 @@ class ThreatAnalyzer:
         if player.hp_percent() < 20:
             return True
         
+        if not creatures:
+            return False
+
         # Conta criaturas próximas perigosas
-        dangerous_nearby = 0
-        for creature in creatures:
-            distance = player.position.distance_chebyshev(creature.position)
-            threat = self.analyze_creature(creature, player)
-            
-            if distance <= 3 and threat >= 50:
-                dangerous_nearby += 1
+        table = aligned_table(creatures, table)
+        dangerous_nearby = int(np.count_nonzero(
+            (table.distances(player.position) <= 3)
+            & (self.threat_scores(table, player) >= 50)
+        ))
         
         # Foge se muitas criaturas perigosas próximas
         if dangerous_nearby >= 3:
@@ -10,74 +10,149 @@ Ordem correta:
   1. blocked_tiles -> sempre False
   2. walkable_tiles populado -> restringe a eles
   3. walkable_tiles vazio -> free-walk (padrao Tibia 8.60)
+
+Os tiles conhecidos ficam numa TileGrid (1 byte por tile, chunks de
+256x256 por andar), que pode ser compartilhada com o MapAnalyzer e
+persistida (MapStore). set_walkable() liga o modo restrito (regra 2) numa
+TileGrid privada do AStar: a grade compartilhada nunca e alterada, e as
+marcas de caminhavel aprendidas (cavebot, MapAnalyzer) nao ampliam a area
+permitida. Na busca restrita os chunks da area permitida recebem as marcas
+de bloqueio/custo da grade (floor_chunks).
+
+Busca (find_path):
+  - cada tile do andar e um int: (y << 16) | x (coordenadas 8.60 cabem em
+    16 bits); nada de Node/Position por vizinho, Position so no caminho
+    final
+  - flags do vizinho lidas por indice no chunk do no expandido (o chunk
+    so e procurado de novo na borda dele)
+  - custo extra do tile (bits 4-7 da grade) soma passos retos ao custo
+  - open set = heap de tuplas (f, h, g, key) com remocao preguicosa:
+    entradas cujo g ja foi melhorado sao descartadas ao sair do heap
+  - best_g e parent sao dicts indexados pela chave; o duplicado no open
+    set e um lookup O(1) (antes: varredura linear por vizinho, O(n^2))
+  - heuristica octile (10 ortogonal / 14 diagonal), admissivel e
+    consistente: cada tile e expandido no maximo uma vez
 """
-from typing import List, Optional, Tuple, Set
+from heapq import heappop, heappush
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
 from src.core.value_objects.position import Position
-import heapq
+from .tile_grid import BLOCKED, CHUNK_MASK, CHUNK_TILES, COST_SHIFT, WALKABLE, TileGrid
+
+# Custos por passo (x10 para ficar em inteiros)
+STRAIGHT_COST = 10
+DIAGONAL_COST = 14
 
+# (dx, dy, custo) - N, S, E, W, NE, NW, SE, SW
+MOVES: Tuple[Tuple[int, int, int], ...] = (
+    (0, -1, STRAIGHT_COST),
+    (0, 1, STRAIGHT_COST),
+    (1, 0, STRAIGHT_COST),
+    (-1, 0, STRAIGHT_COST),
+    (1, -1, DIAGONAL_COST),
+    (-1, -1, DIAGONAL_COST),
+    (1, 1, DIAGONAL_COST),
+    (-1, 1, DIAGONAL_COST),
+)
 
-class Node:
-    """No para A*."""
+# Limite de expansoes (~7 us cada): uma busca sem caminho custa no maximo
+# ~150 ms na thread do engine. Cobre rotas de caverna de ~100 tiles mesmo
+# com desvios (o antigo 1000 cortava a partir de ~30 SQMs); rotas mais
+# longas passam pelo HPA* do Pathfinder.
+DEFAULT_MAX_ITERATIONS = 20_000
 
-    def __init__(self, position: Position, parent: Optional['Node'] = None):
-        self.position = position
-        self.parent = parent
-        self.g = 0  # Custo do inicio ate este no
-        self.h = 0  # Heuristica (estimativa ate o fim)
-        self.f = 0  # g + h
+_COORD_MASK = 0xFFFF
 
-    def __lt__(self, other):
-        return self.f < other.f
+# MOVES com o deslocamento da chave empacotada; _OFFSETS: do indice no chunk
+_STEPS = tuple((dx, dy, cost, (dy << 16) + dx) for dx, dy, cost in MOVES)
+_OFFSETS = tuple((dy << 8) + dx for dx, dy, _ in MOVES)
+_EMPTY_CHUNK = bytes(CHUNK_TILES)
 
-    def __eq__(self, other):
-        return self.position == other.position
 
-    def __hash__(self):
-        return hash((self.position.x, self.position.y, self.position.z))
+def pack(x: int, y: int) -> int:
+    """Chave inteira de um tile dentro do andar."""
+    return (y << 16) | x
+
+
+def octile(dx: int, dy: int) -> int:
+    """Custo minimo entre dois tiles (dx, dy >= 0) com passos 10/14."""
+    if dx < dy:
+        dx, dy = dy, dx
+    return STRAIGHT_COST * dx + (DIAGONAL_COST - STRAIGHT_COST) * dy
 
 
 class AStar:
     """Algoritmo A* para pathfinding."""
 
-    def __init__(self):
-        self.walkable_tiles: Set[Tuple[int, int, int]] = set()
-        self.blocked_tiles: Set[Tuple[int, int, int]] = set()
+    def __init__(self, grid: Optional[TileGrid] = None):
+        self.grid = grid if grid is not None else TileGrid()
+        # Area permitida de set_walkable() (None = free-walk), fora da grade
+        self._allowed: Optional[TileGrid] = None
+        self._merged: Dict[int, Tuple[Tuple[int, int], Dict[int, bytes]]] = {}
+        self.last_expanded = 0
+
+    @property
+    def restricted(self) -> bool:
+        """True apos set_walkable(): so a area dada entra na busca."""
+        return self._allowed is not None
+
+    @property
+    def walkable_tiles(self) -> FrozenSet[Tuple[int, int, int]]:
+        """
+        Copia somente-leitura da area de set_walkable() (vazia em free-walk).
+
+        Obsoleto: era um set mutavel; para alterar use set_walkable(), e
+        para consultar is_walkable().
+        """
+        if self._allowed is None:
+            return frozenset()
+        return frozenset(self._allowed.tiles(WALKABLE))
+
+    @property
+    def blocked_tiles(self) -> FrozenSet[Tuple[int, int, int]]:
+        """
+        Copia somente-leitura dos tiles BLOCKED (varre a grade inteira).
+
+        Obsoleto: era um set mutavel; para alterar use add_blocked() ou a
+        `grid`, e para consultar is_walkable().
+        """
+        return frozenset(self.grid.tiles(BLOCKED))
 
     def set_walkable(self, positions: List[Position]) -> None:
-        """Define tiles caminhavels."""
-        self.walkable_tiles = {(p.x, p.y, p.z) for p in positions}
+        """
+        Restringe a busca a `positions` (lista vazia = volta ao free-walk).
+        Nao altera a grade compartilhada.
+        """
+        allowed = TileGrid()
+        for p in positions:
+            allowed.update(p.x, p.y, p.z, WALKABLE)
+        self._allowed = allowed if positions else None
+        self._merged.clear()
 
     def add_blocked(self, position: Position) -> None:
         """Adiciona tile bloqueada."""
-        self.blocked_tiles.add((position.x, position.y, position.z))
+        self.grid.update(position.x, position.y, position.z, BLOCKED)
 
     def is_walkable(self, position: Position) -> bool:
         """
         Verifica se posicao e caminhavel.
 
         BUG-A FIX - ordem correta dos checks:
-          ANTES (quebrado):
-            if self.walkable_tiles:
-                return pos in walkable AND pos not in blocked
-            return pos not in blocked
-          -> Quando walkable_tiles era populado com qualquer coisa,
-             qualquer posicao fora da lista retornava False, bloqueando
-             todos os vizinhos do A*.
-
-          AGORA (correto):
-            1. Blocked sempre tem prioridade (False).
-            2. Se walkable_tiles definido -> restringe a eles.
-            3. Se vazio -> free-walk (assume tudo caminhavel).
+          1. Blocked sempre tem prioridade (False).
+          2. Se walkable_tiles definido -> restringe a eles.
+          3. Se vazio -> free-walk (assume tudo caminhavel).
         """
-        pos_tuple = (position.x, position.y, position.z)
+        flags = self.grid.get(position.x, position.y, position.z)
 
         # Regra 1: bloqueado explicitamente -> sempre False
-        if pos_tuple in self.blocked_tiles:
+        if flags & BLOCKED:
             return False
 
         # Regra 2: se temos mapa definido, restringe a tiles validos
-        if self.walkable_tiles:
-            return pos_tuple in self.walkable_tiles
+        if self._allowed is not None:
+            return self._allowed.is_walkable(position.x, position.y, position.z)
 
         # Regra 3: sem mapa populado -> free-walk (padrao Tibia 8.60)
         return True
@@ -89,86 +164,127 @@ class AStar:
     def get_neighbors(self, position: Position) -> List[Position]:
         """Retorna vizinhos validos (8 direcoes)."""
         neighbors = []
-
-        directions = [
-            (0, -1, 0),   # N
-            (0,  1, 0),   # S
-            (1,  0, 0),   # E
-            (-1, 0, 0),   # W
-            (1, -1, 0),   # NE
-            (-1,-1, 0),   # NW
-            (1,  1, 0),   # SE
-            (-1, 1, 0),   # SW
-        ]
-
-        for dx, dy, dz in directions:
-            new_pos = Position(
-                position.x + dx,
-                position.y + dy,
-                position.z + dz
-            )
+        for dx, dy, _ in MOVES:
+            new_pos = Position(position.x + dx, position.y + dy, position.z)
             if self.is_walkable(new_pos):
                 neighbors.append(new_pos)
-
         return neighbors
 
     def find_path(
         self,
         start: Position,
         goal: Position,
-        max_iterations: int = 1000
+        max_iterations: int = DEFAULT_MAX_ITERATIONS
     ) -> Optional[List[Position]]:
         """
         Encontra caminho de start ate goal usando A*.
 
+        So ha vizinhos no mesmo andar: start e goal em andares diferentes
+        retornam None sem buscar.
+
         Returns:
             Lista de posicoes (caminho) ou None se nao encontrar
         """
-        start_node = Node(start)
-        open_list  = []
-        closed_set = set()
-
-        heapq.heappush(open_list, start_node)
+        self.last_expanded = 0
+        if start.z != goal.z:
+            return None
+        z = start.z
+        chunks = self.floor_chunks(z)
+        # Tile desconhecido (0) e aceito so fora do modo restrito
+        reject = BLOCKED
+        required = WALKABLE if self.restricted else 0
+
+        start_key = pack(start.x, start.y)
+        goal_key = pack(goal.x, goal.y)
+        gx, gy = goal.x, goal.y
+
+        h = octile(abs(start.x - gx), abs(start.y - gy))
+        open_heap = [(h, h, 0, start_key)]
+        best_g = {start_key: 0}
+        parent = {start_key: -1}
         iterations = 0
 
-        while open_list and iterations < max_iterations:
+        while open_heap and iterations < max_iterations:
+            _, _, g, key = heappop(open_heap)
+            if g != best_g[key]:
+                continue  # entrada obsoleta (g ja melhorado)
             iterations += 1
-            current = heapq.heappop(open_list)
-            closed_set.add(current)
-
-            if current.position == goal:
-                return self._reconstruct_path(current)
 
-            for neighbor_pos in self.get_neighbors(current.position):
-                neighbor = Node(neighbor_pos, current)
-
-                if neighbor in closed_set:
+            if key == goal_key:
+                self.last_expanded = iterations
+                return self._reconstruct_path(parent, key, z)
+
+            x = key & _COORD_MASK
+            y = key >> 16
+            lx = x & CHUNK_MASK
+            ly = y & CHUNK_MASK
+            if 0 < lx < CHUNK_MASK and 0 < ly < CHUNK_MASK:
+                # Longe da borda do chunk: os 8 vizinhos estao no mesmo chunk
+                chunk = chunks.get(((y >> 8) << 8) | (x >> 8), _EMPTY_CHUNK)
+                base = (ly << 8) | lx
+                neighbor_flags = [chunk[base + offset] for offset in _OFFSETS]
+            else:
+                neighbor_flags = [self._edge_flags(chunks, x + dx, y + dy) for dx, dy, _ in MOVES]
+            for (dx, dy, cost, delta), flags in zip(_STEPS, neighbor_flags):
+                if flags & reject or (flags & required) != required:
                     continue
-
-                dx = abs(neighbor_pos.x - current.position.x)
-                dy = abs(neighbor_pos.y - current.position.y)
-                is_diagonal = dx == 1 and dy == 1
-
-                neighbor.g = current.g + (14 if is_diagonal else 10)
-                neighbor.h = self.heuristic(neighbor_pos, goal) * 10
-                neighbor.f = neighbor.g + neighbor.h
-
-                should_add = True
-                for open_node in open_list:
-                    if open_node == neighbor and open_node.g <= neighbor.g:
-                        should_add = False
-                        break
-
-                if should_add:
-                    heapq.heappush(open_list, neighbor)
-
+                nkey = key + delta
+                ng = g + cost + (flags >> COST_SHIFT) * STRAIGHT_COST
+                old = best_g.get(nkey)
+                if old is not None and old <= ng:
+                    continue
+                best_g[nkey] = ng
+                parent[nkey] = key
+                # octile() em linha (chamada de funcao custa caro aqui)
+                nx = x + dx
+                ny = y + dy
+                hx = nx - gx if nx > gx else gx - nx
+                hy = ny - gy if ny > gy else gy - ny
+                nh = 10 * hx + 4 * hy if hx > hy else 10 * hy + 4 * hx
+                heappush(open_heap, (ng + nh, nh, ng, nkey))
+
+        self.last_expanded = iterations
         return None
 
-    def _reconstruct_path(self, node: Node) -> List[Position]:
+    def floor_chunks(self, z: int) -> Dict[int, bytearray]:
+        """
+        Chunks do andar para a busca (mesmo formato de TileGrid.floor_chunks).
+
+        Em modo restrito: so os chunks da area permitida, com WALKABLE vindo
+        da area e BLOCKED/custo vindos da grade. Fica em cache ate a grade
+        ou a area mudarem.
+        """
+        if self._allowed is None:
+            return self.grid.floor_chunks(z)
+        version = (self.grid.version, self._allowed.version)
+        cached = self._merged.get(z)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        known = self.grid.floor_chunks(z)
+        merged = {}
+        for key, allowed in self._allowed.floor_chunks(z).items():
+            chunk = known.get(key)
+            if chunk is None:
+                merged[key] = bytes(allowed)
+            else:
+                flags = np.frombuffer(chunk[:], dtype=np.uint8) & (0xFF ^ WALKABLE)
+                merged[key] = (flags | np.frombuffer(allowed, dtype=np.uint8)).tobytes()
+        self._merged[z] = (version, merged)
+        return merged
+
+    @staticmethod
+    def _edge_flags(chunks: Dict[int, bytearray], x: int, y: int) -> int:
+        """Flags de um vizinho em outro chunk; fora do mapa conta como bloqueado."""
+        if x < 0 or y < 0 or x > _COORD_MASK or y > _COORD_MASK:
+            return BLOCKED
+        chunk = chunks.get(((y >> 8) << 8) | (x >> 8))
+        return chunk[((y & CHUNK_MASK) << 8) | (x & CHUNK_MASK)] if chunk is not None else 0
+
+    def _reconstruct_path(self, parent: Dict[int, int], key: int, z: int) -> List[Position]:
         """Reconstroi caminho do objetivo ate o inicio."""
         path = []
-        current = node
-        while current is not None:
-            path.append(current.position)
-            current = current.parent
-        return list(reversed(path))
+        while key != -1:
+            path.append(Position(key & _COORD_MASK, key >> 16, z))
+            key = parent[key]
+        path.reverse()
+        return path
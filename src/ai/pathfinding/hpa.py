@@ -0,0 +1,476 @@
+"""
+HPA* - pathfinding hierarquico sobre a TileGrid.
+
+Rotas longas (depot -> hunt, travessia de cidade) estouravam o limite do
+A* tile a tile. O HierarchicalMap divide cada andar em clusters de
+`cluster_size` x `cluster_size` tiles (32 por padrao; 8x8 clusters por
+chunk) e monta um grafo abstrato:
+
+  - entradas: em cada borda entre dois clusters vizinhos (N/S/L/O), cada
+    trecho continuo de tiles livres dos dois lados vira 1 entrada (trecho
+    < 6 tiles, no meio) ou 2 (nas pontas). Cada entrada e um par de tiles
+    ligados por um passo reto (custo 10).
+  - arestas internas: custo entre as entradas do mesmo cluster. Cluster
+    sem tile bloqueado usa a distancia octile e caminho em linha; nos
+    demais as distancias de todas as entradas ate todos os tiles sao
+    propagadas de uma vez em numpy e ficam em cache: refinar um trecho e
+    so descer o gradiente, sem nova busca.
+
+A consulta liga start/goal as entradas dos seus clusters, roda A* no
+grafo abstrato (limitado ao retangulo de start/goal + `margin` clusters,
+como o JPS, ja que tile desconhecido e caminhavel) e refina so os
+primeiros `max_clusters` trechos (o resto da rota e refinado nas proximas
+chamadas, quando o bot chegar la).
+
+Clusters sao construidos sob demanda, quando a busca abstrata chega neles,
+e invalidados pela TileGrid (add_listener): um tile alterado descarta so o
+seu cluster e, se estiver na borda, o vizinho daquela borda. A proxima
+consulta reconstroi apenas esses.
+
+Como o JPS, usa custo uniforme (10/14): o custo extra dos tiles e
+ignorado. O caminho e quase otimo (passa pelas entradas). So ha free-walk:
+com area restrita (AStar.set_walkable) o Pathfinder usa a busca local.
+"""
+from heapq import heappop, heappush
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.value_objects.position import Position
+from .astar import DIAGONAL_COST, STRAIGHT_COST, octile, pack
+from .tile_grid import BLOCKED, CHUNK_SIZE, TileGrid
+
+DEFAULT_CLUSTER_SIZE = 32
+# Trechos de borda a partir deste tamanho ganham duas entradas
+_MIN_DOUBLE_ENTRANCE = 6
+
+_MASK_FREEWALK = bytes(1 if b & BLOCKED else 0 for b in range(256))
+
+_GOAL = -1  # no sentinela do objetivo no grafo abstrato
+# Custo "infinito" das distancias locais (uint16: 2 * _INF ainda cabe, e
+# nenhum caminho dentro de um cluster 32x32 chega perto disso)
+_INF = 30000
+
+ClusterId = Tuple[int, int, int]
+
+
+class _Cluster:
+    """Entradas, arestas internas e caminhos em cache de um cluster."""
+
+    __slots__ = ("x0", "y0", "mask", "free", "nodes", "edges", "twins", "layer", "dist")
+
+    def __init__(self, x0: int, y0: int, mask: bytes):
+        self.x0 = x0
+        self.y0 = y0
+        self.mask = mask
+        self.free = 1 not in mask
+        self.nodes: List[int] = []
+        self.edges: Dict[int, List[Tuple[int, int]]] = {}
+        self.twins: Dict[int, List[int]] = {}
+        # entrada -> camada de `dist` (custo dela ate cada tile do cluster)
+        self.layer: Dict[int, int] = {}
+        self.dist: Optional[np.ndarray] = None
+
+
+class HierarchicalMap:
+    """Grafo abstrato de clusters/entradas sobre uma TileGrid (HPA*)."""
+
+    def __init__(
+        self,
+        grid: TileGrid,
+        cluster_size: int = DEFAULT_CLUSTER_SIZE,
+        margin: int = 4,
+    ):
+        if CHUNK_SIZE % cluster_size or cluster_size > 64:
+            raise ValueError(f"cluster_size deve dividir {CHUNK_SIZE} e ser <= 64: {cluster_size}")
+        self.grid = grid
+        self.size = cluster_size
+        self.margin = margin  # clusters alem do retangulo start/goal
+        self._clusters: Dict[ClusterId, _Cluster] = {}
+        self._masks: Dict[ClusterId, bytes] = {}
+        self._neighbors = _local_neighbors(cluster_size)
+        self._steps: Dict[bytes, list] = {}  # mascara -> passos do _distances
+        self.builds = 0
+        self.last_expanded = 0
+        grid.add_listener(self._on_change)
+
+    @property
+    def cluster_count(self) -> int:
+        return len(self._clusters)
+
+    def clear(self) -> None:
+        self._clusters.clear()
+        self._masks.clear()
+
+    # ------------------------------------------------------------------
+    # Invalidacao incremental
+    # ------------------------------------------------------------------
+
+    def _on_change(self, key: Optional[int], index: Optional[int]) -> None:
+        if key is None:
+            self.clear()
+            return
+        S = self.size
+        z = key >> 16
+        base_x = (key & 0xFF) * CHUNK_SIZE
+        base_y = ((key >> 8) & 0xFF) * CHUNK_SIZE
+        if index is None:
+            per_chunk = CHUNK_SIZE // S
+            cx0, cy0 = base_x // S, base_y // S
+            for cy in range(cy0 - 1, cy0 + per_chunk + 1):
+                for cx in range(cx0 - 1, cx0 + per_chunk + 1):
+                    self._drop((cx, cy, z))
+            return
+        x = base_x + (index & 0xFF)
+        y = base_y + (index >> 8)
+        cx, cy = x // S, y // S
+        self._drop((cx, cy, z))
+        # Tile de borda muda as entradas compartilhadas com o vizinho
+        lx, ly = x - cx * S, y - cy * S
+        if lx == 0:
+            self._drop((cx - 1, cy, z))
+        elif lx == S - 1:
+            self._drop((cx + 1, cy, z))
+        if ly == 0:
+            self._drop((cx, cy - 1, z))
+        elif ly == S - 1:
+            self._drop((cx, cy + 1, z))
+
+    def _drop(self, cid: ClusterId) -> None:
+        self._clusters.pop(cid, None)
+        self._masks.pop(cid, None)
+
+    # ------------------------------------------------------------------
+    # Construcao de clusters
+    # ------------------------------------------------------------------
+
+    def _mask(self, cid: ClusterId) -> bytes:
+        """S*S bytes do cluster, 1 = nao caminhavel."""
+        mask = self._masks.get(cid)
+        if mask is not None:
+            return mask
+        S = self.size
+        cx, cy, z = cid
+        x0, y0 = cx * S, cy * S
+        if x0 < 0 or y0 < 0 or x0 + S > 0x10000 or y0 + S > 0x10000:
+            mask = b"\x01" * (S * S)
+        else:
+            table = _MASK_FREEWALK
+            chunk = self.grid.chunk(x0 // CHUNK_SIZE, y0 // CHUNK_SIZE, z)
+            if chunk is None:
+                mask = bytes([table[0]]) * (S * S)
+            else:
+                lx, ly = x0 % CHUNK_SIZE, y0 % CHUNK_SIZE
+                mask = b"".join(
+                    chunk[(row * CHUNK_SIZE) + lx:(row * CHUNK_SIZE) + lx + S]
+                    for row in range(ly, ly + S)
+                ).translate(table)
+        self._masks[cid] = mask
+        return mask
+
+    def _cluster(self, cid: ClusterId) -> _Cluster:
+        cluster = self._clusters.get(cid)
+        if cluster is None:
+            cluster = self._clusters[cid] = self._build(cid)
+        return cluster
+
+    def _build(self, cid: ClusterId) -> _Cluster:
+        self.builds += 1
+        S = self.size
+        cx, cy, z = cid
+        mask = self._mask(cid)
+        cluster = _Cluster(cx * S, cy * S, mask)
+        x0, y0 = cluster.x0, cluster.y0
+        last = S - 1
+
+        # (vizinho, borda deste cluster, borda do vizinho, tile(i), passo ate o gemeo)
+        sides = (
+            ((cx, cy - 1, z), mask[0:S], lambda m: m[last * S:], lambda i: (x0 + i, y0), (0, -1)),
+            ((cx, cy + 1, z), mask[last * S:], lambda m: m[0:S], lambda i: (x0 + i, y0 + last), (0, 1)),
+            ((cx - 1, cy, z), mask[0::S], lambda m: m[last::S], lambda i: (x0, y0 + i), (-1, 0)),
+            ((cx + 1, cy, z), mask[last::S], lambda m: m[0::S], lambda i: (x0 + last, y0 + i), (1, 0)),
+        )
+        for neighbor, mine, theirs, tile, (dx, dy) in sides:
+            for i in _entrances(mine, theirs(self._mask(neighbor))):
+                x, y = tile(i)
+                node = pack(x, y)
+                if node not in cluster.twins:
+                    cluster.twins[node] = []
+                    cluster.nodes.append(node)
+                cluster.twins[node].append(pack(x + dx, y + dy))
+
+        nodes = cluster.nodes
+        if cluster.free:
+            for a in nodes:
+                ax, ay = a & 0xFFFF, a >> 16
+                cluster.edges[a] = [
+                    (b, octile(abs(ax - (b & 0xFFFF)), abs(ay - (b >> 16))))
+                    for b in nodes if b != a
+                ]
+        elif nodes:
+            locals_ = [self._local(cluster, n) for n in nodes]
+            cluster.dist = self._distances(mask, locals_)
+            flat = cluster.dist.reshape(len(nodes), -1)
+            for k, a in enumerate(nodes):
+                cluster.layer[a] = k
+                row = flat[k, locals_].tolist()
+                cluster.edges[a] = [
+                    (b, cost) for b, cost in zip(nodes, row) if b != a and cost < _INF
+                ]
+        return cluster
+
+    def _local(self, cluster: _Cluster, key: int) -> int:
+        return ((key >> 16) - cluster.y0) * self.size + ((key & 0xFFFF) - cluster.x0)
+
+    def _distances(self, mask: bytes, sources: List[int]) -> np.ndarray:
+        """
+        Custo de cada origem ate todos os tiles do cluster (E x S x S).
+
+        Relaxa as 8 direcoes em numpy, para todas as origens de uma vez,
+        ate estabilizar - bem mais barato que um Dijkstra em Python por
+        entrada. Tile bloqueado/inalcancavel fica com _INF.
+        """
+        S = self.size
+        steps = self._steps.get(mask)
+        if steps is None:
+            blocked = np.frombuffer(mask, dtype=np.uint8).reshape(S, S).astype(bool)
+            steps = []
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    if not (dx or dy):
+                        continue
+                    dst = (slice(max(dy, 0), S + min(dy, 0)), slice(max(dx, 0), S + min(dx, 0)))
+                    src = (slice(max(-dy, 0), S + min(-dy, 0)), slice(max(-dx, 0), S + min(-dx, 0)))
+                    cost = DIAGONAL_COST if dx and dy else STRAIGHT_COST
+                    # Entrar num tile bloqueado custa _INF: ele nunca propaga
+                    steps.append((dst, src, np.where(blocked[dst], _INF, cost).astype(np.uint16)))
+            self._steps = {mask: steps}
+        dist = np.full((len(sources), S, S), _INF, dtype=np.uint16)
+        for k, i in enumerate(sources):
+            dist[k, i // S, i % S] = 0
+        while True:
+            before = dist.copy()
+            for (dy, dx), (sy, sx), cost in steps:
+                np.minimum(dist[:, dy, dx], dist[:, sy, sx] + cost, out=dist[:, dy, dx])
+            np.minimum(dist, _INF, out=dist)
+            if np.array_equal(dist, before):
+                return dist
+
+    # ------------------------------------------------------------------
+    # Consulta
+    # ------------------------------------------------------------------
+
+    def _cluster_id(self, key: int, z: int) -> ClusterId:
+        return ((key & 0xFFFF) // self.size, (key >> 16) // self.size, z)
+
+    def _links(self, cluster: _Cluster, key: int) -> Tuple[Dict[int, int], Optional[np.ndarray]]:
+        """Custo de `key` ate cada entrada do seu cluster (+ distancias a partir de key)."""
+        if cluster.free:
+            x, y = key & 0xFFFF, key >> 16
+            return {
+                n: octile(abs(x - (n & 0xFFFF)), abs(y - (n >> 16))) for n in cluster.nodes
+            }, None
+        dist = self._distances(cluster.mask, [self._local(cluster, key)])[0].reshape(-1)
+        links = {}
+        for n in cluster.nodes:
+            cost = int(dist[self._local(cluster, n)])
+            if cost < _INF:
+                links[n] = cost
+        return links, dist
+
+    def find_path(
+        self,
+        start: Position,
+        goal: Position,
+        max_clusters: Optional[int] = None,
+        max_iterations: int = 100_000,
+    ) -> Optional[List[Position]]:
+        """
+        Caminho de start ate goal pelo grafo abstrato.
+
+        Args:
+            max_clusters: refina so ate entrar no N-esimo cluster seguinte
+                (None = caminho completo ate goal).
+
+        Returns:
+            Tiles adjacentes a partir de start, ou None se nao houver rota
+            abstrata (inclusive start e goal no mesmo cluster: use a busca
+            local).
+        """
+        self.last_expanded = 0
+        if start.z != goal.z:
+            return None
+        z = start.z
+        start_key, goal_key = pack(start.x, start.y), pack(goal.x, goal.y)
+        start_id, goal_id = self._cluster_id(start_key, z), self._cluster_id(goal_key, z)
+        if start_id == goal_id:
+            return None
+        start_cluster = self._cluster(start_id)
+        goal_cluster = self._cluster(goal_id)
+        if start_cluster.mask[self._local(start_cluster, start_key)]:
+            return None
+        if goal_cluster.mask[self._local(goal_cluster, goal_key)]:
+            return None
+
+        start_links, start_dist = self._links(start_cluster, start_key)
+        goal_links, goal_dist = self._links(goal_cluster, goal_key)
+        if not start_links or not goal_links:
+            return None
+
+        gx, gy = goal.x, goal.y
+        margin = self.margin
+        min_cx = min(start_id[0], goal_id[0]) - margin
+        max_cx = max(start_id[0], goal_id[0]) + margin
+        min_cy = min(start_id[1], goal_id[1]) - margin
+        max_cy = max(start_id[1], goal_id[1]) + margin
+        S = self.size
+        best_g: Dict[int, int] = {}
+        came_from: Dict[int, int] = {}
+        heap = []
+        for node, cost in start_links.items():
+            best_g[node] = cost
+            came_from[node] = start_key
+            h = octile(abs((node & 0xFFFF) - gx), abs((node >> 16) - gy))
+            heappush(heap, (cost + h, cost, node))
+
+        iterations = 0
+        found = False
+        while heap and iterations < max_iterations:
+            _, g, node = heappop(heap)
+            if node == _GOAL:
+                if g == best_g[_GOAL]:
+                    found = True
+                    break
+                continue
+            if g != best_g[node]:
+                continue
+            iterations += 1
+            cid = self._cluster_id(node, z)
+            cluster = self._cluster(cid)
+            candidates = list(cluster.edges.get(node, ()))
+            candidates.extend(
+                (twin, STRAIGHT_COST) for twin in cluster.twins.get(node, ())
+                if min_cx <= (twin & 0xFFFF) // S <= max_cx and min_cy <= (twin >> 16) // S <= max_cy
+            )
+            if cid == goal_id and node in goal_links:
+                candidates.append((_GOAL, goal_links[node]))
+            for other, cost in candidates:
+                ng = g + cost
+                known = best_g.get(other)
+                if known is not None and ng >= known:
+                    continue
+                best_g[other] = ng
+                came_from[other] = node
+                h = 0 if other == _GOAL else octile(abs((other & 0xFFFF) - gx), abs((other >> 16) - gy))
+                heappush(heap, (ng + h, ng, other))
+
+        self.last_expanded = iterations
+        if not found:
+            return None
+
+        route = [goal_key]
+        node = came_from[_GOAL]
+        while node != start_key:
+            route.append(node)
+            node = came_from[node]
+        route.append(start_key)
+        route.reverse()
+        return self._refine(route, z, start_dist, goal_dist, max_clusters)
+
+    # ------------------------------------------------------------------
+    # Refinamento
+    # ------------------------------------------------------------------
+
+    def _refine(
+        self,
+        route: List[int],
+        z: int,
+        start_dist: Optional[np.ndarray],
+        goal_dist: Optional[np.ndarray],
+        max_clusters: Optional[int],
+    ) -> List[Position]:
+        path = [route[0]]
+        crossings = 0
+        last = len(route) - 1
+        for step, (a, b) in enumerate(zip(route, route[1:])):
+            cid = self._cluster_id(a, z)
+            if cid != self._cluster_id(b, z):
+                path.append(b)  # passo entre entradas gemeas
+                crossings += 1
+                if max_clusters is not None and crossings >= max_clusters:
+                    break
+                continue
+            cluster = self._cluster(cid)
+            if cluster.free:
+                path.extend(_line(a, b))
+            elif step + 1 == last:
+                # entrada -> goal: desce as distancias a partir do goal
+                path.extend(self._descend(cluster, goal_dist, a)[1:])
+            else:
+                dist = start_dist if step == 0 else cluster.dist[cluster.layer[a]].reshape(-1)
+                path.extend(reversed(self._descend(cluster, dist, b)[:-1]))
+        return [Position(key & 0xFFFF, key >> 16, z) for key in path]
+
+    def _descend(self, cluster: _Cluster, dist: np.ndarray, key: int) -> List[int]:
+        """De `key` ate a origem de `dist` (inclusive), sempre por um vizinho otimo."""
+        S = self.size
+        neighbors = self._neighbors
+        values = dist.tolist()
+        i = self._local(cluster, key)
+        keys = [key]
+        while values[i]:
+            d = values[i]
+            i = next(j for j, cost in neighbors[i] if values[j] + cost == d)
+            keys.append(pack(cluster.x0 + i % S, cluster.y0 + i // S))
+        return keys
+
+
+def _entrances(mine: bytes, theirs: bytes) -> List[int]:
+    """Indices das entradas ao longo de uma borda (0 = livre dos dois lados)."""
+    result = []
+    size = len(mine)
+    i = 0
+    while i < size:
+        if mine[i] or theirs[i]:
+            i += 1
+            continue
+        j = i
+        while j < size and not mine[j] and not theirs[j]:
+            j += 1
+        if j - i < _MIN_DOUBLE_ENTRANCE:
+            result.append(i + (j - i) // 2)
+        else:
+            result.extend((i, j - 1))
+        i = j
+    return result
+
+
+def _line(a: int, b: int) -> List[int]:
+    """Tiles de a (exclusivo) ate b em diagonal e depois reto."""
+    x, y = a & 0xFFFF, a >> 16
+    bx, by = b & 0xFFFF, b >> 16
+    keys = []
+    while x != bx or y != by:
+        x += (bx > x) - (bx < x)
+        y += (by > y) - (by < y)
+        keys.append(pack(x, y))
+    return keys
+
+
+_NEIGHBOR_CACHE: Dict[int, List[Tuple[Tuple[int, int], ...]]] = {}
+
+
+def _local_neighbors(size: int) -> List[Tuple[Tuple[int, int], ...]]:
+    """Vizinhos (indice, custo) de cada indice local de um cluster size x size."""
+    cached = _NEIGHBOR_CACHE.get(size)
+    if cached is None:
+        cached = []
+        for i in range(size * size):
+            x, y = i % size, i // size
+            cached.append(tuple(
+                ((y + dy) * size + x + dx, DIAGONAL_COST if dx and dy else STRAIGHT_COST)
+                for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                if (dx or dy) and 0 <= x + dx < size and 0 <= y + dy < size
+            ))
+        _NEIGHBOR_CACHE[size] = cached
+    return cached
@@ -0,0 +1,322 @@
+"""
+Jump Point Search (JPS) sobre a TileGrid.
+
+O chao do Tibia e uma grade uniforme de 8 direcoes; em chao aberto o A*
+expande muitos tiles simetricos (todos os caminhos de mesmo custo). O JPS
+so poe no heap os "jump points": tiles onde a direcao de movimento pode
+mudar por causa de um obstaculo (vizinho forcado) ou o objetivo.
+
+Regras de canto (Tibia 8.60): o passo diagonal e permitido mesmo com os
+dois tiles ortogonais bloqueados, entao valem as regras de vizinho
+forcado do JPS original (Harabor & Grastien, com corte de canto):
+  - reto (dx, 0) em (x, y): (x, y±1) bloqueado e (x+dx, y±1) livre
+  - diagonal (dx, dy) em (x, y): (x-dx, y) bloqueado e (x-dx, y+dy) livre,
+    ou (x, y-dy) bloqueado e (x+dx, y-dy) livre
+
+As varreduras retas nao andam tile a tile: cada linha (ou coluna) de um
+chunk vira uma mascara de 256 bytes (1 = nao caminhavel) e bytes.find
+acha, em C, o proximo bloqueio e o proximo padrao de vizinho forcado
+("\\x01\\x00" na linha ao lado). Mascaras ficam em cache durante a busca.
+
+Diferencas para o AStar:
+  - o custo extra dos tiles (bits 4-7 da grade) e ignorado: o JPS so e
+    correto em grade de custo uniforme
+  - tiles desconhecidos sao livres (free-walk), entao a busca fica
+    limitada ao retangulo start/goal + `margin` tiles; fora dele conta
+    como bloqueado
+"""
+from heapq import heappop, heappush
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.core.value_objects.position import Position
+from .astar import DIAGONAL_COST, STRAIGHT_COST, octile
+from .tile_grid import BLOCKED, CHUNK_MASK, CHUNK_SIZE, WALKABLE, TileGrid
+
+DEFAULT_MARGIN = 32
+
+_ALL_DIRECTIONS = ((0, -1), (0, 1), (1, 0), (-1, 0), (1, -1), (-1, -1), (1, 1), (-1, 1))
+_FREE_ROW = bytes(CHUNK_SIZE)
+_BLOCKED_ROW = b"\x01" * CHUNK_SIZE
+
+# flags -> 1 se nao caminhavel
+_MASK_FREEWALK = bytes(1 if b & BLOCKED else 0 for b in range(256))
+_MASK_RESTRICTED = bytes(1 if b & BLOCKED or not b & WALKABLE else 0 for b in range(256))
+
+
+class _Masks:
+    """Mascaras de bloqueio por linha/coluna de chunk, com o retangulo da busca."""
+
+    def __init__(self, chunks: Dict[int, bytearray], restricted: bool, bounds: Tuple[int, int, int, int]):
+        self._chunks = chunks
+        self._table = _MASK_RESTRICTED if restricted else _MASK_FREEWALK
+        self._empty = _BLOCKED_ROW if restricted else _FREE_ROW
+        self.x0, self.y0, self.x1, self.y1 = bounds
+        self._rows: Dict[Tuple[int, int], bytes] = {}
+        self._cols: Dict[Tuple[int, int], bytes] = {}
+
+    def row(self, y: int, cx: int) -> bytes:
+        """Linha y do chunk-coluna cx (x = cx*256 .. cx*256+255)."""
+        key = (y, cx)
+        mask = self._rows.get(key)
+        if mask is None:
+            mask = self._rows[key] = self._line(
+                y, cx, self.y0, self.y1, self.x0, self.x1,
+                lambda chunk, ly: chunk[ly << 8:(ly << 8) + CHUNK_SIZE],
+                lambda cy, cx_: ((cy << 8) | cx_),
+            )
+        return mask
+
+    def col(self, x: int, cy: int) -> bytes:
+        """Coluna x do chunk-linha cy (y = cy*256 .. cy*256+255)."""
+        key = (x, cy)
+        mask = self._cols.get(key)
+        if mask is None:
+            mask = self._cols[key] = self._line(
+                x, cy, self.x0, self.x1, self.y0, self.y1,
+                lambda chunk, lx: chunk[lx::CHUNK_SIZE],
+                lambda cx, cy_: ((cy_ << 8) | cx),
+            )
+        return mask
+
+    def _line(
+        self,
+        fixed: int,
+        c: int,
+        fixed_lo: int,
+        fixed_hi: int,
+        lo: int,
+        hi: int,
+        extract: Callable,
+        chunk_index: Callable[[int, int], int],
+    ) -> bytes:
+        if fixed < fixed_lo or fixed > fixed_hi:
+            return _BLOCKED_ROW
+        chunk = self._chunks.get(chunk_index(fixed >> 8, c))
+        if chunk is None:
+            mask = self._empty
+        else:
+            mask = extract(chunk, fixed & CHUNK_MASK).translate(self._table)
+        # Fora do retangulo da busca = bloqueado
+        base = c << 8
+        start = max(0, lo - base)
+        end = min(CHUNK_SIZE, hi - base + 1)
+        if start >= end:
+            return _BLOCKED_ROW
+        if start > 0 or end < CHUNK_SIZE:
+            mask = _BLOCKED_ROW[:start] + mask[start:end] + _BLOCKED_ROW[end:]
+        return mask
+
+    def blocked(self, x: int, y: int) -> bool:
+        return self.row(y, x >> 8)[x & CHUNK_MASK] == 1
+
+
+def _scan(
+    line: Callable[[int, int], bytes],
+    fixed: int,
+    pos: int,
+    d: int,
+    goal: Optional[int],
+) -> Optional[int]:
+    """
+    Varredura reta a partir de `pos` (exclusivo) na direcao d (+1/-1) ao
+    longo de uma linha (row ou col). line(fixed, c) devolve a mascara do
+    trecho c da linha `fixed`. Retorna a coordenada do jump point (vizinho
+    forcado ou goal) ou None se bater em bloqueio antes.
+    """
+    while True:
+        nxt = pos + d
+        c = nxt >> 8
+        base = c << 8
+        start = nxt & CHUNK_MASK
+        here = line(fixed, c)
+        before = line(fixed - 1, c)
+        after = line(fixed + 1, c)
+        if d > 0:
+            hit = here.find(1, start)
+            hit = CHUNK_SIZE if hit < 0 else hit
+            forced = CHUNK_SIZE
+            for side, fx in ((before, fixed - 1), (after, fixed + 1)):
+                i = side.find(b"\x01\x00", start)
+                if i < 0 and side[CHUNK_MASK] == 1 and line(fx, c + 1)[0] == 0:
+                    i = CHUNK_MASK  # padrao cruza a borda do chunk
+                if 0 <= i < forced:
+                    forced = i
+            if goal is not None and base + start <= goal < base + CHUNK_SIZE:
+                target = goal - base
+                if target < hit and target <= forced:
+                    return goal
+            if hit <= forced:
+                if hit < CHUNK_SIZE:
+                    return None
+            else:
+                return base + forced
+            pos = base + CHUNK_MASK
+        else:
+            hit = here.rfind(1, 0, start + 1)
+            forced = -1
+            for side, fx in ((before, fixed - 1), (after, fixed + 1)):
+                i = side.rfind(b"\x00\x01", 0, start + 1)
+                i = i + 1 if i >= 0 else -1
+                if i < 0 and side[0] == 1 and line(fx, c - 1)[CHUNK_MASK] == 0:
+                    i = 0  # padrao cruza a borda do chunk
+                if i > forced:
+                    forced = i
+            if goal is not None and base <= goal <= base + start:
+                target = goal - base
+                if target > hit and target >= forced:
+                    return goal
+            if hit >= forced:
+                if hit >= 0:
+                    return None
+            else:
+                return base + forced
+            pos = base
+
+
+class JumpPointSearch:
+    """Busca JPS em grade uniforme de 8 direcoes com corte de canto."""
+
+    def __init__(self, grid: Optional[TileGrid] = None, margin: int = DEFAULT_MARGIN):
+        self.grid = grid if grid is not None else TileGrid()
+        self.margin = margin
+        self.last_expanded = 0
+
+    def find_path(
+        self,
+        start: Position,
+        goal: Position,
+        restricted: bool = False,
+        max_iterations: int = 200_000,
+        chunks: Optional[Dict[int, bytearray]] = None,
+    ) -> Optional[List[Position]]:
+        """
+        Mesmo contrato do AStar.find_path: lista de tiles adjacentes de
+        start a goal (inclusive) ou None.
+
+        Args:
+            restricted: so tiles WALKABLE de `chunks` (AStar.restricted).
+            chunks: chunks do andar (AStar.floor_chunks, que monta a area
+                restrita); padrao: os da grade.
+        """
+        self.last_expanded = 0
+        if start.z != goal.z:
+            return None
+        if start == goal:
+            return [start]
+        margin = self.margin
+        bounds = (
+            max(0, min(start.x, goal.x) - margin),
+            max(0, min(start.y, goal.y) - margin),
+            min(0xFFFF, max(start.x, goal.x) + margin),
+            min(0xFFFF, max(start.y, goal.y) + margin),
+        )
+        if chunks is None:
+            chunks = self.grid.floor_chunks(start.z)
+        masks = _Masks(chunks, restricted, bounds)
+        if masks.blocked(goal.x, goal.y):
+            return None
+
+        row, col, blocked = masks.row, masks.col, masks.blocked
+        gx, gy = goal.x, goal.y
+
+        def jump_straight(x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+            if dy == 0:
+                nx = _scan(row, y, x, dx, gx if y == gy else None)
+                return None if nx is None else (nx, y)
+            ny = _scan(col, x, y, dy, gy if x == gx else None)
+            return None if ny is None else (x, ny)
+
+        def jump_diagonal(x: int, y: int, dx: int, dy: int) -> Optional[Tuple[int, int]]:
+            while True:
+                x += dx
+                y += dy
+                if blocked(x, y):
+                    return None
+                if x == gx and y == gy:
+                    return x, y
+                if (blocked(x - dx, y) and not blocked(x - dx, y + dy)) or (
+                    blocked(x, y - dy) and not blocked(x + dx, y - dy)
+                ):
+                    return x, y
+                if jump_straight(x, y, dx, 0) or jump_straight(x, y, 0, dy):
+                    return x, y
+
+        start_key = (start.x, start.y)
+        goal_key = (gx, gy)
+        h = octile(abs(start.x - gx), abs(start.y - gy))
+        open_heap = [(h, h, 0, start_key, 0, 0)]
+        best_g = {start_key: 0}
+        parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start_key: None}
+        iterations = 0
+
+        while open_heap and iterations < max_iterations:
+            _, _, g, node, pdx, pdy = heappop(open_heap)
+            if g != best_g[node]:
+                continue
+            iterations += 1
+            if node == goal_key:
+                self.last_expanded = iterations
+                return self._expand_path(parent, node, start.z)
+
+            x, y = node
+            for dx, dy in self._directions(blocked, x, y, pdx, pdy):
+                if dx and dy:
+                    point = jump_diagonal(x, y, dx, dy)
+                else:
+                    point = jump_straight(x, y, dx, dy)
+                if point is None:
+                    continue
+                px, py = point
+                steps = max(abs(px - x), abs(py - y))
+                ng = g + steps * (DIAGONAL_COST if dx and dy else STRAIGHT_COST)
+                old = best_g.get(point)
+                if old is not None and old <= ng:
+                    continue
+                best_g[point] = ng
+                parent[point] = node
+                nh = octile(abs(px - gx), abs(py - gy))
+                heappush(open_heap, (ng + nh, nh, ng, point, dx, dy))
+
+        self.last_expanded = iterations
+        return None
+
+    @staticmethod
+    def _directions(blocked, x: int, y: int, dx: int, dy: int):
+        """Direcoes a seguir do jump point (naturais + forcadas)."""
+        if not dx and not dy:
+            return _ALL_DIRECTIONS
+        if dx and dy:
+            dirs = [(dx, 0), (0, dy), (dx, dy)]
+            if blocked(x - dx, y):
+                dirs.append((-dx, dy))
+            if blocked(x, y - dy):
+                dirs.append((dx, -dy))
+            return dirs
+        dirs = [(dx, dy)]
+        if dx:
+            if blocked(x, y + 1):
+                dirs.append((dx, 1))
+            if blocked(x, y - 1):
+                dirs.append((dx, -1))
+        else:
+            if blocked(x + 1, y):
+                dirs.append((1, dy))
+            if blocked(x - 1, y):
+                dirs.append((-1, dy))
+        return dirs
+
+    @staticmethod
+    def _expand_path(parent, node, z: int) -> List[Position]:
+        """Jump points -> caminho tile a tile (trechos retos ou diagonais)."""
+        points = []
+        while node is not None:
+            points.append(node)
+            node = parent[node]
+        points.reverse()
+        path = [Position(points[0][0], points[0][1], z)]
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            sx = (bx > ax) - (bx < ax)
+            sy = (by > ay) - (by < ay)
+            for i in range(1, max(abs(bx - ax), abs(by - ay)) + 1):
+                path.append(Position(ax + sx * i, ay + sy * i, z))
+        return path
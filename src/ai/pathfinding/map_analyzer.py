@@ -1,30 +1,35 @@
 """
 Análise de mapa e terreno.
+
+As marcas ficam numa TileGrid (1 byte por tile); passe a mesma grade do
+Pathfinder para que o A* enxergue o que foi aprendido aqui.
 """
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 from src.core.value_objects.position import Position
+from .tile_grid import BLOCKED, CHUNK_MASK, WALKABLE, TileGrid
 
 
 class MapAnalyzer:
     """Analisa mapa para pathfinding."""
     
-    def __init__(self):
-        self.known_walkable: Set[Tuple[int, int, int]] = set()
-        self.known_blocked: Set[Tuple[int, int, int]] = set()
+    def __init__(self, grid: Optional[TileGrid] = None):
+        self.grid = grid if grid is not None else TileGrid()
+
+    @property
+    def known_walkable(self) -> Set[Tuple[int, int, int]]:
+        return set(self.grid.tiles(WALKABLE))
+
+    @property
+    def known_blocked(self) -> Set[Tuple[int, int, int]]:
+        return set(self.grid.tiles(BLOCKED))
     
     def mark_walkable(self, position: Position):
         """Marca posição como caminhável."""
-        pos_tuple = (position.x, position.y, position.z)
-        self.known_walkable.add(pos_tuple)
-        if pos_tuple in self.known_blocked:
-            self.known_blocked.remove(pos_tuple)
+        self.grid.mark_walkable(position.x, position.y, position.z)
     
     def mark_blocked(self, position: Position):
         """Marca posição como bloqueada."""
-        pos_tuple = (position.x, position.y, position.z)
-        self.known_blocked.add(pos_tuple)
-        if pos_tuple in self.known_walkable:
-            self.known_walkable.remove(pos_tuple)
+        self.grid.mark_blocked(position.x, position.y, position.z)
     
     def is_area_safe(
         self,
@@ -43,31 +48,32 @@ class MapAnalyzer:
         Returns:
             True se área é segura
         """
-        total_tiles = 0
-        walkable_tiles = 0
-        
-        for dx in range(-radius, radius + 1):
-            for dy in range(-radius, radius + 1):
-                pos = Position(center.x + dx, center.y + dy, center.z)
-                pos_tuple = (pos.x, pos.y, pos.z)
-                
-                total_tiles += 1
-                
-                if pos_tuple in self.known_walkable:
-                    walkable_tiles += 1
-                elif pos_tuple in self.known_blocked:
-                    pass  # Bloqueado, não conta como walkable
-                else:
-                    # Desconhecido, assume walkable por padrão
-                    walkable_tiles += 1
-        
-        walkable_pct = walkable_tiles / total_tiles if total_tiles > 0 else 0
+        side = 2 * radius + 1
+        total_tiles = side * side
+        blocked_tiles = 0
+
+        # Desconhecido conta como walkable; so os bloqueados sao contados,
+        # linha a linha direto do chunk.
+        z = center.z
+        for y in range(center.y - radius, center.y + radius + 1):
+            x = center.x - radius
+            while x <= center.x + radius:
+                chunk_end = min(center.x + radius, x | CHUNK_MASK)
+                chunk = self.grid.chunk(x >> 8, y >> 8, z) if x >= 0 and y >= 0 else None
+                if chunk is not None:
+                    row = (y & CHUNK_MASK) << 8
+                    for value in chunk[row + (x & CHUNK_MASK):row + (chunk_end & CHUNK_MASK) + 1]:
+                        if value & BLOCKED:
+                            blocked_tiles += 1
+                x = chunk_end + 1
+
+        walkable_pct = (total_tiles - blocked_tiles) / total_tiles if total_tiles > 0 else 0
         return walkable_pct >= min_walkable_pct
     
     def get_walkable_positions(self) -> List[Position]:
         """Retorna todas as posições caminháveis conhecidas."""
-        return [Position(x, y, z) for x, y, z in self.known_walkable]
+        return [Position(x, y, z) for x, y, z in self.grid.tiles(WALKABLE)]
     
     def get_blocked_positions(self) -> List[Position]:
         """Retorna todas as posições bloqueadas conhecidas."""
-        return [Position(x, y, z) for x, y, z in self.known_blocked]
+        return [Position(x, y, z) for x, y, z in self.grid.tiles(BLOCKED)]
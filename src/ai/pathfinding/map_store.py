@@ -0,0 +1,171 @@
+"""
+MapStore - TileGrid persistente em arquivos de chunk mapeados em memoria.
+
+Tudo que o bot aprende do mapa (tiles pisados, tiles que travaram o
+cavebot, marcas do MapAnalyzer) fica em data/map/, um arquivo por chunk:
+
+    data/map/<cx>_<cy>_<z>.chunk     65536 bytes (256x256 tiles, 1 byte cada)
+
+O formato do byte e o da TileGrid (flags WALKABLE/BLOCKED + custo). Cada
+arquivo e aberto com mmap (MAP_SHARED) so quando o chunk e consultado:
+  - get/set de um tile mapeiam o arquivo do chunk dele
+  - floor_chunks(z) (A*) mapeia os arquivos existentes do andar
+O SO pagina o conteudo sob demanda e grava as paginas alteradas de volta;
+flush() forca a gravacao so dos chunks sujos. Varios bots no mesmo host
+abrindo o mesmo diretorio enxergam as marcas uns dos outros na hora.
+
+Escritas de outros processos nao incrementam `version`: o cache de
+caminhos do Pathfinder so e invalidado pelas alteracoes locais.
+"""
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Set, Union
+
+from src.infrastructure.logging.logger import get_logger
+from .tile_grid import CHUNK_TILES, TileGrid
+
+DEFAULT_MAP_DIR = Path(__file__).resolve().parents[3] / "data" / "map"
+CHUNK_SUFFIX = ".chunk"
+
+# Intervalo minimo entre flushes automaticos (maybe_flush)
+DEFAULT_FLUSH_INTERVAL = 5.0
+
+
+def chunk_filename(cx: int, cy: int, z: int) -> str:
+    return f"{cx}_{cy}_{z}{CHUNK_SUFFIX}"
+
+
+class MapStore(TileGrid):
+    """TileGrid cujos chunks sao arquivos mmap compartilhados em disco."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path] = DEFAULT_MAP_DIR,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self._log = get_logger("MapStore")
+        self._lock = threading.Lock()
+        self._dirty: Set[int] = set()
+        self._absent: Set[int] = set()        # chunks sem arquivo (cache)
+        self._scanned_floors: Set[Optional[int]] = set()
+        self._last_flush = 0.0
+
+    # ------------------------------------------------------------------
+    # Paginacao
+    # ------------------------------------------------------------------
+
+    def _path(self, key: int) -> Path:
+        return self.directory / chunk_filename(key & 0xFF, (key >> 8) & 0xFF, key >> 16)
+
+    def _load_chunk(self, key: int) -> Optional[mmap.mmap]:
+        if key in self._absent:
+            return None
+        return self._map(key, create=False)
+
+    def _new_chunk(self, key: int) -> mmap.mmap:
+        return self._map(key, create=True)
+
+    def _map(self, key: int, create: bool) -> Optional[mmap.mmap]:
+        with self._lock:
+            chunk = self._chunks.get(key)
+            if chunk is not None:
+                return chunk
+            flags = os.O_RDWR | getattr(os, "O_BINARY", 0) | (os.O_CREAT if create else 0)
+            try:
+                fd = os.open(self._path(key), flags, 0o644)
+            except FileNotFoundError:
+                self._absent.add(key)
+                return None
+            try:
+                # Outro bot pode estar criando o mesmo arquivo: ftruncate so
+                # estende (com zeros) ate o tamanho fixo.
+                if os.fstat(fd).st_size < CHUNK_TILES:
+                    os.ftruncate(fd, CHUNK_TILES)
+                chunk = mmap.mmap(fd, CHUNK_TILES)
+            finally:
+                os.close(fd)
+            self._chunks[key] = chunk
+            self._absent.discard(key)
+            return chunk
+
+    def _load_floor(self, z: Optional[int]) -> None:
+        if z in self._scanned_floors or None in self._scanned_floors:
+            return
+        for path in self.directory.glob(f"*{CHUNK_SUFFIX}"):
+            try:
+                cx, cy, fz = (int(part) for part in path.stem.split("_"))
+            except ValueError:
+                continue
+            if z is None or fz == z:
+                key = (fz << 16) | (cy << 8) | cx
+                if key not in self._chunks:
+                    self._map(key, create=False)
+        self._scanned_floors.add(z)
+
+    def refresh(self) -> None:
+        """Reconsidera arquivos criados por outros bots desde a ultima varredura."""
+        self._absent.clear()
+        self._scanned_floors.clear()
+
+    def page_in(self, x: int, y: int, z: int, radius: int = 1) -> None:
+        """Mapeia os chunks ao redor de (x, y, z) que ja existem em disco."""
+        cx, cy = x >> 8, y >> 8
+        for dy in range(-radius, radius + 1):
+            for dx in range(-radius, radius + 1):
+                if 0 <= cx + dx <= 0xFF and 0 <= cy + dy <= 0xFF:
+                    self.chunk(cx + dx, cy + dy, z)
+
+    # ------------------------------------------------------------------
+    # Gravacao
+    # ------------------------------------------------------------------
+
+    def _changed(self, key: Optional[int] = None, index: Optional[int] = None) -> None:
+        super()._changed(key, index)
+        if key is None:
+            self._dirty.update(self._chunks)
+        else:
+            self._dirty.add(key)
+
+    @property
+    def dirty(self) -> int:
+        return len(self._dirty)
+
+    def flush(self) -> int:
+        """Grava em disco os chunks alterados; retorna quantos foram gravados."""
+        with self._lock:
+            dirty, self._dirty = self._dirty, set()
+            for key in dirty:
+                chunk = self._chunks.get(key)
+                if chunk is not None:
+                    chunk.flush()
+        return len(dirty)
+
+    def maybe_flush(self, now: float) -> int:
+        """flush() no maximo a cada `flush_interval` segundos."""
+        if not self._dirty or now - self._last_flush < self.flush_interval:
+            return 0
+        self._last_flush = now
+        return self.flush()
+
+    def clear(self) -> None:
+        """Esquece o mapa: zera os chunks (os arquivos continuam)."""
+        self._load_floor(None)
+        for chunk in self._chunks.values():
+            chunk[:] = bytes(CHUNK_TILES)
+        self._changed()
+
+    def close(self) -> None:
+        self.flush()
+        with self._lock:
+            chunks: Dict[int, mmap.mmap] = self._chunks
+            self._chunks = {}
+            for chunk in chunks.values():
+                chunk.close()
+        self.refresh()
+        self._log.debug(f"MapStore fechado: {len(chunks)} chunks em {self.directory}")
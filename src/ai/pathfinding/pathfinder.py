@@ -1,20 +1,65 @@
 """
 Interface principal de pathfinding.
+
+Modos (Pathfinder.mode):
+  - "astar": A* com custo extra por tile (padrao)
+  - "jps":   Jump Point Search, grade de custo uniforme (ignora o custo
+             extra). No scripts/benchmark_pathfinding.py so ganha em salas
+             ligadas por portas (~10x); em chao aberto e campos de pilares
+             fica 1,5-2x mais lento que o A*. Se o JPS nao achar caminho dentro
+             do retangulo da busca, o A* tenta de novo - uma falha paga as
+             duas buscas.
+
+Rotas longas (distancia Chebyshev > hierarchical_distance, mesmo andar)
+passam pelo HPA* (hpa.HierarchicalMap): a rota e planejada entre clusters
+e so os proximos `refine_clusters` trechos viram tiles. O caminho devolvido
+termina no comeco do cluster seguinte; o cavebot pede de novo ao chegar
+la. Sem rota abstrata, cai na busca do modo atual.
 """
 from typing import List, Optional
 from src.core.value_objects.position import Position
 from .astar import AStar
+from .hpa import HierarchicalMap
+from .jps import JumpPointSearch
+from .tile_grid import TileGrid
 from src.infrastructure.logging.logger import get_logger
 
 
 class Pathfinder:
     """Pathfinder principal com cache e otimizações."""
     
-    def __init__(self):
-        self.astar = AStar()
+    MODES = ("astar", "jps")
+    DEFAULT_HIERARCHICAL_DISTANCE = 96
+    DEFAULT_REFINE_CLUSTERS = 2
+
+    def __init__(self, grid: Optional[TileGrid] = None, mode: str = "astar"):
+        self.astar = AStar(grid)
+        self.jps = JumpPointSearch(self.astar.grid)
+        self.hpa = HierarchicalMap(self.astar.grid)
+        self.hierarchical = True
+        self.hierarchical_distance = self.DEFAULT_HIERARCHICAL_DISTANCE
+        self.refine_clusters = self.DEFAULT_REFINE_CLUSTERS
+        self._mode = "astar"
+        self.mode = mode
         self._log = get_logger("Pathfinder")
         self._path_cache = {}
+        self._cache_version = self.grid.version
         self.max_cache_size = 100
+
+    @property
+    def grid(self) -> TileGrid:
+        """Mapa conhecido (compartilhavel com MapAnalyzer)."""
+        return self.astar.grid
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @mode.setter
+    def mode(self, mode: str) -> None:
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de pathfinding invalido: {mode!r} (use {self.MODES})")
+        self._mode = mode
     
     def find_path(
         self,
@@ -33,15 +78,26 @@ class Pathfinder:
         Returns:
             Lista de posições ou None
         """
-        # Verifica cache
-        cache_key = (start, goal)
+        # Verifica cache (qualquer alteracao na grade o invalida)
+        if self.grid.version != self._cache_version:
+            self.clear_cache()
+        cache_key = (start, goal, self._mode)
         if use_cache and cache_key in self._path_cache:
             self._log.debug(f"Caminho encontrado no cache: {start} → {goal}")
             return self._path_cache[cache_key]
         
         # Calcula caminho
         self._log.debug(f"Calculando caminho: {start} → {goal}")
-        path = self.astar.find_path(start, goal)
+        path = None
+        if (
+            self.hierarchical
+            and not self.astar.restricted
+            and start.z == goal.z
+            and start.distance_chebyshev(goal) > self.hierarchical_distance
+        ):
+            path = self.hpa.find_path(start, goal, max_clusters=self.refine_clusters)
+        if path is None:
+            path = self._find_local(start, goal)
         
         if path:
             self._log.debug(f"Caminho encontrado com {len(path)} passos")
@@ -54,6 +110,18 @@ class Pathfinder:
         
         return path
     
+    def _find_local(self, start: Position, goal: Position) -> Optional[List[Position]]:
+        """Busca tile a tile no modo atual."""
+        if self._mode == "jps":
+            path = self.jps.find_path(
+                start, goal,
+                restricted=self.astar.restricted,
+                chunks=self.astar.floor_chunks(start.z),
+            )
+            if path is not None:
+                return path
+        return self.astar.find_path(start, goal)
+
     def _cache_path(self, key, path):
         """Adiciona caminho ao cache."""
         if len(self._path_cache) >= self.max_cache_size:
@@ -65,10 +133,12 @@ class Pathfinder:
     def clear_cache(self):
         """Limpa cache de caminhos."""
         self._path_cache.clear()
+        self._cache_version = self.grid.version
     
     def set_walkable_area(self, positions: List[Position]):
         """Define área caminhável."""
         self.astar.set_walkable(positions)
+        self.clear_cache()  # a grade nao muda: invalida aqui
     
     def add_obstacle(self, position: Position):
         """Adiciona obstáculo."""
@@ -0,0 +1,202 @@
+"""
+Grade de tiles por andar, em chunks de bytearray.
+
+Cada andar e dividido em chunks de 256x256 tiles; cada chunk e um
+bytearray(65536) alocado so quando algum tile dele e marcado. Um tile
+ocupa um byte:
+
+  bit 0  WALKABLE  tile conhecido como caminhavel
+  bit 1  BLOCKED   tile conhecido como bloqueado (parede, objeto, player)
+  bits 4-7         custo extra do tile (0-15, em passos retos)
+
+0 = desconhecido. As buscas consultam a grade por indice (chunk + offset)
+em vez de fazer hash de tuplas (x, y, z) em sets.
+
+Chaves:
+  - chunk: (z << 16) | (cy << 8) | cx, com cx = x >> 8, cy = y >> 8
+  - tile dentro do chunk: ((y & 0xFF) << 8) | (x & 0xFF)
+"""
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+CHUNK_BITS = 8
+CHUNK_SIZE = 1 << CHUNK_BITS          # 256 tiles por lado
+CHUNK_MASK = CHUNK_SIZE - 1
+CHUNK_TILES = CHUNK_SIZE * CHUNK_SIZE  # 65536 bytes por chunk
+
+WALKABLE = 0x01
+BLOCKED = 0x02
+COST_SHIFT = 4
+MAX_COST = 0x0F
+FLAG_MASK = (1 << COST_SHIFT) - 1
+
+
+def chunk_key(x: int, y: int, z: int) -> int:
+    return (z << 16) | ((y >> CHUNK_BITS) << 8) | (x >> CHUNK_BITS)
+
+
+def tile_index(x: int, y: int) -> int:
+    return ((y & CHUNK_MASK) << CHUNK_BITS) | (x & CHUNK_MASK)
+
+
+class TileGrid:
+    """Mapa conhecido de tiles (1 byte por tile), em chunks por andar."""
+
+    def __init__(self):
+        self._chunks: Dict[int, bytearray] = {}
+        self.version = 0  # incrementa a cada alteracao (invalida caches)
+        # callback(chunk_key, index) a cada alteracao (ver _changed)
+        self._listeners: List[Callable[[Optional[int], Optional[int]], None]] = []
+
+    # ------------------------------------------------------------------
+    # Acesso por tile
+    # ------------------------------------------------------------------
+
+    def get(self, x: int, y: int, z: int) -> int:
+        """Byte do tile (flags + custo); 0 se desconhecido."""
+        key = chunk_key(x, y, z)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._load_chunk(key)
+        return chunk[tile_index(x, y)] if chunk is not None else 0
+
+    def set(self, x: int, y: int, z: int, value: int) -> None:
+        key = chunk_key(x, y, z)
+        chunk = self._chunks.get(key)
+        if chunk is None:
+            chunk = self._load_chunk(key)
+        if chunk is None:
+            if not value:
+                return
+            chunk = self._chunks[key] = self._new_chunk(key)
+        index = tile_index(x, y)
+        if chunk[index] != value:
+            chunk[index] = value
+            self._changed(key, index)
+
+    def update(self, x: int, y: int, z: int, set_flags: int = 0, clear_flags: int = 0) -> None:
+        """Liga `set_flags` e desliga `clear_flags`, preservando o custo."""
+        self.set(x, y, z, (self.get(x, y, z) & ~clear_flags) | set_flags)
+
+    def mark_walkable(self, x: int, y: int, z: int) -> None:
+        self.update(x, y, z, WALKABLE, BLOCKED)
+
+    def mark_blocked(self, x: int, y: int, z: int) -> None:
+        self.update(x, y, z, BLOCKED, WALKABLE)
+
+    def forget(self, x: int, y: int, z: int) -> None:
+        """Volta o tile para desconhecido."""
+        self.set(x, y, z, 0)
+
+    def set_cost(self, x: int, y: int, z: int, cost: int) -> None:
+        """Custo extra do tile, em passos retos (0-15)."""
+        cost = max(0, min(MAX_COST, int(cost)))
+        self.set(x, y, z, (self.get(x, y, z) & FLAG_MASK) | (cost << COST_SHIFT))
+
+    def is_blocked(self, x: int, y: int, z: int) -> bool:
+        return bool(self.get(x, y, z) & BLOCKED)
+
+    def is_walkable(self, x: int, y: int, z: int) -> bool:
+        return bool(self.get(x, y, z) & WALKABLE)
+
+    # ------------------------------------------------------------------
+    # Acesso em bloco
+    # ------------------------------------------------------------------
+
+    def chunk(self, cx: int, cy: int, z: int) -> Optional[bytearray]:
+        """Chunk (cx, cy, z) ou None se nunca foi marcado."""
+        key = (z << 16) | (cy << 8) | cx
+        chunk = self._chunks.get(key)
+        return chunk if chunk is not None else self._load_chunk(key)
+
+    def floor_chunks(self, z: int) -> Dict[int, bytearray]:
+        """
+        Chunks do andar indexados por (cy << 8) | cx, para laços de busca
+        que calculam o indice direto da chave empacotada (y << 16) | x.
+        """
+        self._load_floor(z)
+        base = z << 16
+        return {key - base: chunk for key, chunk in self._chunks.items() if key >> 16 == z}
+
+    def clear_flag(self, flag: int) -> None:
+        """Desliga `flag` em todos os tiles (ex.: redefinir a area caminhavel)."""
+        table = bytes(b & ~flag & 0xFF for b in range(256))
+        self._load_floor(None)
+        for key, chunk in self._chunks.items():
+            current = chunk[:]
+            cleared = current.translate(table)
+            if cleared != current:
+                chunk[:] = cleared
+                self._changed(key)
+
+    def has_flag(self, flag: int, z: Optional[int] = None) -> bool:
+        """True se algum tile (do andar `z`, ou de qualquer um) tem `flag`."""
+        self._load_floor(z)
+        for key, chunk in self._chunks.items():
+            if z is not None and key >> 16 != z:
+                continue
+            if chunk[:].translate(_FLAG_TABLES[flag]).find(1) != -1:
+                return True
+        return False
+
+    def tiles(self, flag: int) -> Iterator[Tuple[int, int, int]]:
+        """Itera (x, y, z) dos tiles com `flag`."""
+        self._load_floor(None)
+        for key, chunk in self._chunks.items():
+            z = key >> 16
+            base_x = (key & 0xFF) << CHUNK_BITS
+            base_y = ((key >> 8) & 0xFF) << CHUNK_BITS
+            marked = chunk[:].translate(_FLAG_TABLES[flag])
+            index = marked.find(1)
+            while index != -1:
+                yield base_x + (index & CHUNK_MASK), base_y + (index >> CHUNK_BITS), z
+                index = marked.find(1, index + 1)
+
+    def count(self, flag: int) -> int:
+        table = _FLAG_TABLES[flag]
+        self._load_floor(None)
+        return sum(CHUNK_TILES - chunk[:].translate(table).count(0) for chunk in self._chunks.values())
+
+    def add_listener(self, callback: Callable[[Optional[int], Optional[int]], None]) -> None:
+        """Registra callback(chunk_key, index) chamado a cada alteracao."""
+        self._listeners.append(callback)
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self._chunks)
+
+    def clear(self) -> None:
+        self._chunks.clear()
+        self._changed()
+
+    # ------------------------------------------------------------------
+    # Pontos de extensao
+    # ------------------------------------------------------------------
+
+    # Um chunk e qualquer buffer mutavel de CHUNK_TILES bytes com
+    # indexacao e fatias (bytearray aqui, mmap no MapStore).
+
+    def _load_chunk(self, key: int) -> Optional[bytearray]:
+        """Chunk ainda nao carregado: None = desconhecido."""
+        return None
+
+    def _load_floor(self, z: Optional[int]) -> None:
+        """Carrega os chunks conhecidos do andar `z` (None = todos)."""
+
+    def _new_chunk(self, key: int) -> bytearray:
+        return bytearray(CHUNK_TILES)
+
+    def _changed(self, key: Optional[int] = None, index: Optional[int] = None) -> None:
+        """
+        Chamado a cada alteracao: `index` None = chunk inteiro, `key` None =
+        grade inteira.
+        """
+        self.version += 1
+        for callback in self._listeners:
+            callback(key, index)
+
+
+# flag -> tabela de translate que zera os bytes sem a flag
+_FLAG_TABLES = {
+    flag: bytes(1 if b & flag else 0 for b in range(256))
+    for flag in (WALKABLE, BLOCKED, WALKABLE | BLOCKED)
+}
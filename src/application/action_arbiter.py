@@ -0,0 +1,152 @@
+"""
+ActionArbiter - porta unica entre os scripts e o InputDispatcher.
+
+Healing, buffs, combos do aimbot e regras persistentes tinham cada um seu
+proprio cooldown e podiam lancar magias na mesma janela de exhaust: o
+servidor recusa a segunda ("You are exhausted.") e o input e desperdicado.
+O arbiter conhece os grupos de exhaust do 8.60 (spells_860) e, para cada
+pedido:
+
+  1. duplicata: a mesma acao ainda esta na fila do dispatcher
+     -> coalescida (nao envia de novo, nao gasta janela)
+  2. grupo em exhaust: se a janela abre em ate `max_defer` segundos, a
+     acao e adiada para a abertura (e a reserva); senao e descartada
+  3. caso contrario: reserva a janela do grupo e enfileira
+
+Cada grupo e um ActionCooldown (thread-safe): o tick do BotEngine e a
+HealingLane passam pelo mesmo arbiter. Os passos 1-3 rodam sob um lock do
+arbiter: sem ele, outra thread podia enfileirar a mesma acao entre o
+is_queued e o submit, e a janela reservada ficava presa sem acao enviada.
+"""
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from src.application.action_cooldown import ActionCooldown
+from src.core.constants.spells_860 import EXHAUST_SECONDS, spell_group
+from src.infrastructure.injection.input_dispatcher import InputDispatcher, Step
+
+DEFAULT_MAX_DEFER = 0.3
+
+
+class ActionArbiter:
+    """Filtra magias/hotkeys por exhaust e duplicata antes do dispatcher."""
+
+    def __init__(
+        self,
+        dispatcher: InputDispatcher,
+        clock: Callable[[], float] = time.monotonic,
+        exhaust: Optional[Dict[str, float]] = None,
+        max_defer: float = DEFAULT_MAX_DEFER,
+    ):
+        self._dispatcher = dispatcher
+        self.max_defer = max_defer
+        self._groups: Dict[str, ActionCooldown] = {
+            group: ActionCooldown(seconds, clock)
+            for group, seconds in (exhaust or EXHAUST_SECONDS).items()
+        }
+        self._lock = threading.Lock()
+        # requested / sent / deferred / coalesced / exhausted
+        self.stats: Counter = Counter()
+
+    def remaining(self, group: str) -> float:
+        """Segundos ate o grupo sair do exhaust (0 = livre)."""
+        cooldown = self._groups.get(group)
+        return cooldown.remaining() if cooldown else 0.0
+
+    @property
+    def coalesced(self) -> int:
+        return self.stats["coalesced"]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Contadores e exhaust restante por grupo."""
+        return {
+            **{k: self.stats[k] for k in ("requested", "sent", "deferred", "coalesced", "exhausted")},
+            "exhaust": {group: self.remaining(group) for group in self._groups},
+        }
+
+    # ------------------------------------------------------------------
+    # Pedidos
+    # ------------------------------------------------------------------
+
+    def cast(
+        self,
+        spell_words: str,
+        delay: float = 0.0,
+        priority: int = 0,
+        group: Optional[str] = None,
+        defer: bool = True,
+    ) -> bool:
+        """
+        Pede uma magia. Sem `group`, o grupo vem das palavras (spell_group);
+        magia desconhecida nao tem exhaust controlado.
+
+        Returns:
+            True se enviada, adiada ou coalescida; False se descartada.
+        """
+        if not spell_words:
+            return False
+        words = " ".join(spell_words.lower().split())
+        group = group or spell_group(words)
+        return self._request(
+            ("cast", words), [(delay, "cast_spell", (spell_words,))], group, priority, delay, defer
+        )
+
+    def hotkey(
+        self,
+        key: str,
+        group: Optional[str] = None,
+        delay: float = 0.0,
+        priority: int = 0,
+        defer: bool = True,
+    ) -> bool:
+        """Pede uma hotkey (magia/runa/item); `group` aplica o exhaust dele."""
+        if not key:
+            return False
+        return self._request(
+            ("hotkey", key.upper()), [(delay, "send_hotkey", (key,))], group, priority, delay, defer
+        )
+
+    def _request(
+        self,
+        key: Hashable,
+        steps: list,
+        group: Optional[str],
+        priority: int,
+        delay: float,
+        defer: bool,
+    ) -> bool:
+        with self._lock:
+            return self._request_locked(key, steps, group, priority, delay, defer)
+
+    def _request_locked(
+        self,
+        key: Hashable,
+        steps: list,
+        group: Optional[str],
+        priority: int,
+        delay: float,
+        defer: bool,
+    ) -> bool:
+        self.stats["requested"] += 1
+        if self._dispatcher.is_queued(key):
+            self.stats["coalesced"] += 1
+            return True
+
+        cooldown = self._groups.get(group) if group else None
+        if cooldown is not None:
+            wait = cooldown.reserve(self.max_defer if defer else 0.0, delay=delay)
+            if wait is None:
+                self.stats["exhausted"] += 1
+                return False
+            if wait > 0:
+                self.stats["deferred"] += 1
+                first: Step = steps[0]
+                steps = [(first[0] + wait, first[1], first[2])] + steps[1:]
+
+        if not self._dispatcher.submit(steps, priority, key=key):
+            self.stats["coalesced"] += 1
+            return True
+        self.stats["sent"] += 1
+        return True
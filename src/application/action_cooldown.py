@@ -0,0 +1,49 @@
+"""
+ActionCooldown - janela de cooldown de acoes compartilhada entre loops.
+
+O tick do BotEngine e a HealingLane rodam em threads diferentes e ambos
+podem lancar magias. try_acquire() e atomico: so um dos loops consegue a
+janela, o outro recebe False e nao envia nada (sem double-cast). O
+ActionArbiter usa um ActionCooldown por grupo de exhaust.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+
+class ActionCooldown:
+    """Janela minima entre duas acoes, segura para varias threads."""
+
+    def __init__(self, seconds: float = 1.0, clock: Callable[[], float] = time.monotonic):
+        self.seconds = seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._ready_at = 0.0
+
+    def try_acquire(self, seconds: Optional[float] = None) -> bool:
+        """Reserva a janela se ela estiver livre; False se ainda em cooldown."""
+        return self.reserve(0.0, seconds) is not None
+
+    def reserve(
+        self, max_wait: float, seconds: Optional[float] = None, delay: float = 0.0
+    ) -> Optional[float]:
+        """
+        Reserva a proxima janela para uma acao que sairia em `delay`
+        segundos, se ela abrir em ate `max_wait` segundos depois disso.
+        Retorna a espera extra (0 = sem espera) ou None se demorar mais.
+        """
+        with self._lock:
+            earliest = self._clock() + delay
+            wait = max(0.0, self._ready_at - earliest)
+            if wait > max_wait:
+                return None
+            self._ready_at = earliest + wait + (self.seconds if seconds is None else seconds)
+            return wait
+
+    def remaining(self) -> float:
+        """Segundos ate a proxima acao ser permitida (0 = livre)."""
+        return max(0.0, self._ready_at - self._clock())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._ready_at = 0.0
@@ -3,31 +3,39 @@ BotEngine - nucleo do bot Tibia 8.60.
 Gerencia loop principal, leitura de memoria, scripts e eventos.
 """
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Tuple
 
-import win32gui
 try:
+    import win32gui
     import win32process
-except ImportError:
+except ImportError:  # Linux (simulador, replay, testes)
+    win32gui = None
     win32process = None
 
 from src.infrastructure.memory.process_manager import ProcessManager
 from src.infrastructure.memory.memory_reader import MemoryReader
 from src.infrastructure.memory.memory_writer import MemoryWriter
-from src.infrastructure.injection.keyboard_injector import KeyboardInjector
+from src.infrastructure.memory.io_stats import summarize
 from src.infrastructure.injection.memory_walker import MemoryWalker
+from src.infrastructure.injection.input_dispatcher import InputDispatcher
 from src.infrastructure.logging.logger import get_logger
 
+from src.core.interfaces.injector_interface import ICommandInjector
 from src.core.entities.player import Player
 from src.core.entities.creature import Creature
+from src.core.entities.world_snapshot import WorldSnapshot
 from src.core.value_objects.address import MemoryAddress
+from src.core.constants.addresses_860 import TARGET
 
 from src.application.events.event_manager import EventManager
 from src.application.events.event_types import EventType
 from src.application.scripts.script_engine import ScriptEngine
+from src.application.tick_profiler import TickProfiler
+from src.application.action_arbiter import ActionArbiter
+from src.application.healing_lane import HealingLane
 
-from src.infrastructure.readers.player_reader import PlayerReader
-from src.infrastructure.readers.creature_reader import CreatureReader
+from src.infrastructure.readers.world_reader import WorldReader
+from src.ai.pathfinding.map_store import MapStore
 
 __all__ = ["BotEngine", "EventType", "EventManager"]
 
@@ -50,17 +58,21 @@ class BotEngine:
         self,
         process_manager: ProcessManager,
         memory_reader: MemoryReader,
-        keyboard_injector: KeyboardInjector,
+        keyboard_injector: ICommandInjector,
         player_addresses: Dict[str, Any],
         battle_list_addresses: Dict[str, Any],
         creature_offsets: Dict[str, int],
         memory_writer: Optional[MemoryWriter] = None,
+        target_addresses: Optional[Dict[str, Any]] = None,
     ):
         self._log = get_logger("BotEngine")
 
         self._pm = process_manager
         self._memory = memory_reader
         self._injector = keyboard_injector
+        # Fila de input nao bloqueante: scripts enfileiram, um worker envia
+        # (os sleeps do PostMessage saem da thread do tick).
+        self._dispatcher = InputDispatcher(keyboard_injector)
 
         # MemoryWriter: se nao fornecido, cria usando o mesmo process_manager.
         if memory_writer is None:
@@ -71,9 +83,14 @@ class BotEngine:
         # O injector e injetado em start() apos o PID ser configurado.
         self._walker = MemoryWalker()
 
-        self._player_reader = PlayerReader(self._memory, player_addresses)
-        self._creature_reader = CreatureReader(
-            self._memory, battle_list_addresses, creature_offsets
+        # Um unico WorldReader substitui PlayerReader + CreatureReader:
+        # BattleList e janela do player lidas em bloco, uma vez por tick.
+        self._world_reader = WorldReader(
+            self._memory,
+            player_addresses,
+            battle_list_addresses,
+            creature_offsets,
+            target_addresses=TARGET if target_addresses is None else target_addresses,
         )
 
         self.enabled: bool = False
@@ -81,16 +98,32 @@ class BotEngine:
             "player_vocation": "Auto",
             "use_script_engine": True,
             "combat_mode": "lowest_hp",
+            # False: input sincrono na thread do tick (simulador/benchmark)
+            "async_input": True,
         }
 
-        self.player: Optional[Player] = None
-        self.creatures: List[Creature] = []
+        # Snapshot do tick atual: trocado por referencia, nunca alterado
+        # (scripts, eventos e a thread da UI leem o mesmo objeto).
+        self.world: WorldSnapshot = WorldSnapshot(player=None)
+        self._tick_count: int = 0
 
         self.script_engine = ScriptEngine()
         self.event_manager = EventManager()
 
-        self._last_player: Optional[Player] = None
-        self._last_creatures: List[Creature] = []
+        # Tempo por fase do tick e por script (janela de amostras recentes)
+        self.profiler = TickProfiler()
+        self.script_engine.profiler = self.profiler
+        # Relogio do agendamento de scripts (o benchmark usa o tempo simulado)
+        self.clock = time.monotonic
+
+        # Exhaust por grupo + dedupe de acoes, compartilhado com a HealingLane
+        self.arbiter = ActionArbiter(self._dispatcher, clock=lambda: self.clock())
+        self.healing_lane: Optional[HealingLane] = None
+        # Mapa aprendido persistente (open_map_store); None = so em memoria
+        self.map_store: Optional[MapStore] = None
+
+        # Telemetria de I/O do ultimo tick: (duracao ms, reads, writes)
+        self._io_tick: tuple = (0.0, {}, {})
 
         self._connected: bool = False
         self._connection_retry_count: int = 0
@@ -106,9 +139,12 @@ class BotEngine:
     # ------------------------------------------------------------------
 
     @property
-    def injector(self) -> KeyboardInjector:
-        """KeyboardInjector para hotkeys, spells e healing."""
-        return self._injector
+    def injector(self) -> InputDispatcher:
+        """
+        InputDispatcher sobre o KeyboardInjector: hotkeys, spells e teclas
+        sao enfileirados e retornam na hora (aceitam delay=/priority=).
+        """
+        return self._dispatcher
 
     @property
     def walker(self) -> MemoryWalker:
@@ -129,9 +165,65 @@ class BotEngine:
         """MemoryWriter direto, para uso avancado pelos scripts."""
         return self._memory_writer
 
-    def cast_spell(self, spell_words: str) -> None:
-        """Método público para scripts lançarem magias."""
-        self._injector.cast_spell(spell_words)
+    def cast_spell(self, spell_words: str, delay: float = 0.0, priority: int = 0) -> bool:
+        """
+        Método público para scripts lançarem magias.
+
+        Passa pelo ActionArbiter (compartilhado entre o tick e a
+        HealingLane): retorna False, sem enviar nada, se o grupo de exhaust
+        da magia nao abre a tempo. A magia vai para a fila do
+        InputDispatcher (sai em `delay`s; maior `priority` fura a fila) e o
+        metodo retorna sem esperar o envio.
+        """
+        return self.arbiter.cast(spell_words, delay=delay, priority=priority)
+
+    def use_hotkey(
+        self, key: str, group: Optional[str] = None, delay: float = 0.0, priority: int = 0
+    ) -> bool:
+        """
+        Hotkey de magia/runa/item via ActionArbiter. `group` ("attack",
+        "healing", "rune") aplica o exhaust correspondente.
+        """
+        return self.arbiter.hotkey(key, group=group, delay=delay, priority=priority)
+
+    def start_healing_lane(self, interval: float = 0.01, script_name: str = "HealingBot") -> bool:
+        """
+        Passa o script de cura para a HealingLane (thread propria, le so
+        HP/mana a cada `interval`). False se o script nao estiver registrado.
+        """
+        script = self.script_engine.get_script(script_name)
+        if script is None:
+            return False
+        if self.healing_lane is None or self.healing_lane.script is not script:
+            self.stop_healing_lane()
+            self.healing_lane = HealingLane(self, script, self._pm, interval)
+        self.healing_lane.interval = interval
+        self.healing_lane.start()
+        return True
+
+    def stop_healing_lane(self) -> None:
+        """Para a HealingLane; o script volta a rodar no tick."""
+        if self.healing_lane is not None:
+            self.healing_lane.stop()
+
+    def open_map_store(self, directory: Optional[str] = None) -> MapStore:
+        """
+        Abre o mapa persistente (data/map/ por padrao) e o entrega aos
+        scripts registrados que aprendem mapa (attach_map). Chunks alterados
+        sao gravados a cada MapStore.flush_interval pelo tick.
+        """
+        self.close_map_store()
+        self.map_store = MapStore(directory) if directory else MapStore()
+        for script in self.script_engine.scripts:
+            attach = getattr(script, "attach_map", None)
+            if attach is not None:
+                attach(self.map_store)
+        return self.map_store
+
+    def close_map_store(self) -> None:
+        if self.map_store is not None:
+            self.map_store.close()
+            self.map_store = None
 
     # ------------------------------------------------------------------
     # Resolucao de HWND (mantida para cast_spell / focus_client)
@@ -237,9 +329,9 @@ class BotEngine:
                 except Exception as e:
                     self._log.debug(f"Nao foi possivel setar PID no injector: {e}")
 
-                # Injeta KeyboardInjector no MemoryWalker v4 (PostMessage)
+                # Injeta o dispatcher no MemoryWalker v4 (PostMessage)
                 # Deve ocorrer APOS set_process_id para garantir PID configurado.
-                self._walker.set_injector(self._injector)
+                self._walker.set_injector(self._dispatcher)
                 self._log.debug("KeyboardInjector injetado no MemoryWalker.")
 
                 # Propaga HWND ao KeyboardInjector para focus_client / cast_spell
@@ -256,6 +348,9 @@ class BotEngine:
                         "cast_spell fara EnumWindows no primeiro uso.", pid
                     )
 
+            if self.config.get("async_input", True):
+                self._dispatcher.start()
+
             self._log.info("Bot conectado ao processo Tibia.")
             self._log.info(
                 f"Script Engine pronto ({len(self.script_engine.list_scripts())} scripts)."
@@ -271,6 +366,10 @@ class BotEngine:
         """Desconecta e limpa o estado."""
         self.enabled = False
         self._connected = False
+        self.stop_healing_lane()
+        if self.map_store is not None:
+            self.map_store.flush()
+        self._dispatcher.stop()
         self._walker.reset()
         self._pm.detach()
         self._log.info("BotEngine parado.")
@@ -281,21 +380,92 @@ class BotEngine:
           1. Leitura de memoria
           2. Disparo de eventos
           3. Execucao de scripts (se habilitado)
+
+        A BattleList inteira so e lida quando algum script devido neste tick
+        usa criaturas (ou com os scripts parados, para a UI); nos demais
+        ticks (ex.: so o HealingScript venceu) le-se apenas o player.
         """
         if not self._connected:
             return
 
         start_time = time.perf_counter()
+        profiler = self.profiler if self.profiler.enabled else None
+        now = self.clock()
+        scripts_on = self.enabled and self.config.get("use_script_engine", True)
+        with_creatures = (
+            not scripts_on
+            or self.player is None
+            or self.script_engine.needs_creatures(now)
+        )
 
-        self._update_state()
-        self._process_events()
-
-        if self.enabled and self.config.get("use_script_engine", True):
-            self._run_scripts()
+        # Nova geracao do cache de paginas: tudo lido neste tick e fresco.
+        self._memory.advance_generation()
+        updated = self._update_state(with_creatures)
+        if profiler:
+            mark = time.perf_counter()
+            profiler.record("update_state", mark - start_time)
+        if updated:
+            self._process_events()
+        if profiler:
+            end = time.perf_counter()
+            profiler.record("process_events", end - mark)
+            mark = end
+
+        if scripts_on:
+            self._run_scripts(now)
+            if profiler:
+                profiler.record("run_scripts", time.perf_counter() - mark)
+            if self.map_store is not None:
+                self.map_store.maybe_flush(now)
 
         elapsed = (time.perf_counter() - start_time) * 1000
+        if profiler:
+            profiler.record("tick", elapsed / 1000)
+        self._io_tick = (
+            elapsed,
+            self._memory.io_stats.take_tick(),
+            self._memory_writer.io_stats.take_tick(),
+        )
         if elapsed > 50:
-            self._log.debug(f"Tick lento: {elapsed:.1f}ms")
+            reads = summarize(self._io_tick[1])
+            self._log.debug(
+                f"Tick lento: {elapsed:.1f}ms "
+                f"({reads['calls']} reads, {reads['bytes']} bytes, {reads['ms']:.1f}ms em I/O)"
+            )
+
+    def io_stats(self) -> Dict[str, Any]:
+        """
+        Telemetria de I/O de memoria: ultimo tick e acumulado.
+
+        Returns:
+            {"tick_ms", "reads"/"writes": {rotulo: contadores do tick},
+             "summary": {"reads", "writes"}, "totals": {"reads", "writes"},
+             "cache": hits/misses do cache de paginas}
+        """
+        tick_ms, reads, writes = self._io_tick
+        return {
+            "tick_ms": tick_ms,
+            "reads": {label: s.as_dict() for label, s in reads.items()},
+            "writes": {label: s.as_dict() for label, s in writes.items()},
+            "summary": {"reads": summarize(reads), "writes": summarize(writes)},
+            "totals": {
+                "reads": {label: s.as_dict() for label, s in self._memory.io_stats.totals.items()},
+                "writes": {label: s.as_dict() for label, s in self._memory_writer.io_stats.totals.items()},
+            },
+            "cache": self._memory.cache_stats,
+        }
+
+    def time_to_next_tick(self, interval: float) -> float:
+        """
+        Segundos ate o proximo tick: `interval`, ou menos se algum script
+        vencer antes (ex.: HealingScript a cada 30ms).
+        """
+        wait = interval
+        if self.enabled and self.config.get("use_script_engine", True):
+            due = self.script_engine.next_due()
+            if due is not None:
+                wait = min(wait, due - self.clock())
+        return max(0.0, wait)
 
     def run_loop(self, interval: float = 0.1) -> None:
         """Loop autonomo com controle de tempo."""
@@ -305,7 +475,7 @@ class BotEngine:
                 start = time.perf_counter()
                 self.tick()
                 elapsed = time.perf_counter() - start
-                time.sleep(max(0, interval - elapsed))
+                time.sleep(min(max(0, interval - elapsed), self.time_to_next_tick(interval)))
         except KeyboardInterrupt:
             self._log.info("Loop interrompido pelo usuario.")
         finally:
@@ -315,36 +485,48 @@ class BotEngine:
     # Leitura de estado
     # ------------------------------------------------------------------
 
-    def _update_state(self) -> None:
+    @property
+    def player(self) -> Optional[Player]:
+        return self.world.player
+
+    @property
+    def creatures(self) -> Tuple[Creature, ...]:
+        return self.world.creatures
+
+    def _update_state(self, with_creatures: bool = True) -> bool:
         """
-        Le a memoria e atualiza self.player e self.creatures.
+        Le a memoria e publica um novo self.world (player e criaturas).
+
+        with_creatures=False le so o player; as criaturas ficam com a
+        ultima leitura da BattleList.
 
         F1.2 - Apos ler o player, propaga player.vocation para
         engine.config["player_vocation"] quando a vocacao for valida.
 
-        Sincroniza posicao e nome reais via BattleList.
-        """
-        self._last_player = self.player
-        self._last_creatures = list(self.creatures)
+        O estado vem de um unico WorldSnapshot (WorldReader): posicao e nome
+        reais do player saem da mesma passada pela BattleList que produz as
+        criaturas, sem loops extras aqui.
 
+        Returns:
+            False se a leitura falhou (self.world fica com o tick anterior).
+        """
         try:
-            self.player = self._player_reader.get_player()
-            self.creatures = self._creature_reader.get_creatures()
+            self._tick_count += 1
+            self.world = self._world_reader.read(
+                creatures=with_creatures,
+                tick=self._tick_count,
+                timestamp=self.clock(),
+                engine=self,
+            )
 
             if self.player and self.player.vocation not in ("Unknown", "Auto", "", None):
                 if not str(self.player.vocation).startswith("Unknown("):
                     self.config["player_vocation"] = self.player.vocation
 
-            if self.player and self.creatures:
-                for creature in self.creatures:
-                    if creature.id == self.player.id:
-                        self.player.position = creature.position
-                        if creature.name and creature.name not in ("Unknown", ""):
-                            self.player.name = creature.name
-                        break
-
         except Exception as e:
             self._log.error(f"Erro ao atualizar estado: {e}", exc_info=True)
+            return False
+        return True
 
     def check_and_reconnect(self) -> bool:
         try:
@@ -371,11 +553,17 @@ class BotEngine:
     # ------------------------------------------------------------------
 
     def _process_events(self) -> None:
-        """Compara o estado atual com o anterior e dispara eventos."""
-        if not self.player:
+        """
+        Compara self.world com world.previous e dispara eventos.
+        Eventos de criatura so quando a BattleList foi lida neste tick.
+        """
+        world = self.world
+        if not world.player:
             return
+        previous = world.previous
+        last_player = previous.player if previous is not None else None
 
-        if self._last_player is None:
+        if last_player is None:
             self._log.info(
                 f"Player carregado: ID={self.player.id} Name='{self.player.name}' "
                 f"HP={self.player.stats.health}/{self.player.stats.max_health}"
@@ -402,12 +590,15 @@ class BotEngine:
         else:
             self._mana_low_ticks = 0
 
-        if self._last_player and self.player.level > self._last_player.level:
-            self._log.info(f"Level Up! {self._last_player.level} -> {self.player.level}")
+        if last_player and self.player.level > last_player.level:
+            self._log.info(f"Level Up! {last_player.level} -> {self.player.level}")
             self.event_manager.emit(EventType.LEVEL_UP, player=self.player)
 
-        last_ids = {c.id for c in self._last_creatures}
-        for creature in self.creatures:
+        if not world.creatures_fresh:
+            return
+
+        last_ids = previous.by_id if previous is not None else {}
+        for creature in world.creatures:
             if creature.id not in last_ids:
                 self.event_manager.emit(
                     EventType.CREATURE_DETECTED,
@@ -415,8 +606,10 @@ class BotEngine:
                     player=self.player,
                 )
 
-        current_ids = {c.id for c in self.creatures}
-        for creature in self._last_creatures:
+        if previous is None:
+            return
+        current_ids = world.by_id
+        for creature in previous.creatures:
             if creature.id > 0 and creature.id not in current_ids:
                 self.event_manager.emit(
                     EventType.CREATURE_KILLED,
@@ -428,11 +621,9 @@ class BotEngine:
     # Scripts
     # ------------------------------------------------------------------
 
-    def _run_scripts(self) -> None:
-        """Executa todos os scripts registrados com o contexto atual."""
-        context = {
-            "player": self.player,
-            "creatures": self.creatures,
-            "bot_engine": self,
-        }
-        self.script_engine.execute_all(context)
+    def _run_scripts(self, now: Optional[float] = None) -> None:
+        """
+        Executa os scripts devidos em `now`. O contexto e o proprio
+        WorldSnapshot do tick (context.get("player"), ["creatures"]...).
+        """
+        self.script_engine.execute_all(self.world, now)
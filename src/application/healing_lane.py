@@ -0,0 +1,125 @@
+"""
+HealingLane - loop dedicado de baixa latencia para o HealingScript.
+
+No tick normal a reacao de cura espera a BattleList, os demais scripts e o
+sleep do loop. A lane roda numa thread propria com seu proprio MemoryReader
+e le so a janela de HP/mana do player (0x63FE74..0x63FE9C, um read de 40
+bytes) a cada `interval`. O Player do ultimo tick do BotEngine e reaproveitado
+com os stats frescos e entregue ao HealingScript.
+
+O backend de memoria e o mesmo da thread do engine; os backends Win32 e
+Linux guardam seus buffers de syscall por thread para aguentar isso.
+
+Enquanto a lane roda, o script fica `detached`: o ScriptEngine nao o executa
+no tick. As magias passam por BotEngine.cast_spell, que usa o ActionArbiter
+compartilhado (exhaust por grupo) - os dois loops nunca lancam juntos.
+"""
+import dataclasses
+import threading
+import time
+from typing import Dict, Any, Optional
+
+from src.application.scripts.base_script import BaseScript
+from src.core.constants.addresses_860 import PLAYER
+from src.core.entities.player import Player
+from src.core.value_objects.stats import Stats
+from src.infrastructure.logging.logger import get_logger
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.read_plan import ReadPlan
+
+DEFAULT_INTERVAL = 0.01
+
+
+class HealingLane:
+    """Thread de cura: le HP/mana em alta frequencia e executa o script."""
+
+    def __init__(
+        self,
+        bot_engine,
+        script: BaseScript,
+        process_manager,
+        interval: float = DEFAULT_INTERVAL,
+        player_addresses: Optional[Dict[str, Any]] = None,
+    ):
+        self._engine = bot_engine
+        self.script = script
+        self.interval = interval
+        self._memory = MemoryReader(process_manager, cache_ttl=0)
+        self._log = get_logger("HealingLane")
+
+        addresses = player_addresses or PLAYER
+        self._plan = ReadPlan(label="healing lane")
+        for key in ("mana_max", "mana", "health_max", "health", "id"):
+            self._plan.add(key, addresses[key], "int")
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.iterations = 0
+        self.casts = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def io_stats(self):
+        """Telemetria do MemoryReader proprio da lane."""
+        return self._memory.io_stats
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self.script.detached = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="HealingLane")
+        self._thread.start()
+        self._log.info(f"HealingLane iniciada ({self.interval * 1000:.0f}ms).")
+
+    def stop(self, timeout: float = 1.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.script.detached = False
+
+    def _run(self) -> None:
+        wait = self.interval
+        while not self._stop.wait(wait):
+            start = time.perf_counter()
+            try:
+                self.step()
+            except Exception as e:
+                self._log.debug(f"Falha na healing lane: {e}")
+            wait = max(0.0, self.interval - (time.perf_counter() - start))
+
+    def read_player(self) -> Optional[Player]:
+        """
+        Player do ultimo tick com HP/mana lidos agora; None se ainda nao ha
+        player ou se o id na memoria nao bate (logout / troca de char).
+        """
+        base = self._engine.player
+        if base is None:
+            return None
+        values = self._memory.execute_plan(self._plan)
+        if values["id"] != base.id:
+            return None
+        health, health_max = values["health"], values["health_max"]
+        mana, mana_max = values["mana"], values["mana_max"]
+        if health < 0 or health_max <= 0 or mana < 0 or mana_max <= 0:
+            return None
+        return dataclasses.replace(
+            base, stats=Stats(health=health, max_health=health_max, mana=mana, max_mana=mana_max)
+        )
+
+    def step(self) -> bool:
+        """Uma iteracao da lane; True se o script agiu."""
+        self.iterations += 1
+        if not (self._engine.enabled and self.script.enabled):
+            return False
+        player = self.read_player()
+        if player is None:
+            return False
+        acted = self.script.execute({"player": player, "bot_engine": self._engine})
+        if acted:
+            self.casts += 1
+        return acted
@@ -1,21 +1,30 @@
 import time
-from typing import Dict, Any, List, Optional, Set
+from typing import Dict, Any, List, Optional, Sequence, Set
+
+import numpy as np
+
 from .base_script import BaseScript
 from src.core.entities.player import Player
 from src.core.entities.creature import Creature
+from src.core.entities.creature_table import CreatureTable
 from src.ai.combat.combat_ai import CombatAI
+from src.ai.combat.threat_analyzer import aligned_table
 from src.core.constants.addresses_860 import TARGET
 from src.infrastructure.memory.memory_writer import MemoryWriter
 from src.infrastructure.memory.memory_reader import MemoryReader
-from src.infrastructure.injection.keyboard_injector import KeyboardInjector
+from src.infrastructure.memory.read_plan import ReadPlan
+from src.core.interfaces.injector_interface import ICommandInjector
 
 _HOTKEYS = frozenset({"F1","F2","F3","F4","F5","F6","F7","F8","F9","F10","F11","F12"})
+# Tempo para o cliente processar o novo target antes da magia/hotkey
+_TARGET_SETTLE_DELAY = 0.050
 
 
 class AimbotScript(BaseScript):
     def __init__(self):
         super().__init__("AimBot")
         self.priority = 50
+        self.interval = 0.1
         self.enabled = True
         self.config = {
             "enabled": True,
@@ -70,6 +79,14 @@ class AimbotScript(BaseScript):
         self._combo_cooldowns: Dict[str, float] = {}
         self._name_to_priority: Dict[str, dict] = {}
         self._priorities_id: int = id(self.config.get("target_priorities", []))
+        # Verificacao pos-escrita: target e attack_count declarados num unico
+        # plano (target_id/target_battlelist_id caem na mesma faixa).
+        self._verify_plan = (
+            ReadPlan("target verify")
+            .add("target_id", TARGET["target_id"], "uint")
+            .add("target_battlelist_id", TARGET["target_battlelist_id"], "uint")
+            .add("attack_count", TARGET["attack_count"], "uint")
+        )
 
     # ------------------------------------------------------------------
     # Priority cache
@@ -116,21 +133,25 @@ class AimbotScript(BaseScript):
             self._combat_ai = CombatAI(vocation)
             self._log.info(f"Combat AI inicializado para {vocation}")
 
-        valid_creatures = self._filter_creatures(creatures, player)
-        if not valid_creatures:
+        # Colunas NumPy do tick (WorldReader); monta a partir da lista se
+        # o contexto nao trouxer a tabela alinhada.
+        table = aligned_table(creatures, context.get("creature_table"))
+
+        valid = self._filter_creatures(table, player)
+        if not len(valid):
             self._current_target = None
             return False
 
         if self.config["enable_anti_lure"]:
-            valid_creatures = [
-                c for c in valid_creatures
-                if player.position.distance_chebyshev(c.position) <= self.config["max_follow_distance"]
-            ]
-            if not valid_creatures:
+            valid = valid.subset(
+                np.flatnonzero(valid.within(player.position, self.config["max_follow_distance"]))
+            )
+            if not len(valid):
                 return False
+        valid_creatures = list(valid.creatures)
 
         if self._combat_ai:
-            decision = self._combat_ai.decide_action(player, valid_creatures)
+            decision = self._combat_ai.decide_action(player, valid_creatures, valid)
             if decision == "flee":
                 self._log.warning(f"CombatAI decidiu fugir (HP: {player.hp_percent()}%)")
                 self._current_target = None
@@ -138,15 +159,15 @@ class AimbotScript(BaseScript):
             elif decision == "use_skill":
                 skill = self._combat_ai.get_next_skill(player)
                 if skill:
-                    self._log.info(f"CombatAI: usando {skill.name}")
-                    bot_engine.cast_spell(skill.words or skill.name)
-                    self._combat_ai.mark_skill_used(skill.name)
-                    self._last_attack_time = time.time()
-                    return True
+                    if bot_engine.cast_spell(skill.words or skill.name) is not False:
+                        self._log.info(f"CombatAI: usando {skill.name}")
+                        self._combat_ai.mark_skill_used(skill.name)
+                        self._last_attack_time = time.time()
+                        return True
             elif decision == "idle":
                 return False
 
-        target = self._select_target(player, valid_creatures)
+        target = self._select_target(player, valid)
         if not target:
             return False
 
@@ -187,51 +208,61 @@ class AimbotScript(BaseScript):
             self._log.info(f"Atacando: {target.name} (HP: {hp_pct:.0f}%)")
         return success
 
-    def _filter_creatures(self, creatures: List[Creature], player: Player) -> List[Creature]:
-        filtered = []
+    def _filter_creatures(self, table: CreatureTable, player: Player) -> CreatureTable:
+        """
+        Filtro em duas etapas: mascara vetorizada (id, andar, HP, alcance
+        maximo) sobre as colunas e, so para quem sobra, as regras por nome
+        (blacklist/whitelist/prioridades).
+        """
+        if not len(table):
+            return table
+        rows = table.rows
+        pos = player.position
+        # Descarta criaturas em andar diferente antes da distancia
+        mask = (
+            (rows["id"] != (player.id & 0xFFFFFFFF))
+            & (rows["hp_bar"] >= 0)
+            & (rows["z"] == pos.z)
+        )
+        distances = table.distances(pos)
+        mask &= distances <= self.config["max_distance"]
+
         has_priorities = self._has_valid_priorities()
+        blacklist = self.config["target_blacklist"]
+        whitelist = self.config["target_whitelist"]
+        kept = []
 
-        for creature in creatures:
-            if creature.id == player.id:
-                continue
-            if creature.name in self.config["target_blacklist"]:
+        for i in np.flatnonzero(mask).tolist():
+            creature = table.creatures[i]
+            if creature.name in blacklist:
                 continue
-            if self.config["target_whitelist"]:
-                if creature.name not in self.config["target_whitelist"]:
-                    continue
-
-            if creature.stats.health < 0:
+            if whitelist and creature.name not in whitelist:
                 continue
             if creature.stats.health == 0 and creature.name != "Unknown":
                 continue
 
-            # Descarta criaturas em andar diferente — distance_chebyshev ignora Z
-            if creature.position.z != player.position.z:
-                continue
-
             pri = self._priority_for_creature(creature.name) if has_priorities else None
 
             if has_priorities and pri is None:
                 continue
 
-            distance = player.position.distance_chebyshev(creature.position)
-            max_dist = pri.get("distance", self.config["max_distance"]) if pri else self.config["max_distance"]
-            if distance > min(max_dist, self.config["max_distance"]):
-                continue
-
             if pri:
+                max_dist = pri.get("distance", self.config["max_distance"])
+                if distances[i] > min(max_dist, self.config["max_distance"]):
+                    continue
                 creature_hp_pct = (creature.stats.health / creature.stats.max_health * 100) if creature.stats.max_health > 0 else 0
                 if creature_hp_pct > pri.get("hp_pct", 100):
                     continue
 
-            filtered.append(creature)
+            kept.append(i)
 
-        return filtered
+        return table.subset(kept)
 
-    def _select_target(self, player: Player, creatures: List[Creature]) -> Optional[Creature]:
-        if not creatures:
+    def _select_target(self, player: Player, table: CreatureTable) -> Optional[Creature]:
+        if not len(table):
             return None
 
+        creatures = table.creatures
         mode = self.config["targeting_mode"]
 
         if self._current_target and self._current_target in creatures:
@@ -239,7 +270,7 @@ class AimbotScript(BaseScript):
             if (self._current_target.stats.health > 0 and
                     current_distance <= self.config["max_distance"]):
                 if self.config["prefer_low_hp_for_kill"]:
-                    low_hp_target = self._find_low_hp_target(player, creatures)
+                    low_hp_target = self._find_low_hp_target(player, table)
                     if low_hp_target and low_hp_target != self._current_target:
                         return low_hp_target
                 return self._current_target
@@ -247,49 +278,35 @@ class AimbotScript(BaseScript):
         if mode == "highest_xp":
             return self._select_highest_xp(creatures)
         elif mode == "lowest_hp":
-            return self._select_lowest_hp(creatures)
+            return table.lowest_hp()
         elif mode == "closest":
-            return self._select_closest(player, creatures)
+            return table.closest(player.position)
         elif mode == "highest_threat":
             if self._combat_ai:
-                return self._combat_ai.get_target(player, creatures)
-            return self._select_highest_threat(player, creatures)
+                return self._combat_ai.get_target(player, list(creatures), table)
+            return self._select_highest_threat(player, table)
         else:
             return creatures[0]
 
-    def _select_highest_xp(self, creatures: List[Creature]) -> Optional[Creature]:
+    def _select_highest_xp(self, creatures: Sequence[Creature]) -> Optional[Creature]:
         xp_values = self.config.get("xp_values", {})
         if not xp_values:
             return max(creatures, key=lambda c: c.stats.max_health)
         return max(creatures, key=lambda c: xp_values.get(c.name, c.stats.max_health))
 
-    def _select_lowest_hp(self, creatures: List[Creature]) -> Optional[Creature]:
-        return min(creatures, key=lambda c: c.stats.health)
-
     def _find_low_hp_target(
-        self, player: Player, creatures: List[Creature]
+        self, player: Player, table: CreatureTable
     ) -> Optional[Creature]:
-        threshold = self.config["low_hp_threshold"]
-        max_dist = self.config["max_distance"]
-        low_hp_creatures = [
-            c for c in creatures
-            if c.stats.health <= threshold
-            and player.position.distance_chebyshev(c.position) <= max_dist
-        ]
-        if not low_hp_creatures:
-            return None
-        return min(low_hp_creatures, key=lambda c: c.stats.health)
+        mask = (
+            (table.rows["hp_bar"] <= self.config["low_hp_threshold"])
+            & table.within(player.position, self.config["max_distance"])
+        )
+        return table.lowest_hp(mask)
 
-    def _select_closest(self, player: Player, creatures: List[Creature]) -> Optional[Creature]:
-        return min(creatures, key=lambda c: player.position.distance_chebyshev(c.position))
-
-    def _select_highest_threat(self, player: Player, creatures: List[Creature]) -> Optional[Creature]:
-        def threat_score(c):
-            distance = player.position.distance_chebyshev(c.position)
-            distance_score = max(0, 10 - distance)
-            hp_score = c.stats.health / 10
-            return distance_score + hp_score
-        return max(creatures, key=threat_score)
+    def _select_highest_threat(self, player: Player, table: CreatureTable) -> Optional[Creature]:
+        distance_score = np.maximum(0, 10 - table.distances(player.position))
+        hp_score = table.rows["hp_bar"] / 10
+        return table.best(distance_score + hp_score)
 
     def _get_attack_hotkey(self, target: Creature) -> Optional[str]:
         pri = self._priority_for_creature(target.name)
@@ -335,8 +352,9 @@ class AimbotScript(BaseScript):
                 )
                 return False
 
-            # Verify write
-            read_back = mr.read_uint(TARGET["target_id"], use_cache=False)
+            # Verify write (target + attack_count num unico read plan)
+            values    = mr.execute_plan(self._verify_plan)
+            read_back = values["target_id"]
             read_id   = read_back & 0x00FFFFFF
             read_type = (read_back >> 24) & 0xFF
 
@@ -355,7 +373,7 @@ class AimbotScript(BaseScript):
             # ATTACK_COUNT FIX: incrementa o contador para acionar o envio
             # do pacote 0xA1 (Attack) pelo proprio cliente Tibia.
             # Sem este passo, o servidor nunca recebe o comando de ataque.
-            current_count = mr.read_uint(TARGET["attack_count"], use_cache=False)
+            current_count = values["attack_count"]
             mw.write_uint(TARGET["attack_count"], (current_count + 1) & 0xFFFFFFFF)
             self._log.debug(f"attack_count: {current_count} -> {(current_count + 1) & 0xFFFFFFFF}")
 
@@ -389,7 +407,8 @@ class AimbotScript(BaseScript):
                 )
                 return False
 
-            read_back  = mr.read_uint(TARGET["target_battlelist_id"], use_cache=False)
+            values     = mr.execute_plan(self._verify_plan)
+            read_back  = values["target_battlelist_id"]
             read_slot  = read_back & 0x00FFFFFF
             read_type  = (read_back >> 24) & 0xFF
 
@@ -406,7 +425,7 @@ class AimbotScript(BaseScript):
             )
 
             # ATTACK_COUNT FIX: mesmo mecanismo do path principal
-            current_count = mr.read_uint(TARGET["attack_count"], use_cache=False)
+            current_count = values["attack_count"]
             mw.write_uint(TARGET["attack_count"], (current_count + 1) & 0xFFFFFFFF)
             self._log.debug(f"attack_count BL: {current_count} -> {(current_count + 1) & 0xFFFFFFFF}")
 
@@ -416,7 +435,7 @@ class AimbotScript(BaseScript):
             self._log.warning(f"Memory BL exception: {e}")
             return False
 
-    def _target_via_tile_click(self, creature: Creature, player: Player, injector: KeyboardInjector) -> bool:
+    def _target_via_tile_click(self, creature: Creature, player: Player, injector: ICommandInjector) -> bool:
         ox = self.config.get("viewport_offset_x", 0)
         oy = self.config.get("viewport_offset_y", 0)
         return injector.click_tile(creature.position.x, creature.position.y,
@@ -447,7 +466,6 @@ class AimbotScript(BaseScript):
             self._log.debug("Memory injection desligado via config")
             return False
 
-        injector: KeyboardInjector = bot_engine.injector
         targeted = False
 
         if self._target_via_memory(target, bot_engine):
@@ -464,10 +482,9 @@ class AimbotScript(BaseScript):
             hotkey = self._get_attack_hotkey(target)
             if hotkey:
                 # Pequeno delay para o cliente processar o novo target
-                # antes de receber a hotkey de spell
-                time.sleep(0.050)
-                injector.send_hotkey(hotkey)
-                self._log.debug(f"Hotkey {hotkey} enviada para {target.name}")
+                # antes de receber a hotkey de spell (pacing no dispatcher)
+                if bot_engine.use_hotkey(hotkey, group="attack", delay=_TARGET_SETTLE_DELAY):
+                    self._log.debug(f"Hotkey {hotkey} enviada para {target.name}")
 
         return targeted
 
@@ -488,7 +505,6 @@ class AimbotScript(BaseScript):
             return False
 
         current_time = time.time()
-        injector = bot_engine.injector
 
         for combo in combo_spells:
             spell_name = combo["spell"]
@@ -519,12 +535,12 @@ class AimbotScript(BaseScript):
                 self._log.debug("Memory injection desligado — combo ignorado.")
                 continue
 
-            time.sleep(0.050)
-
             if spell_name.upper() in _HOTKEYS:
-                injector.send_hotkey(spell_name)
+                sent = bot_engine.use_hotkey(spell_name, group="attack", delay=_TARGET_SETTLE_DELAY)
             else:
-                bot_engine.cast_spell(spell_name)
+                sent = bot_engine.cast_spell(spell_name, delay=_TARGET_SETTLE_DELAY)
+            if sent is False:
+                continue  # grupo "attack" em exhaust: ActionArbiter descartou
             self._combo_cooldowns[spell_name] = current_time
             self._log.info(f"Combo: {spell_name} em {target.name}")
             return True
@@ -10,16 +10,34 @@ class BaseScript(ABC):
         self.name = name
         self.enabled = False
         self.priority = 0  # Maior = executa primeiro
+        # Periodo minimo entre execucoes (s); 0 = todo tick do BotEngine.
+        # O ScriptEngine agenda cada script pelo seu periodo (timer heap).
+        self.interval = 0.0
+        # Usa criaturas/BattleList? Se nenhum script devido no tick precisar,
+        # o BotEngine le so o bloco do player.
+        self.needs_creatures = True
+        # Executado fora do ScriptEngine (ex.: HealingLane): o tick o ignora.
+        self.detached = False
         self._log = get_logger(f"Script.{name}")
         self.config: Dict[str, Any] = {}
 
+    @property
+    def tick_rate(self) -> float:
+        """Frequencia alvo em Hz (0 = todo tick)."""
+        return 1.0 / self.interval if self.interval > 0 else 0.0
+
+    @tick_rate.setter
+    def tick_rate(self, hz: float) -> None:
+        self.interval = 1.0 / hz if hz > 0 else 0.0
+
     @abstractmethod
     def execute(self, context: Dict[str, Any]) -> bool:
         """
         Executa o script.
         
         Args:
-            context: Dicionário com player, creatures, bot_engine, etc.
+            context: WorldSnapshot do tick (ou dict) com player, creatures,
+                bot_engine, etc.; somente leitura.
             
         Returns:
             True se executou ação, False se não fez nada
@@ -100,6 +100,8 @@ class BuffScript(BaseScript):
     def __init__(self):
         super().__init__("BuffManager")
         self.priority = 90  # Alta prioridade, mas abaixo do healing
+        self.interval = 0.5
+        self.needs_creatures = False
         self.config = {
             "enabled_buffs": ["magic_shield", "haste"],  # Buffs ativos por padrão
             "min_mana_pct": 30,                           # % mana mínima para manter buffs
@@ -200,7 +202,8 @@ class BuffScript(BaseScript):
     def _cast_buff(self, buff: Buff, bot_engine, current_time: float) -> bool:
         """Lança o buff."""
         try:
-            bot_engine.cast_spell(buff.spell)
+            if bot_engine.cast_spell(buff.spell) is False:
+                return False  # exhaust: ActionArbiter descartou, tenta no proximo ciclo
             buff.last_cast = current_time
             self._active_buffs[buff.name] = buff
             return True
@@ -21,16 +21,25 @@ Historico de correcoes:
              Com 1 arg: current=next_step, destination ausente -> TypeError ou
              dx=0,dy=0 -> sem movimento apesar do log indicar andando.
              Corrigido: walk_to(current_pos, next_step).
+
+Mapa aprendido ("learn_map"): cada tile pisado e marcado caminhavel na
+grade do Pathfinder. Um tile desconhecido que travou o passo (sem criatura
+em cima) fica so em _blocked_tiles; ele so vira bloqueado na grade depois
+de "learn_blocked_failures" falhas espalhadas por "learn_blocked_span"
+segundos (magic wall, wild growth e tecla de passo perdida nao duram
+tanto). Com attach_map(MapStore) essas marcas persistem em data/map/ e
+valem para os outros bots do host.
 """
 import time
-import win32con
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from .base_script import BaseScript
 from src.core.entities.player import Player
 from src.core.entities.creature import Creature
 from src.core.entities.waypoint import Waypoint
 from src.core.value_objects.position import Position
+from src.core.constants.virtual_keys import VK_DOWN, VK_UP
 from src.ai.pathfinding.pathfinder import Pathfinder
+from src.ai.pathfinding.tile_grid import TileGrid
 
 
 class CavebotScript(BaseScript):
@@ -39,11 +48,15 @@ class CavebotScript(BaseScript):
     def __init__(self):
         super().__init__("CaveBot")
         self.priority = 30
+        self.interval = 0.2
         self.config = {
             "waypoints": [],
             "loop": True,
             "max_distance_to_waypoint": 2,
             "use_pathfinding": True,
+            # "astar" (respeita custo por tile) ou "jps" (so compensa em
+            # salas ligadas por portas; ver scripts/benchmark_pathfinding.py)
+            "pathfinding_mode": "astar",
 
             # step_delay: intervalo minimo entre passos (segundos).
             "step_delay": 0.35,
@@ -63,6 +76,13 @@ class CavebotScript(BaseScript):
             # Anti-danger
             "avoid_dangerous_creatures": False,
             "dangerous_creatures": ["Dragon Lord", "Demon", "Warlock"],
+
+            # Marca tiles pisados/travados na grade do pathfinding
+            "learn_map": True,
+            # Falhas no mesmo tile (e segundos entre a primeira e a ultima)
+            # para grava-lo como bloqueado
+            "learn_blocked_failures": 3,
+            "learn_blocked_span": 60.0,
         }
         self._current_waypoint_index = 0
         self._stuck_counter = 0
@@ -77,6 +97,10 @@ class CavebotScript(BaseScript):
         self._follow_target: Optional[Creature] = None
         self._last_follow_position: Optional[Position] = None
         self._blocked_tiles: set = set()
+        # tile -> (falhas, hora da primeira) ate virar bloqueado na grade
+        self._step_failures: Dict[Tuple[int, int, int], Tuple[int, float]] = {}
+        self._learned_position: Optional[Position] = None
+        self._seen_creatures: List[Creature] = []
 
     # ------------------------------------------------------------------
     # Ciclo de vida
@@ -120,6 +144,10 @@ class CavebotScript(BaseScript):
         if not player or not bot_engine:
             return False
 
+        self._seen_creatures = creatures
+        if self.config["learn_map"]:
+            self._learn_position(player.position)
+
         # Verifica walker disponivel
         walker = getattr(bot_engine, "walker", None)
         if walker is None:
@@ -262,6 +290,7 @@ class CavebotScript(BaseScript):
         )
 
         if needs_recalc:
+            self._pathfinder.mode = self.config["pathfinding_mode"]
             self._current_path = self._pathfinder.find_path(
                 player.position, target_pos
             )
@@ -387,6 +416,8 @@ class CavebotScript(BaseScript):
         if self._pending_move_position and time.time() - self._pending_move_time > 0.6:
             key = (self._pending_move_position.x, self._pending_move_position.y, self._pending_move_position.z)
             self._blocked_tiles.add(key)
+            if self.config["learn_map"]:
+                self._learn_blocked(self._pending_move_position)
             self._log.warning(
                 f"Tile bloqueado ({self._pending_move_position.x},{self._pending_move_position.y})! "
                 f"{self._stuck_counter+1}/{self.config['stuck_retries']}"
@@ -406,6 +437,53 @@ class CavebotScript(BaseScript):
         self._stuck_counter = 0
         return False
 
+    # ------------------------------------------------------------------
+    # Mapa aprendido
+    # ------------------------------------------------------------------
+
+    @property
+    def map_grid(self) -> TileGrid:
+        return self._pathfinder.grid
+
+    def attach_map(self, grid: TileGrid) -> None:
+        """Troca a grade do pathfinding (ex.: MapStore compartilhado)."""
+        self._pathfinder = Pathfinder(grid)
+        self._current_path = []
+        self._learned_position = None
+        self._step_failures.clear()
+
+    def _learn_position(self, position: Position) -> None:
+        if position == self._learned_position or position.x <= 0 or position.y <= 0:
+            return
+        self._learned_position = position
+        self._step_failures.pop((position.x, position.y, position.z), None)
+        self.map_grid.mark_walkable(position.x, position.y, position.z)
+
+    def _learn_blocked(self, position: Position, now: Optional[float] = None) -> None:
+        """
+        Tile que travou o passo: conta a falha se o tile nunca foi pisado e
+        nao tem criatura em cima. So vira bloqueado na grade (persistida e
+        compartilhada) apos learn_blocked_failures falhas em pelo menos
+        learn_blocked_span segundos; ate la o bloqueio e temporario e fica
+        so em _blocked_tiles.
+        """
+        if self.map_grid.is_walkable(position.x, position.y, position.z):
+            return
+        if any(c.position == position for c in self._seen_creatures):
+            return
+        now = time.time() if now is None else now
+        key = (position.x, position.y, position.z)
+        failures, first = self._step_failures.get(key, (0, now))
+        failures += 1
+        if (
+            failures >= self.config["learn_blocked_failures"]
+            and now - first >= self.config["learn_blocked_span"]
+        ):
+            del self._step_failures[key]
+            self.map_grid.mark_blocked(position.x, position.y, position.z)
+        else:
+            self._step_failures[key] = (failures, first)
+
     def _handle_stuck(self) -> None:
         self._pending_move_position = None
         self._pending_move_time = 0.0
@@ -478,9 +556,9 @@ class CavebotScript(BaseScript):
             direction = meta.get("direction", "up")
             self._log.info(f"Usando escada ({direction})...")
             if direction == "up":
-                bot_engine.injector.send_key_background(win32con.VK_UP)
+                bot_engine.injector.send_key_background(VK_UP)
             else:
-                bot_engine.injector.send_key_background(win32con.VK_DOWN)
+                bot_engine.injector.send_key_background(VK_DOWN)
             self._wait_until = time.time() + 1.0
 
         elif action == "use":
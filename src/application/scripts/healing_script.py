@@ -2,7 +2,8 @@
 Script de auto-healing avancado com multiplas estrategias.
 """
 import time
-from typing import Dict, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
 from .base_script import BaseScript
 from src.core.entities.player import Player
 
@@ -13,6 +14,8 @@ class HealingScript(BaseScript):
     def __init__(self):
         super().__init__("HealingBot")
         self.priority = 100  # Maxima prioridade
+        self.interval = 0.03  # HP/mana mudam rapido: ~33 Hz
+        self.needs_creatures = False
         self.config = {
             # Healing baseado em porcentagem de HP (metodo tradicional)
             "hp_threshold": 50,
@@ -52,8 +55,10 @@ class HealingScript(BaseScript):
         }
         # --- atributos internos inicializados corretamente ---
         self._last_hp: int        = 0
-        self._last_dps_check: float = 0.0
         self._current_dps: float  = 0.0   # FIX: inicializado para evitar AttributeError
+        # (instante, hp perdido) dentro de dps_window - a HealingLane chama o
+        # script a cada ~10ms, entao o DPS nao pode ser medido amostra a amostra.
+        self._hp_losses: Deque[Tuple[float, int]] = deque()
 
     # ------------------------------------------------------------------
     # Ponto de entrada principal
@@ -91,19 +96,16 @@ class HealingScript(BaseScript):
     # ------------------------------------------------------------------
 
     def _update_dps_tracking(self, player: Player, current_time: float) -> None:
-        """Atualiza o tracking de HP para calculo de dano por segundo."""
-        if self._last_hp > 0 and self._last_dps_check > 0:
-            time_diff = current_time - self._last_dps_check
-            if time_diff > 0:
-                hp_lost = max(0, self._last_hp - player.stats.health)
-                self._current_dps = (hp_lost / time_diff) if hp_lost > 0 else 0.0
-            else:
-                self._current_dps = 0.0
-        else:
-            self._current_dps = 0.0
-
-        self._last_hp          = player.stats.health
-        self._last_dps_check   = current_time
+        """Atualiza o dano por segundo na janela `dps_window` (independe da frequencia)."""
+        window = self.config["dps_window"]
+        hp_lost = self._last_hp - player.stats.health if self._last_hp > 0 else 0
+        if hp_lost > 0:
+            self._hp_losses.append((current_time, hp_lost))
+        while self._hp_losses and current_time - self._hp_losses[0][0] > window:
+            self._hp_losses.popleft()
+
+        self._current_dps = sum(lost for _, lost in self._hp_losses) / window if window > 0 else 0.0
+        self._last_hp = player.stats.health
 
     # ------------------------------------------------------------------
     # Decisao de cura
@@ -202,10 +204,11 @@ class HealingScript(BaseScript):
     def _execute_heal(self, player: Player, bot_engine, heal_type: str) -> bool:
         """
         Executa o heal selecionado via bot_engine.cast_spell() (método público).
+        False se o cooldown global (compartilhado com a HealingLane) bloqueou.
         """
         try:
-            bot_engine.cast_spell(heal_type)
-            return True
+            # Prioridade do script: cura fura a fila do InputDispatcher
+            return bot_engine.cast_spell(heal_type, priority=self.priority) is not False
         except Exception as e:
             self._log.error(f"Erro ao casting {heal_type}: {e}")
             return False
@@ -8,6 +8,9 @@ from .base_script import BaseScript
 from src.core.entities.player import Player
 from src.core.entities.creature import Creature
 
+# Tempo para o cliente abrir o menu do corpse antes da hotkey de loot
+_CLICK_SETTLE_DELAY = 0.15
+
 
 class LooterScript(BaseScript):
     """Script de auto-loot com sistema de tracking de kills e loot."""
@@ -15,6 +18,7 @@ class LooterScript(BaseScript):
     def __init__(self):
         super().__init__("Looter")
         self.priority = 20
+        self.interval = 0.3
         self.config = {
             "enabled": False,
             "loot_radius": 3,           # SQMs ao redor para procurar corpses
@@ -170,17 +174,17 @@ class LooterScript(BaseScript):
             sx, sy = inj.tile_to_screen(tx, ty, px, py)
             self._log.info(f"Clique no tile ({tx},{ty}) -> tela ({sx},{sy})")
             inj.send_mouse_click(sx, sy)
-            time.sleep(0.15)
 
-            # Passo 2: se usar hotkey, envia depois do clique
+            # Passo 2: se usar hotkey, envia depois do clique (o dispatcher
+            # espera os 150ms fora da thread do tick)
             if self.config["use_hotkey_loot"]:
-                inj.send_hotkey(self.config["loot_hotkey"])
+                inj.send_hotkey(self.config["loot_hotkey"], delay=_CLICK_SETTLE_DELAY)
                 self._log.info(f"Loot hotkey em ({tx},{ty})")
                 return True
 
             # Passo 3: se nao, tenta abrir corpse com hotkey dedicada
             if self.config["open_corpses"]:
-                inj.send_hotkey(self.config["open_corpse_hotkey"])
+                inj.send_hotkey(self.config["open_corpse_hotkey"], delay=_CLICK_SETTLE_DELAY)
                 self._log.info(f"Abrindo corpse em ({tx},{ty})")
                 return True
 
@@ -76,6 +76,7 @@ class PersistentScript(BaseScript):
     def __init__(self):
         super().__init__("Persistent")
         self.priority = 40
+        self.interval = 0.5
         self.config = {
             "rules": [],
         }
@@ -134,20 +135,17 @@ class PersistentScript(BaseScript):
 
         try:
             if at == "cast":
-                bot_engine.cast_spell(ap.get("spell", ""))
-                return True
+                return bot_engine.cast_spell(ap.get("spell", "")) is not False
             if at == "say":
                 bot_engine.injector.say(ap.get("text", ""))
                 return True
             if at == "hotkey":
-                bot_engine.injector.send_hotkey(ap.get("key", "F1"))
-                return True
+                return bot_engine.use_hotkey(ap.get("key", "F1"), group=ap.get("group")) is not False
             if at == "log":
                 self._log.info(f"[Persistent] {ap.get('message', '')}")
                 return True
             if at == "use_item":
-                bot_engine.injector.send_hotkey(ap.get("hotkey", "F1"))
-                return True
+                return bot_engine.use_hotkey(ap.get("hotkey", "F1"), group="rune") is not False
             if at == "pause_cavebot":
                 script = bot_engine.script_engine.get_script("CaveBot")
                 if script:
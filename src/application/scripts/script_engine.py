@@ -1,6 +1,9 @@
+import heapq
+import itertools
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from .base_script import BaseScript
+from src.application.tick_profiler import TickProfiler
 from src.infrastructure.logging.logger import get_logger
 
 # Prioridade minima para considerar um script como "critico".
@@ -10,20 +13,42 @@ _PREEMPT_THRESHOLD = 90
 
 
 class ScriptEngine:
-    """Motor de execucao de scripts."""
+    """
+    Motor de execucao de scripts.
+
+    Cada script roda no seu proprio periodo (BaseScript.interval): um heap
+    de timers (proximo vencimento, seq, script) diz quais estao devidos no
+    tick; so esses executam, em ordem de prioridade. Entradas antigas do
+    heap (script reagendado ou removido) sao descartadas ao sair dele.
+    """
 
     def __init__(self):
         self._scripts: List[BaseScript] = []
         self._log = get_logger("ScriptEngine")
+        self._heap: List[Tuple[float, int, BaseScript]] = []
+        # id(script) -> (vencimento, seq) da unica entrada valida no heap
+        self._due: Dict[int, Tuple[float, int]] = {}
+        self._seq = itertools.count()
+        # TickProfiler opcional (injetado pelo BotEngine): tempo por script.
+        self.profiler: Optional[TickProfiler] = None
+
+    @property
+    def scripts(self) -> List[BaseScript]:
+        """Scripts registrados, em ordem de prioridade."""
+        return list(self._scripts)
 
     def register(self, script: BaseScript) -> None:
         """Registra um script."""
         self._scripts.append(script)
         self._scripts.sort(key=lambda s: s.priority, reverse=True)
+        self._schedule(script, 0.0)
         self._log.info(f"Script '{script.name}' registrado (prioridade: {script.priority})")
 
     def unregister(self, script_name: str) -> None:
         """Remove um script."""
+        for script in self._scripts:
+            if script.name == script_name:
+                self._due.pop(id(script), None)
         self._scripts = [s for s in self._scripts if s.name != script_name]
         self._log.info(f"Script '{script_name}' removido.")
 
@@ -32,6 +57,7 @@ class ScriptEngine:
         for script in self._scripts:
             if script.name == script_name:
                 script.enabled = True
+                self._schedule(script, 0.0)  # roda no proximo tick
                 script.on_enable()
                 return True
         return False
@@ -45,32 +71,89 @@ class ScriptEngine:
                 return True
         return False
 
-    def execute_all(self, context: Dict[str, Any]) -> None:
+    # ------------------------------------------------------------------
+    # Agendamento
+    # ------------------------------------------------------------------
+
+    def _schedule(self, script: BaseScript, due: float) -> None:
+        """Reagenda `script`; a entrada anterior dele no heap fica obsoleta."""
+        seq = next(self._seq)
+        self._due[id(script)] = (due, seq)
+        heapq.heappush(self._heap, (due, seq, script))
+
+    def _pop_due(self, now: float) -> List[Tuple[float, BaseScript]]:
+        """Remove do heap os scripts vencidos ate `now` (ordem de prioridade)."""
+        heap, due = self._heap, []
+        while heap and heap[0][0] <= now:
+            at, seq, script = heapq.heappop(heap)
+            if self._due.get(id(script)) == (at, seq):
+                due.append((at, script))
+        # sort estavel: mesma ordem de self._scripts entre prioridades iguais
+        order = {id(s): i for i, s in enumerate(self._scripts)}
+        due.sort(key=lambda item: order.get(id(item[1]), len(order)))
+        return due
+
+    def due_scripts(self, now: Optional[float] = None) -> List[BaseScript]:
+        """Scripts habilitados que estao devidos em `now` (sem consumir o heap)."""
+        now = time.monotonic() if now is None else now
+        return [
+            s for s in self._scripts
+            if s.enabled and not s.detached and self._due.get(id(s), (0.0, 0))[0] <= now
+        ]
+
+    def needs_creatures(self, now: Optional[float] = None) -> bool:
+        """True se algum script devido em `now` usa criaturas."""
+        return any(s.needs_creatures for s in self.due_scripts(now))
+
+    def next_due(self) -> Optional[float]:
+        """Instante (time.monotonic) do proximo script habilitado a vencer."""
+        pending = [
+            self._due[id(s)][0] for s in self._scripts
+            if s.enabled and not s.detached and id(s) in self._due
+        ]
+        return min(pending) if pending else None
+
+    def execute_all(self, context: Dict[str, Any], now: Optional[float] = None) -> None:
         """
-        Executa todos os scripts habilitados em ordem de prioridade.
+        Executa, em ordem de prioridade, os scripts habilitados devidos em
+        `now` (time.monotonic) e os reagenda pelo seu `interval`.
 
         BUG #5 FIX: preempcao por prioridade critica.
         Se um script com prioridade >= _PREEMPT_THRESHOLD executar uma acao
         (retornar True), scripts de prioridade menor nao sao executados no
         mesmo tick. Isso garante que HealingScript (100) tem precedencia total
         sobre AimbotScript (50) e CavebotScript (30) quando curar e necessario.
+        Scripts preemptados continuam devidos e rodam no tick seguinte.
         """
+        now = time.monotonic() if now is None else now
         critical_acted = False
+        profiler = self.profiler if self.profiler is not None and self.profiler.enabled else None
 
-        for script in self._scripts:
-            if not script.enabled:
+        for at, script in self._pop_due(now):
+            # Proximo vencimento mantem a cadencia; se atrasou, conta de agora.
+            nxt = at + script.interval
+            if nxt <= now:
+                nxt = now + script.interval
+
+            if not script.enabled or script.detached:
+                self._schedule(script, nxt)
                 continue
 
             # BUG #5: se ja houve acao critica, pula scripts nao-criticos
             if critical_acted and script.priority < _PREEMPT_THRESHOLD:
+                self._schedule(script, now)
                 continue
 
+            start = time.perf_counter()
             try:
                 executed = script.execute(context)
                 if executed and script.priority >= _PREEMPT_THRESHOLD:
                     critical_acted = True
             except Exception as e:
                 self._log.error(f"Erro no script '{script.name}': {e}", exc_info=True)
+            if profiler:
+                profiler.record(f"script:{script.name}", time.perf_counter() - start)
+            self._schedule(script, nxt)
 
     def get_script(self, name: str) -> BaseScript | None:
         """Retorna script pelo nome."""
@@ -86,6 +169,7 @@ class ScriptEngine:
                 "name": s.name,
                 "enabled": s.enabled,
                 "priority": s.priority,
+                "interval": s.interval,
             }
             for s in self._scripts
         ]
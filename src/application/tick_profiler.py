@@ -0,0 +1,98 @@
+"""
+TickProfiler - tempo por fase do tick do BotEngine.
+
+Cada fase ("tick", "update_state", "process_events", "run_scripts" e
+"script:<nome>" para cada script do ScriptEngine) guarda as ultimas
+`capacity` amostras num ring buffer de tamanho fixo. snapshot() calcula
+p50/p95/p99 sobre a janela; export() grava o snapshot em JSON.
+"""
+import json
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+DEFAULT_CAPACITY = 1024
+
+
+class _Ring:
+    """Ring buffer de duracoes (segundos) com tamanho fixo."""
+
+    __slots__ = ("samples", "index", "count", "total")
+
+    def __init__(self, capacity: int) -> None:
+        self.samples = np.zeros(capacity, dtype=np.float64)
+        self.index = 0
+        self.count = 0
+        self.total = 0  # amostras desde o reset (inclusive as ja sobrescritas)
+
+    def add(self, seconds: float) -> None:
+        self.samples[self.index] = seconds
+        self.index = (self.index + 1) % len(self.samples)
+        if self.count < len(self.samples):
+            self.count += 1
+        self.total += 1
+
+    def window(self) -> np.ndarray:
+        return self.samples[: self.count] if self.count < len(self.samples) else self.samples
+
+    def last(self) -> float:
+        return float(self.samples[self.index - 1]) if self.count else 0.0
+
+
+class TickProfiler:
+    """Janela deslizante de duracoes por fase, com percentis sob demanda."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.enabled = True
+        self._phases: Dict[str, _Ring] = {}
+
+    def record(self, phase: str, seconds: float) -> None:
+        """Registra a duracao de uma fase (em segundos)."""
+        ring = self._phases.get(phase)
+        if ring is None:
+            ring = self._phases[phase] = _Ring(self.capacity)
+        ring.add(seconds)
+
+    def phase_stats(self, phase: str) -> Optional[Dict[str, Any]]:
+        """Estatisticas (ms) da janela de uma fase; None se nao houver amostras."""
+        ring = self._phases.get(phase)
+        if ring is None or not ring.count:
+            return None
+        window = ring.window() * 1000.0
+        p50, p95, p99 = np.percentile(window, [50, 95, 99])
+        return {
+            "samples": ring.count,
+            "total": ring.total,
+            "last_ms": ring.last() * 1000.0,
+            "mean_ms": float(window.mean()),
+            "p50_ms": float(p50),
+            "p95_ms": float(p95),
+            "p99_ms": float(p99),
+            "max_ms": float(window.max()),
+        }
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """{fase: estatisticas}, fases mais caras (p95) primeiro."""
+        stats = {phase: self.phase_stats(phase) for phase in self._phases}
+        stats = {phase: s for phase, s in stats.items() if s is not None}
+        return dict(sorted(stats.items(), key=lambda item: item[1]["p95_ms"], reverse=True))
+
+    def export(self, path: str, include_samples: bool = False) -> None:
+        """Grava o snapshot (e, opcionalmente, as amostras da janela) em JSON."""
+        data: Dict[str, Any] = {
+            "timestamp": time.time(),
+            "capacity": self.capacity,
+            "phases": self.snapshot(),
+        }
+        if include_samples:
+            data["samples_ms"] = {
+                phase: (ring.window() * 1000.0).round(4).tolist()
+                for phase, ring in self._phases.items()
+            }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def reset(self) -> None:
+        self._phases.clear()
@@ -0,0 +1,96 @@
+"""
+Grupos de exhaust de magias e runas do Tibia 8.60.
+
+Servidores 8.60 (TFS 0.3.x) tem tres exhausts independentes:
+  - "attack":  magias agressivas (exori/exevo...)              -> 2s
+  - "healing": magias nao agressivas, cura e suporte
+               (exura, utani hur, utamo vita...)               -> 1s
+  - "rune":    runas e itens usados por hotkey (potions, SD)   -> 1s
+
+Uma acao do mesmo grupo dentro da janela e recusada pelo servidor
+("You are exhausted."); grupos diferentes nao se bloqueiam.
+"""
+from typing import Dict, Optional
+
+EXHAUST_SECONDS: Dict[str, float] = {
+    "attack": 2.0,
+    "healing": 1.0,
+    "rune": 1.0,
+}
+
+# Palavras magicas conhecidas -> grupo de exhaust
+SPELL_GROUPS: Dict[str, str] = {
+    # Cura
+    "exura": "healing",
+    "exura gran": "healing",
+    "exura vita": "healing",
+    "exura san": "healing",
+    "exura ico": "healing",
+    "exura gran mas res": "healing",
+    "exura sio": "healing",
+    "exana pox": "healing",
+    "exana flam": "healing",
+    "exana vis": "healing",
+    "exana mort": "healing",
+    # Suporte (mesmo exhaust da cura no 8.60)
+    "utani hur": "healing",
+    "utani gran hur": "healing",
+    "utamo vita": "healing",
+    "utana vid": "healing",
+    "utevo lux": "healing",
+    "utevo gran lux": "healing",
+    "utevo vis lux": "healing",
+    "utito tempo": "healing",
+    "utito tempo san": "healing",
+    "utamo tempo": "healing",
+    "utamo tempo san": "healing",
+    "utani tempo hur": "healing",
+    # Ataque
+    "exori": "attack",
+    "exori gran": "attack",
+    "exori mas": "attack",
+    "exori ico": "attack",
+    "exori hur": "attack",
+    "exori flam": "attack",
+    "exori vis": "attack",
+    "exori tera": "attack",
+    "exori frigo": "attack",
+    "exori mort": "attack",
+    "exori san": "attack",
+    "exori con": "attack",
+    "exori infir vis": "attack",
+    "exevo flam hur": "attack",
+    "exevo frigo hur": "attack",
+    "exevo vis hur": "attack",
+    "exevo tera hur": "attack",
+    "exevo vis lux": "attack",
+    "exevo gran vis lux": "attack",
+    "exevo gran mas flam": "attack",
+    "exevo gran mas vis": "attack",
+    "exevo gran mas frigo": "attack",
+    "exevo gran mas tera": "attack",
+    "exevo mas san": "attack",
+}
+
+# Prefixos para palavras fora da tabela
+_PREFIX_GROUPS = (
+    ("exori", "attack"),
+    ("exevo", "attack"),
+    ("exura", "healing"),
+    ("exana", "healing"),
+    ("uta", "healing"),
+    ("ute", "healing"),
+    ("uti", "healing"),
+)
+
+
+def spell_group(words: str) -> Optional[str]:
+    """Grupo de exhaust das palavras magicas; None se nao for magia conhecida."""
+    key = " ".join(words.lower().split())
+    group = SPELL_GROUPS.get(key)
+    if group is not None:
+        return group
+    for prefix, group in _PREFIX_GROUPS:
+        if key.startswith(prefix):
+            return group
+    return None
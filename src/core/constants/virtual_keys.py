@@ -0,0 +1,12 @@
+"""
+Codigos de tecla virtual (VK_*) do Windows usados pelo bot.
+
+Valores fixos da WinAPI (winuser.h), iguais aos de win32con; ficam aqui
+para que walker e scripts nao dependam do pywin32 so por constantes
+(simulador e testes rodam em Linux).
+"""
+
+VK_LEFT = 0x25
+VK_UP = 0x26
+VK_RIGHT = 0x27
+VK_DOWN = 0x28
@@ -0,0 +1,102 @@
+"""
+Visao colunar (NumPy) das criaturas de um tick.
+
+A linha i de `rows` corresponde a `creatures[i]`. Consultas de distancia,
+filtros de alcance e selecao por HP viram operacoes vetorizadas sobre as
+colunas, em vez de loops Python por objeto (hunts com 30+ monstros).
+"""
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.entities.creature import Creature
+from src.core.value_objects.position import Position
+
+# Colunas da tabela (hp_bar ja limitado a 0..100, como Creature.stats.health).
+CREATURE_TABLE_DTYPE = np.dtype([
+    ("id", "<u4"),
+    ("x", "<i4"),
+    ("y", "<i4"),
+    ("z", "<i4"),
+    ("hp_bar", "<i4"),
+    ("walking", "<i4"),
+    ("visible", "<i4"),
+    ("direction", "<i4"),
+    ("walk_speed", "<i4"),
+])
+
+
+class CreatureTable:
+    """Array estruturado de criaturas alinhado com a tupla de Creature."""
+
+    __slots__ = ("rows", "creatures")
+
+    def __init__(self, rows: np.ndarray, creatures: Sequence[Creature]):
+        self.rows = rows
+        self.creatures: Tuple[Creature, ...] = tuple(creatures)
+
+    @classmethod
+    def empty(cls) -> "CreatureTable":
+        return cls(np.zeros(0, dtype=CREATURE_TABLE_DTYPE), ())
+
+    @classmethod
+    def from_creatures(cls, creatures: Iterable[Creature]) -> "CreatureTable":
+        """Monta a tabela a partir de entidades (sem snapshot da BattleList)."""
+        creatures = tuple(creatures)
+        rows = np.fromiter(
+            (
+                (c.id & 0xFFFFFFFF, c.position.x, c.position.y, c.position.z,
+                 c.stats.health, int(c.walking), int(c.visible), 0, 0)
+                for c in creatures
+            ),
+            dtype=CREATURE_TABLE_DTYPE,
+            count=len(creatures),
+        )
+        return cls(rows, creatures)
+
+    def __len__(self) -> int:
+        return len(self.creatures)
+
+    def subset(self, indices) -> "CreatureTable":
+        """Nova tabela com as linhas `indices` (mantem o alinhamento)."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return CreatureTable(self.rows[indices], [self.creatures[i] for i in indices])
+
+    # ------------------------------------------------------------------
+    # Consultas vetorizadas
+    # ------------------------------------------------------------------
+
+    def distances(self, position: Position) -> np.ndarray:
+        """Distancia de Chebyshev 3D ate `position` (mesma regra de Position)."""
+        rows = self.rows
+        return np.maximum(
+            np.maximum(np.abs(rows["x"] - position.x), np.abs(rows["y"] - position.y)),
+            np.abs(rows["z"] - position.z),
+        )
+
+    def within(self, position: Position, max_distance: int) -> np.ndarray:
+        """Mascara das criaturas a no maximo `max_distance` de `position`."""
+        return self.distances(position) <= max_distance
+
+    def closest(self, position: Position) -> Optional[Creature]:
+        if not self.creatures:
+            return None
+        return self.creatures[int(np.argmin(self.distances(position)))]
+
+    def lowest_hp(self, mask: Optional[np.ndarray] = None) -> Optional[Creature]:
+        """Criatura com menor hp_bar (primeira em caso de empate)."""
+        hp = self.rows["hp_bar"]
+        if mask is not None:
+            candidates = np.flatnonzero(mask)
+            if candidates.size == 0:
+                return None
+            return self.creatures[int(candidates[np.argmin(hp[candidates])])]
+        if not self.creatures:
+            return None
+        return self.creatures[int(np.argmin(hp))]
+
+    def best(self, scores: np.ndarray) -> Optional[Creature]:
+        """Criatura de maior score (primeira em caso de empate)."""
+        if not self.creatures:
+            return None
+        return self.creatures[int(np.argmax(scores))]
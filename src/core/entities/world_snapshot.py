@@ -0,0 +1,147 @@
+"""
+Snapshot imutavel do mundo lido em um tick.
+
+Um WorldSnapshot e criado uma vez por tick (WorldReader) e compartilhado
+sem copia entre scripts, camada de eventos e a thread da UI: todos os
+campos sao somente leitura (`__slots__` + __setattr__ bloqueado), as
+criaturas sao uma tupla e o indice por id e um MappingProxyType.
+
+O snapshot tambem e o contexto dos scripts: context.get("player"),
+context["creatures"], context.get("bot_engine")... resolvem para os
+campos abaixo, sem montar um dict novo por tick.
+
+`previous` guarda so um nivel de historico: o snapshot anterior e
+referenciado ja sem o `previous` dele, para a cadeia nao crescer a cada
+tick.
+"""
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from src.core.entities.player import Player
+from src.core.entities.creature import Creature
+from src.core.entities.creature_table import CreatureTable
+from src.core.value_objects.target_state import TargetState
+
+_EMPTY_INDEX: Mapping[int, Creature] = MappingProxyType({})
+
+# Chave do contexto de script -> atributo do snapshot
+_CONTEXT_KEYS = {
+    "player": "player",
+    "creatures": "creatures",
+    "creature_table": "table",
+    "target": "target",
+    "bot_engine": "engine",
+    "tick": "tick",
+    "timestamp": "timestamp",
+    "previous": "previous",
+}
+
+
+class WorldSnapshot:
+    """Player, criaturas da BattleList e estado de target de um tick."""
+
+    __slots__ = (
+        "tick",
+        "timestamp",
+        "player",
+        "creatures",
+        "by_id",
+        "target",
+        "table",
+        "previous",
+        "creatures_fresh",
+        "engine",
+    )
+
+    def __init__(
+        self,
+        player: Optional[Player],
+        creatures: Tuple[Creature, ...] = (),
+        target: Optional[TargetState] = None,
+        table: Optional[CreatureTable] = None,
+        tick: int = 0,
+        timestamp: float = 0.0,
+        previous: Optional["WorldSnapshot"] = None,
+        by_id: Optional[Mapping[int, Creature]] = None,
+        creatures_fresh: bool = True,
+        engine: Any = None,
+    ):
+        """
+        Args:
+            by_id: indice id -> criatura ja pronto (ex.: reaproveitado do
+                snapshot anterior quando as criaturas sao as mesmas);
+                None monta a partir de `creatures`.
+            creatures_fresh: False quando a BattleList nao foi lida neste
+                tick e as criaturas vem do snapshot anterior.
+            engine: quem produziu o snapshot (BotEngine), exposto aos
+                scripts como context["bot_engine"].
+        """
+        creatures = tuple(creatures)
+        if by_id is None:
+            by_id = (
+                MappingProxyType({c.id: c for c in creatures}) if creatures else _EMPTY_INDEX
+            )
+        if previous is not None and previous.previous is not None:
+            previous = previous.detached()
+
+        init = object.__setattr__
+        init(self, "tick", tick)
+        init(self, "timestamp", timestamp)
+        init(self, "player", player)
+        init(self, "creatures", creatures)
+        init(self, "by_id", by_id)
+        init(self, "target", TargetState() if target is None else target)
+        init(self, "table", CreatureTable.empty() if table is None else table)
+        init(self, "previous", previous)
+        init(self, "creatures_fresh", creatures_fresh)
+        init(self, "engine", engine)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"WorldSnapshot e imutavel: '{name}'")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"WorldSnapshot e imutavel: '{name}'")
+
+    def __repr__(self) -> str:
+        return (
+            f"WorldSnapshot(tick={self.tick}, player={self.player!r}, "
+            f"creatures={len(self.creatures)})"
+        )
+
+    def detached(self) -> "WorldSnapshot":
+        """Copia rasa sem `previous` (os campos sao compartilhados)."""
+        return WorldSnapshot(
+            self.player,
+            self.creatures,
+            self.target,
+            self.table,
+            tick=self.tick,
+            timestamp=self.timestamp,
+            by_id=self.by_id,
+            creatures_fresh=self.creatures_fresh,
+            engine=self.engine,
+        )
+
+    def creature(self, creature_id: int) -> Optional[Creature]:
+        return self.by_id.get(creature_id)
+
+    # ------------------------------------------------------------------
+    # Acesso como contexto de script (somente leitura)
+    # ------------------------------------------------------------------
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "world":
+            return self
+        try:
+            return getattr(self, _CONTEXT_KEYS[key])
+        except KeyError:
+            raise KeyError(key) from None
+
+    def __contains__(self, key: object) -> bool:
+        return key == "world" or key in _CONTEXT_KEYS
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
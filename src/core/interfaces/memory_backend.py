@@ -0,0 +1,77 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence, Tuple
+
+from src.core.exceptions.memory_exceptions import MemoryReadError
+
+
+class IMemoryBackend(ABC):
+    """
+    Contrato de acesso cru a memoria de um processo.
+
+    ProcessManager, MemoryReader e MemoryWriter delegam a este backend;
+    enderecos sao inteiros absolutos e buffers sao bytearray/memoryview
+    gravaveis do chamador.
+    """
+
+    @abstractmethod
+    def find_process(self, process_name: str) -> Optional[int]:
+        """PID do primeiro processo com esse nome, ou None."""
+        ...
+
+    @abstractmethod
+    def open(self, pid: int) -> bool:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+    @property
+    @abstractmethod
+    def is_open(self) -> bool:
+        ...
+
+    @property
+    def handle(self) -> Optional[int]:
+        """Identificador do processo aberto (HANDLE no Windows, PID no Linux)."""
+        return None
+
+    def begin_tick(self) -> None:
+        """Marca o inicio de um tick do BotEngine (gravacao/replay usam)."""
+        return None
+
+    def module_base(self, module_name: str) -> Optional[int]:
+        """Endereco onde o modulo foi mapeado, se o backend souber descobrir."""
+        return None
+
+    @abstractmethod
+    def read_into(self, address: int, buffer) -> int:
+        """
+        Le len(buffer) bytes de `address` em `buffer`. Retorna quantos bytes
+        foram lidos (pode ser menos que o pedido); levanta MemoryReadError se
+        nada pode ser lido.
+        """
+        ...
+
+    def read(self, address: int, size: int) -> bytes:
+        buf = bytearray(size)
+        got = self.read_into(address, buf)
+        return bytes(buf[:got])
+
+    def read_scatter(self, requests: Sequence[Tuple[int, object]]) -> List[int]:
+        """
+        Le varias faixas (endereco, buffer) de uma vez. Retorna os bytes
+        lidos por faixa (0 = falhou). Backends que suportam leitura
+        vetorizada fazem tudo em uma syscall; o padrao le uma a uma.
+        """
+        counts = []
+        for address, buffer in requests:
+            try:
+                counts.append(self.read_into(address, buffer))
+            except MemoryReadError:
+                counts.append(0)
+        return counts
+
+    @abstractmethod
+    def write(self, address: int, data: bytes) -> bool:
+        ...
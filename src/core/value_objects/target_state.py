@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class TargetState:
+    """
+    Estado de targeting do cliente (red square) lido de TARGET.
+
+    O cliente 8.60 guarda id e tipo no mesmo DWORD: id nos 24 bits baixos,
+    tipo (0=nenhum, 1=attack, 2=follow) no byte alto.
+    """
+    creature_id: int = 0
+    mode: int = 0
+    battle_slot: int = -1
+
+    @staticmethod
+    def from_dwords(target_dword: int, battlelist_dword: int) -> "TargetState":
+        slot_plus_one = battlelist_dword & 0x00FFFFFF
+        return TargetState(
+            creature_id=target_dword & 0x00FFFFFF,
+            mode=(target_dword >> 24) & 0xFF,
+            battle_slot=slot_plus_one - 1 if slot_plus_one else -1,
+        )
+
+    def has_target(self) -> bool:
+        return self.mode != 0 and self.creature_id != 0
@@ -0,0 +1,255 @@
+"""
+InputDispatcher - fila de comandos de input com worker dedicado.
+
+O KeyboardInjector dorme entre as mensagens (35ms entre KEYDOWN/KEYUP,
+100ms entre o ENTER e o texto de uma magia); chamado direto pelos scripts,
+cada sleep bloqueava a thread do BotEngine. O dispatcher embrulha qualquer
+ICommandInjector: os metodos enfileiram o comando e retornam na hora, e uma
+thread propria executa a fila respeitando o ritmo.
+
+Cada comando e uma sequencia de passos (atraso, metodo do injector, args).
+O primeiro passo vence em `agora + atraso`; os seguintes, `atraso` depois
+do passo anterior ter sido enviado. Entre os comandos vencidos o worker
+escolhe o de maior prioridade (cura antes de ataque). Um passo com `ttl`
+que so pode ser enviado mais de `ttl` segundos apos vencer e descartado
+(ex.: passo de walk que ficou velho). Um comando com `key` igual ao de
+outro ainda na fila nao e enfileirado de novo (submit retorna False).
+
+Sem start() (simulador, benchmark) o dispatcher e sincrono: os passos
+rodam na hora, ignorando os atrasos.
+"""
+import heapq
+import itertools
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from src.core.interfaces.injector_interface import ICommandInjector
+from src.infrastructure.logging.logger import get_logger
+
+# (atraso antes do passo em segundos, nome do metodo do injector, args)
+Step = Tuple[float, str, tuple]
+
+
+class _Command:
+    """Sequencia de passos enfileirada de uma vez."""
+
+    __slots__ = ("steps", "index", "priority", "ttl", "due", "key")
+
+    def __init__(
+        self, steps: List[Step], priority: int, ttl: Optional[float], now: float,
+        key: Optional[Hashable],
+    ):
+        self.steps = steps
+        self.index = 0
+        self.priority = priority
+        self.ttl = ttl
+        self.due = now + steps[0][0]
+        self.key = key
+
+
+class InputDispatcher(ICommandInjector):
+    """ICommandInjector nao bloqueante: fila com timestamp + worker."""
+
+    def __init__(self, injector: ICommandInjector, clock: Callable[[], float] = time.monotonic):
+        self._inner = injector
+        self._clock = clock
+        self._log = get_logger("InputDispatcher")
+        self._cond = threading.Condition()
+        self._timers: List[Tuple[float, int, _Command]] = []  # (vencimento, seq, cmd)
+        self._ready: List[Tuple[int, int, _Command]] = []     # (-prioridade, seq, cmd)
+        self._keys: Dict[Hashable, _Command] = {}             # comandos com key na fila
+        self._seq = itertools.count()
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+        self._busy = False
+        # sent / dropped / errors, e lag_ms (soma do atraso real apos vencer)
+        self.stats: Counter = Counter()
+
+    # ------------------------------------------------------------------
+    # Ciclo de vida
+    # ------------------------------------------------------------------
+
+    @property
+    def inner(self) -> ICommandInjector:
+        """Injector embrulhado (KeyboardInjector, SimulatedInjector...)."""
+        return self._inner
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Comandos na fila (aguardando ou prontos), sem o em execucao."""
+        with self._cond:
+            return len(self._timers) + len(self._ready)
+
+    def start(self) -> None:
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._worker, daemon=True, name="InputDispatcher")
+        self._thread.start()
+
+    def stop(self, timeout: float = 1.0) -> None:
+        """Para o worker e descarta a fila."""
+        with self._cond:
+            self._running = False
+            self._timers.clear()
+            self._ready.clear()
+            self._keys.clear()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def flush(self, timeout: float = 2.0) -> bool:
+        """Espera a fila esvaziar; False se estourar o timeout."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._running and (self._timers or self._ready or self._busy):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    # ------------------------------------------------------------------
+    # Fila
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        steps: Sequence[Step],
+        priority: int = 0,
+        ttl: Optional[float] = None,
+        key: Optional[Hashable] = None,
+    ) -> bool:
+        """
+        Enfileira uma sequencia de passos e retorna imediatamente.
+
+        Args:
+            steps: [(atraso, metodo, args), ...] executados em ordem.
+            priority: maior = sai primeiro entre os comandos vencidos.
+            ttl: descarta o passo se ele so puder sair `ttl`s apos vencer.
+            key: identidade do comando; se um com a mesma key ainda esta na
+                fila, este e descartado (duplicata).
+
+        Returns:
+            False se o comando foi descartado como duplicata.
+        """
+        if not steps:
+            return False
+        if not self._running:
+            for _, name, args in steps:
+                self._call(name, args)
+            return True
+        cmd = _Command(list(steps), priority, ttl, self._clock(), key)
+        with self._cond:
+            if key is not None:
+                if key in self._keys:
+                    return False
+                self._keys[key] = cmd
+            heapq.heappush(self._timers, (cmd.due, next(self._seq), cmd))
+            self._cond.notify_all()
+        return True
+
+    def is_queued(self, key: Hashable) -> bool:
+        """True se um comando com esta key ainda esta na fila (ou em execucao)."""
+        with self._cond:
+            return key in self._keys
+
+    def _call(self, name: str, args: tuple) -> None:
+        try:
+            getattr(self._inner, name)(*args)
+            self.stats["sent"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            self._log.error(f"Comando {name}{args} falhou: {e}")
+
+    def _next_ready(self) -> Optional[_Command]:
+        """Bloqueia ate haver um comando vencido (None se parado). Com o lock."""
+        while self._running:
+            now = self._clock()
+            while self._timers and self._timers[0][0] <= now:
+                _, seq, cmd = heapq.heappop(self._timers)
+                heapq.heappush(self._ready, (-cmd.priority, seq, cmd))
+            if self._ready:
+                return heapq.heappop(self._ready)[2]
+            self._cond.wait(self._timers[0][0] - now if self._timers else None)
+        return None
+
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                cmd = self._next_ready()
+                if cmd is None:
+                    return
+                self._busy = True
+
+            _, name, args = cmd.steps[cmd.index]
+            lag = self._clock() - cmd.due
+            if cmd.ttl is not None and lag > cmd.ttl:
+                self.stats["dropped"] += 1
+                cmd.index = len(cmd.steps)  # sequencia velha: descarta o resto
+            else:
+                self.stats["lag_ms"] += lag * 1000.0
+                self._call(name, args)
+                cmd.index += 1
+
+            with self._cond:
+                self._busy = False
+                if self._running and cmd.index < len(cmd.steps):
+                    cmd.due = self._clock() + cmd.steps[cmd.index][0]
+                    heapq.heappush(self._timers, (cmd.due, next(self._seq), cmd))
+                elif cmd.key is not None and self._keys.get(cmd.key) is cmd:
+                    del self._keys[cmd.key]
+                self._cond.notify_all()
+
+    # ------------------------------------------------------------------
+    # ICommandInjector (enfileiram e retornam na hora)
+    # ------------------------------------------------------------------
+
+    def cast_spell(self, spell_words: str, delay: float = 0.0, priority: int = 0) -> None:
+        self.submit([(delay, "cast_spell", (spell_words,))], priority)
+
+    def say(self, text: str, delay: float = 0.0) -> None:
+        self.submit([(delay, "say", (text,))])
+
+    def send_hotkey(self, key: str, delay: float = 0.0, priority: int = 0) -> bool:
+        self.submit([(delay, "send_hotkey", (key,))], priority)
+        return True
+
+    def send_key_background(
+        self, vk_code: int, delay: float = 0.0, priority: int = 0, ttl: Optional[float] = None
+    ) -> bool:
+        self.submit([(delay, "send_key_background", (vk_code,))], priority, ttl)
+        return True
+
+    def send_mouse_click(self, client_x: int, client_y: int, delay: float = 0.0) -> bool:
+        self.submit([(delay, "send_mouse_click", (client_x, client_y))])
+        return True
+
+    def click_tile(self, tile_x: int, tile_y: int, player_x: int, player_y: int,
+                   offset_x: int = 0, offset_y: int = 0) -> bool:
+        self.submit([(0.0, "click_tile", (tile_x, tile_y, player_x, player_y, offset_x, offset_y))])
+        return True
+
+    def focus_client(self) -> bool:
+        self.submit([(0.0, "focus_client", ())])
+        return True
+
+    # Consultas sincronas: nao enviam input
+    def tile_to_screen(self, *args, **kwargs) -> tuple:
+        return self._inner.tile_to_screen(*args, **kwargs)
+
+    def set_process_id(self, process_id) -> None:
+        self._inner.set_process_id(process_id)
+
+    def __getattr__(self, name: str) -> Any:
+        # Demais atributos (get_client_size, _hwnd...) vem do injector real.
+        if name == "_inner":
+            raise AttributeError(name)
+        return getattr(self._inner, name)
@@ -21,19 +21,23 @@ Diagnostico historico:
 
 Arquitetura:
   walk_to(current, destination) calcula dx/dy, mapeia para arrow keys e
-  delega para self._injector.send_key_background(vk). O injector usa
-  PostMessage para enviar ao HWND do processo alvo.
+  enfileira a sequencia no InputDispatcher do BotEngine (submit), que
+  envia send_key_background(vk) na thread dele - a diagonal espera os
+  30ms entre as setas fora da thread do tick. O injector usa PostMessage
+  para enviar ao HWND do processo alvo.
   Antes de cada tecla de movimento, envia VK_ESCAPE para fechar o chat.
 """
 import time
 from typing import Optional
 
-import win32con
-
+from src.core.constants.virtual_keys import VK_DOWN, VK_LEFT, VK_RIGHT, VK_UP
 from src.core.value_objects.position import Position
+from src.infrastructure.injection.input_dispatcher import InputDispatcher
 from src.infrastructure.logging.logger import get_logger
 
 _DIAGONAL_DELAY = 0.030
+# Passo que nao sai em ate 0.5s apos vencer e descartado (posicao ja mudou).
+_STEP_TTL = 0.5
 
 # Mapa (dx, dy) -> lista de VK codes (arrow keys)
 # Tibia 8.60: arrow keys movem o personagem quando o chat esta fechado.
@@ -41,14 +45,14 @@ _DIAGONAL_DELAY = 0.030
 # estivesse aberto, ou dependeriam de GetKeyState(VK_NUMLOCK).
 # Arrow keys nao tem essa dependencia.
 _DIR_TO_VK = {
-    ( 0, -1): [win32con.VK_UP],          # Norte
-    ( 0,  1): [win32con.VK_DOWN],        # Sul
-    (-1,  0): [win32con.VK_LEFT],        # Oeste
-    ( 1,  0): [win32con.VK_RIGHT],       # Leste
-    (-1, -1): [win32con.VK_LEFT, win32con.VK_UP],    # NW
-    ( 1, -1): [win32con.VK_RIGHT, win32con.VK_UP],   # NE
-    (-1,  1): [win32con.VK_LEFT, win32con.VK_DOWN],  # SW
-    ( 1,  1): [win32con.VK_RIGHT, win32con.VK_DOWN], # SE
+    ( 0, -1): [VK_UP],          # Norte
+    ( 0,  1): [VK_DOWN],        # Sul
+    (-1,  0): [VK_LEFT],        # Oeste
+    ( 1,  0): [VK_RIGHT],       # Leste
+    (-1, -1): [VK_LEFT, VK_UP],    # NW
+    ( 1, -1): [VK_RIGHT, VK_UP],   # NE
+    (-1,  1): [VK_LEFT, VK_DOWN],  # SW
+    ( 1,  1): [VK_RIGHT, VK_DOWN], # SE
 }
 
 
@@ -85,10 +89,14 @@ class MemoryWalker:
 
     def set_injector(self, injector) -> None:
         """
-        Injeta o KeyboardInjector apos a instanciacao.
+        Injeta o injector apos a instanciacao.
         Deve ser chamado pelo BotEngine logo apos start(), passando
-        self._injector (o mesmo KeyboardInjector ja configurado com PID).
+        bot_engine.injector (InputDispatcher sobre o KeyboardInjector ja
+        configurado com PID). Um injector cru e embrulhado num dispatcher
+        sincrono.
         """
+        if not isinstance(injector, InputDispatcher):
+            injector = InputDispatcher(injector)
         self._injector = injector
         self._log.debug("KeyboardInjector injetado no MemoryWalker.")
 
@@ -137,10 +145,13 @@ class MemoryWalker:
             return False
 
         try:
-            for i, vk in enumerate(vk_list):
-                self._injector.send_key_background(vk)
-                if i < len(vk_list) - 1:
-                    time.sleep(_DIAGONAL_DELAY)
+            self._injector.submit(
+                [
+                    (_DIAGONAL_DELAY if i else 0.0, "send_key_background", (vk,))
+                    for i, vk in enumerate(vk_list)
+                ],
+                ttl=_STEP_TTL,
+            )
 
             self._last_step_time = time.time()
             dir_name = {(-1,-1):"NW",(0,-1):"N",(1,-1):"NE",(-1,0):"W",
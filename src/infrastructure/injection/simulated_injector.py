@@ -0,0 +1,69 @@
+"""
+SimulatedInjector - ICommandInjector para o processo simulado.
+
+Em vez de PostMessage, aplica os comandos direto no SimulatedBackend:
+setas movem o player, magias de cura curam. Nao dorme (sem os delays de
+PostMessage), entao o custo medido no benchmark e so o do bot.
+"""
+from collections import Counter
+
+from src.core.interfaces.injector_interface import ICommandInjector
+from src.core.constants.virtual_keys import VK_DOWN, VK_LEFT, VK_RIGHT, VK_UP
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend
+
+_ARROWS = {
+    VK_UP: (0, -1),
+    VK_DOWN: (0, 1),
+    VK_LEFT: (-1, 0),
+    VK_RIGHT: (1, 0),
+}
+
+
+class SimulatedInjector(ICommandInjector):
+    """Injector que conta os comandos e os aplica no mundo simulado."""
+
+    def __init__(self, backend: SimulatedBackend) -> None:
+        self._backend = backend
+        self.commands: Counter = Counter()
+
+    def set_process_id(self, process_id) -> None:
+        pass
+
+    def cast_spell(self, spell_words: str) -> None:
+        self.commands["cast_spell"] += 1
+        self._backend.cast_spell(spell_words)
+
+    def say(self, text: str) -> None:
+        self.commands["say"] += 1
+
+    def send_hotkey(self, key: str) -> bool:
+        self.commands["hotkey"] += 1
+        return True
+
+    def send_key_background(self, vk_code: int) -> bool:
+        self.commands["key"] += 1
+        step = _ARROWS.get(vk_code)
+        if step:
+            self._backend.move_player(*step)
+        return True
+
+    def send_mouse_click(self, client_x: int, client_y: int) -> bool:
+        self.commands["click"] += 1
+        return True
+
+    @staticmethod
+    def tile_to_screen(
+        tile_x: int, tile_y: int,
+        player_x: int, player_y: int,
+        client_width: int = 480, client_height: int = 360,
+        offset_x: int = 0, offset_y: int = 0
+    ) -> tuple:
+        return (tile_x - player_x, tile_y - player_y)
+
+    def click_tile(self, tile_x: int, tile_y: int, player_x: int, player_y: int,
+                   offset_x: int = 0, offset_y: int = 0) -> bool:
+        self.commands["click"] += 1
+        return True
+
+    def focus_client(self) -> bool:
+        return True
@@ -0,0 +1,24 @@
+"""
+Backends de acesso a memoria do processo do cliente.
+
+O backend e escolhido pela plataforma: kernel32 no Windows,
+process_vm_readv + /proc no Linux (cliente sob Wine). Os modulos sao
+importados sob demanda porque cada um carrega a API nativa do seu sistema.
+"""
+import sys
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+
+
+def create_default_backend() -> IMemoryBackend:
+    """Instancia o backend nativo da plataforma atual."""
+    if sys.platform == "win32":
+        from src.infrastructure.memory.backends.win32_backend import Win32MemoryBackend
+        return Win32MemoryBackend()
+    if sys.platform.startswith("linux"):
+        from src.infrastructure.memory.backends.linux_backend import LinuxMemoryBackend
+        return LinuxMemoryBackend()
+    raise NotImplementedError(f"Sem backend de memoria para a plataforma {sys.platform}.")
+
+
+__all__ = ["IMemoryBackend", "create_default_backend"]
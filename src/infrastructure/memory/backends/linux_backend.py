@@ -0,0 +1,231 @@
+"""
+Backend de memoria Linux (cliente 8.60 rodando sob Wine).
+
+  - Descoberta: /proc/<pid>/comm e cmdline para achar o processo,
+    /proc/<pid>/maps para regioes e base do executavel.
+  - Leitura: process_vm_readv, com varias faixas (iovecs) por syscall em
+    read_scatter — um ReadPlan inteiro custa uma unica chamada.
+  - Escrita: /proc/<pid>/mem (pwrite), com process_vm_writev como fallback.
+
+Requer o mesmo uid do processo alvo e ptrace liberado
+(kernel.yama.ptrace_scope = 0) ou CAP_SYS_PTRACE.
+"""
+import ctypes
+import ctypes.util
+import os
+import threading
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.infrastructure.logging.logger import get_logger
+
+# Limite do kernel para iovecs por chamada (UIO_MAXIOV).
+IOV_MAX = 1024
+
+
+class _IOVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+_libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+
+_libc.process_vm_readv.argtypes = [
+    ctypes.c_int,                  # pid
+    ctypes.POINTER(_IOVec),        # local_iov
+    ctypes.c_ulong,                # liovcnt
+    ctypes.POINTER(_IOVec),        # remote_iov
+    ctypes.c_ulong,                # riovcnt
+    ctypes.c_ulong,                # flags
+]
+_libc.process_vm_readv.restype = ctypes.c_ssize_t
+
+_libc.process_vm_writev.argtypes = _libc.process_vm_readv.argtypes
+_libc.process_vm_writev.restype = ctypes.c_ssize_t
+
+
+class MemoryRegion(NamedTuple):
+    """Linha de /proc/<pid>/maps."""
+    start: int
+    end: int
+    perms: str
+    path: str
+
+
+class LinuxMemoryBackend(IMemoryBackend):
+    """Acesso a memoria via process_vm_readv e /proc/<pid>/mem."""
+
+    def __init__(self, proc_root: str = "/proc") -> None:
+        self._log = get_logger("LinuxMemoryBackend")
+        self._proc = proc_root
+        self._pid: Optional[int] = None
+        self._mem_fd: Optional[int] = None
+        # iovecs reaproveitados entre chamadas, um par por thread: o
+        # HealingLane le pelo mesmo backend que a thread do engine
+        self._scratch = threading.local()
+
+    # ------------------------------------------------------------------
+    # Descoberta
+    # ------------------------------------------------------------------
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        """
+        PID do primeiro processo cujo comm ou argv[0] (basename, tambem com
+        separador do Windows sob Wine) bate com process_name.
+        """
+        wanted = process_name.lower()
+        for entry in os.listdir(self._proc):
+            if not entry.isdigit():
+                continue
+            base = os.path.join(self._proc, entry)
+            try:
+                with open(os.path.join(base, "comm"), "rb") as f:
+                    comm = f.read().strip().decode("utf-8", errors="ignore")
+                with open(os.path.join(base, "cmdline"), "rb") as f:
+                    argv0 = f.read().split(b"\x00", 1)[0].decode("utf-8", errors="ignore")
+            except OSError:
+                continue  # processo terminou ou sem permissao
+            exe = argv0.replace("\\", "/").rsplit("/", 1)[-1]
+            # comm e truncado em 15 caracteres pelo kernel
+            if exe.lower() == wanted or comm.lower() == wanted[:15]:
+                return int(entry)
+        return None
+
+    def regions(self) -> List[MemoryRegion]:
+        """Regioes mapeadas do processo aberto (/proc/<pid>/maps)."""
+        if self._pid is None:
+            return []
+        result = []
+        with open(os.path.join(self._proc, str(self._pid), "maps")) as f:
+            for line in f:
+                parts = line.split(None, 5)
+                if len(parts) < 5:
+                    continue
+                lo, hi = parts[0].split("-")
+                path = parts[5].strip() if len(parts) > 5 else ""
+                result.append(MemoryRegion(int(lo, 16), int(hi, 16), parts[1], path))
+        return result
+
+    def module_base(self, module_name: str) -> Optional[int]:
+        """Menor endereco mapeado do arquivo `module_name` (ex.: o .exe sob Wine)."""
+        wanted = module_name.lower()
+        starts = [
+            r.start for r in self.regions()
+            if r.path.replace("\\", "/").rsplit("/", 1)[-1].lower() == wanted
+        ]
+        return min(starts) if starts else None
+
+    # ------------------------------------------------------------------
+    # Abertura
+    # ------------------------------------------------------------------
+
+    def open(self, pid: int) -> bool:
+        if not os.path.isdir(os.path.join(self._proc, str(pid))):
+            self._log.error(f"Processo PID={pid} nao existe.")
+            return False
+        self._pid = pid
+        try:
+            self._mem_fd = os.open(os.path.join(self._proc, str(pid), "mem"), os.O_RDWR)
+        except OSError as e:
+            # Leitura via process_vm_readv ainda funciona; escrita cai no writev.
+            self._log.warning(f"/proc/{pid}/mem indisponivel para escrita: {e}")
+            self._mem_fd = None
+        return True
+
+    def close(self) -> None:
+        if self._mem_fd is not None:
+            os.close(self._mem_fd)
+            self._mem_fd = None
+        self._pid = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._pid is not None
+
+    @property
+    def handle(self) -> Optional[int]:
+        return self._pid
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    def _iovecs(self, count: int) -> Tuple[ctypes.Array, ctypes.Array]:
+        """iovecs da thread atual (crescem sob demanda)."""
+        scratch = self._scratch
+        local = getattr(scratch, "local", None)
+        if local is None or len(local) < count:
+            scratch.local = (_IOVec * count)()
+            scratch.remote = (_IOVec * count)()
+        return scratch.local, scratch.remote
+
+    def read_into(self, address: int, buffer) -> int:
+        got = self.read_scatter(((address, buffer),))[0]
+        if got == 0 and len(buffer):
+            raise MemoryReadError(f"process_vm_readv falhou em {hex(address)} (errno {ctypes.get_errno()})")
+        return got
+
+    def read_scatter(self, requests: Sequence[Tuple[int, object]]) -> List[int]:
+        """
+        Le todas as faixas com process_vm_readv, ate IOV_MAX por syscall.
+
+        O kernel para na primeira faixa inacessivel; o total retornado diz
+        ate onde foi. A faixa que falhou recebe a contagem parcial e a
+        leitura continua a partir da seguinte.
+        """
+        counts = [0] * len(requests)
+        if self._pid is None:
+            return counts
+
+        index = 0
+        while index < len(requests):
+            batch = requests[index:index + IOV_MAX]
+            local, remote = self._iovecs(len(batch))
+            views = []  # mantem os buffers exportados ate a syscall
+            for i, (address, buffer) in enumerate(batch):
+                size = len(buffer)
+                c_buf = (ctypes.c_char * size).from_buffer(buffer)
+                views.append(c_buf)
+                local[i].iov_base = ctypes.addressof(c_buf)
+                local[i].iov_len = size
+                remote[i].iov_base = address
+                remote[i].iov_len = size
+
+            total = _libc.process_vm_readv(self._pid, local, len(batch), remote, len(batch), 0)
+            del views
+            if total < 0:
+                total = 0
+
+            for i, (_, buffer) in enumerate(batch):
+                size = len(buffer)
+                got = min(size, total)
+                counts[index + i] = got
+                total -= got
+                if got < size:
+                    index += i + 1  # pula a faixa que falhou
+                    break
+            else:
+                index += len(batch)
+        return counts
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def write(self, address: int, data: bytes) -> bool:
+        if self._pid is None:
+            return False
+        data = bytes(data)
+        if self._mem_fd is not None:
+            try:
+                return os.pwrite(self._mem_fd, data, address) == len(data)
+            except OSError as e:
+                self._log.debug(f"pwrite em /proc/{self._pid}/mem falhou: {e}")
+
+        c_data = ctypes.create_string_buffer(data, len(data))
+        local = _IOVec(ctypes.addressof(c_data), len(data))
+        remote = _IOVec(address, len(data))
+        written = _libc.process_vm_writev(
+            self._pid, ctypes.byref(local), 1, ctypes.byref(remote), 1, 0
+        )
+        return written == len(data)
@@ -0,0 +1,89 @@
+"""
+Backend que grava, por tick, as regioes de memoria lidas pelos readers.
+
+Envolve o backend real: toda leitura e repassada a ele e os bytes
+retornados ficam acumulados no tick corrente. Em begin_tick() (chamado
+pelo MemoryReader no inicio de cada tick do BotEngine) o tick anterior e
+gravado no arquivo com RecordingWriter.
+
+Uso:
+    backend = RecordingBackend(create_default_backend(), "hunt.tbrec")
+    pm = ProcessManager(backend)
+"""
+from typing import List, Optional, Sequence, Tuple
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.infrastructure.memory.recording import RecordingWriter
+
+
+class RecordingBackend(IMemoryBackend):
+    """Proxy de IMemoryBackend que grava as leituras de cada tick."""
+
+    def __init__(self, inner: IMemoryBackend, path: str):
+        self._inner = inner
+        self._writer = RecordingWriter(path)
+        # Regioes (endereco, bytes) do tick corrente; a primeira leitura vale.
+        self._frame: List[Tuple[int, bytes]] = []
+
+    @property
+    def ticks_recorded(self) -> int:
+        return self._writer.tick_count
+
+    def _capture(self, address: int, buffer, got: int) -> None:
+        """Guarda a leitura, exceto se ja coberta por uma regiao do tick."""
+        if got <= 0:
+            return
+        end = address + got
+        for start, data in self._frame:
+            if start <= address and end <= start + len(data):
+                return
+        self._frame.append((address, bytes(memoryview(buffer)[:got])))
+
+    def _flush(self) -> None:
+        if self._frame:
+            self._writer.write_tick(self._frame)
+            self._frame = []
+
+    # ------------------------------------------------------------------
+    # IMemoryBackend
+    # ------------------------------------------------------------------
+
+    def begin_tick(self) -> None:
+        self._flush()
+        self._inner.begin_tick()
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        return self._inner.find_process(process_name)
+
+    def open(self, pid: int) -> bool:
+        return self._inner.open(pid)
+
+    def close(self) -> None:
+        self._flush()
+        self._inner.close()
+        self._writer.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._inner.is_open
+
+    @property
+    def handle(self) -> Optional[int]:
+        return self._inner.handle
+
+    def module_base(self, module_name: str) -> Optional[int]:
+        return self._inner.module_base(module_name)
+
+    def read_into(self, address: int, buffer) -> int:
+        got = self._inner.read_into(address, buffer)
+        self._capture(address, buffer, got)
+        return got
+
+    def read_scatter(self, requests: Sequence[Tuple[int, object]]) -> List[int]:
+        counts = self._inner.read_scatter(requests)
+        for (address, buffer), got in zip(requests, counts):
+            self._capture(address, buffer, got)
+        return counts
+
+    def write(self, address: int, data: bytes) -> bool:
+        return self._inner.write(address, data)
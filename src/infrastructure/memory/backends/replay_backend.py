@@ -0,0 +1,116 @@
+"""
+Backend que serve leituras a partir de uma gravacao (Recording).
+
+Cada begin_tick() avanca para o proximo tick gravado; leituras sao
+atendidas pela regiao gravada que cobre o endereco pedido. Escritas
+(aimbot, walker) valem so ate o fim do tick corrente, sobrepostas aos
+bytes gravados — o tick seguinte reflete o que o cliente real fez.
+"""
+from typing import List, Optional, Tuple
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.infrastructure.memory.recording import Recording, TickFrame
+
+# PID ficticio: o MemoryReader so exige um handle verdadeiro.
+REPLAY_HANDLE = 1
+
+
+class ReplayBackend(IMemoryBackend):
+    """IMemoryBackend somente-leitura sobre uma gravacao mmap."""
+
+    def __init__(self, recording: Recording, loop: bool = False):
+        if not len(recording):
+            raise ValueError("Gravacao sem ticks.")
+        self._recording = recording
+        self._loop = loop
+        self._index = 0
+        self._started = False
+        self._frame: TickFrame = recording.frame(0)
+        self._writes: List[Tuple[int, bytes]] = []
+        self._open = False
+
+    @property
+    def tick_index(self) -> int:
+        return self._index
+
+    @property
+    def frame(self) -> TickFrame:
+        return self._frame
+
+    @property
+    def exhausted(self) -> bool:
+        """True quando o ultimo tick ja foi servido (sem loop)."""
+        return not self._loop and self._index >= len(self._recording) - 1
+
+    def seek(self, index: int) -> None:
+        self._index = index % len(self._recording)
+        self._frame = self._recording.frame(self._index)
+        self._writes = []
+
+    def begin_tick(self) -> None:
+        # O primeiro tick serve o frame 0; depois avanca um por tick.
+        if not self._started:
+            self._started = True
+            return
+        nxt = self._index + 1
+        if nxt >= len(self._recording):
+            if not self._loop:
+                return  # fica no ultimo tick
+            nxt = 0
+        self.seek(nxt)
+
+    # ------------------------------------------------------------------
+    # IMemoryBackend
+    # ------------------------------------------------------------------
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        return REPLAY_HANDLE
+
+    def open(self, pid: int) -> bool:
+        self._open = True
+        return True
+
+    def close(self) -> None:
+        self._open = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    @property
+    def handle(self) -> Optional[int]:
+        return REPLAY_HANDLE
+
+    def read_into(self, address: int, buffer) -> int:
+        size = len(buffer)
+        best = None  # (bytes cobertos, dados, offset)
+        for start, data in self._frame.regions:
+            offset = address - start
+            if 0 <= offset < len(data):
+                got = min(size, len(data) - offset)
+                if best is None or got > best[0]:
+                    best = (got, data, offset)
+                    if got == size:
+                        break  # regiao cobre a faixa inteira
+        if best is not None:
+            # Nenhuma regiao cobre tudo: leitura parcial, como no RPM.
+            got, data, offset = best
+            buffer[:got] = data[offset:offset + got]
+            self._apply_writes(address, buffer, got)
+            return got
+        raise MemoryReadError(
+            f"Endereco {hex(address)} (+{size}) nao gravado no tick {self._frame.tick}"
+        )
+
+    def _apply_writes(self, address: int, buffer, got: int) -> None:
+        end = address + got
+        for w_addr, w_data in self._writes:
+            lo = max(address, w_addr)
+            hi = min(end, w_addr + len(w_data))
+            if lo < hi:
+                buffer[lo - address:hi - address] = w_data[lo - w_addr:hi - w_addr]
+
+    def write(self, address: int, data: bytes) -> bool:
+        self._writes.append((address, bytes(data)))
+        return True
@@ -0,0 +1,357 @@
+"""
+Processo Tibia 8.60 simulado, exposto como IMemoryBackend.
+
+Emula o layout de addresses_860 numa regiao de memoria local: bloco do
+player, BattleList de 250 slots com criaturas andando, TARGET +
+attack_count com a mesma semantica do cliente e HP alterado por dano
+ficticio. Serve para rodar BotEngine (e varias instancias ao mesmo tempo)
+em Linux, sem cliente, para testes de carga e benchmarks.
+
+O mundo avanca `tick_seconds` de tempo simulado a cada begin_tick()
+(chamado pelo MemoryReader no inicio de cada tick do BotEngine), entao
+a simulacao e deterministica para uma mesma seed.
+
+Semantica de ataque (igual ao cliente): escrever TARGET["target_id"]
+sozinho nao ataca; o alvo so e processado quando attack_count muda. Ao
+morrer o alvo, o cliente zera os campos de target.
+"""
+import struct
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.core.constants.addresses_860 import BATTLE_LIST, PLAYER, TARGET
+from src.infrastructure.memory.layouts_860 import CREATURE_LAYOUT
+
+# Regiao emulada: attack_count (0x63DA40) ate alem do fim da BattleList.
+REGION_START = 0x63C000
+REGION_END = 0x660000
+
+SIMULATED_PID = 0x860
+
+PLAYER_ID = 0x10000860
+MONSTER_ID_BASE = 0x40001000
+MONSTER_NAMES = (
+    "Rotworm", "Carrion Worm", "Cyclops", "Dragon", "Dragon Lord",
+    "Demon Skeleton", "Orc", "Orc Spearman", "Troll", "Giant Spider",
+)
+
+# Palavras de cura -> fracao do HP maximo curada e custo de mana.
+HEALING_SPELLS = {
+    "exura": (0.10, 20),
+    "exura gran": (0.25, 70),
+    "exura vita": (0.50, 160),
+}
+
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_TYPE_MASK = 0x00FFFFFF
+
+
+class SimulatedBackend(IMemoryBackend):
+    """IMemoryBackend sobre um cliente 8.60 simulado em memoria local."""
+
+    def __init__(
+        self,
+        creatures: int = 249,
+        seed: int = 0,
+        tick_seconds: float = 0.1,
+        player_name: str = "Simbot",
+        player_position: tuple = (32000, 32000, 7),
+        spread: int = 30,
+        player_health: int = 1000,
+        player_mana: int = 600,
+        respawn_seconds: float = 5.0,
+    ):
+        self.tick_seconds = tick_seconds
+        self.spread = spread
+        self.respawn_seconds = respawn_seconds
+        self.time = 0.0
+        self._rng = np.random.default_rng(seed)
+        self._mem = bytearray(REGION_END - REGION_START)
+        self._open = False
+
+        # Contadores expostos para benchmarks e testes
+        self.kills = 0
+        self.deaths = 0
+        self.attacks = 0
+        self.damage_taken = 0
+        self.spells_cast = 0
+
+        self.player_x, self.player_y, self.player_z = player_position
+        self.health_max = player_health
+        self.mana_max = player_mana
+        self.health = player_health
+        self.mana = player_mana
+        self._write_player_static(player_name)
+
+        # BattleList como array estruturado sobre a propria memoria emulada
+        step = BATTLE_LIST["step"]
+        self._slots = BATTLE_LIST["max_creatures"]
+        assert CREATURE_LAYOUT.dtype.itemsize == step
+        self._bl = np.frombuffer(
+            self._mem, dtype=CREATURE_LAYOUT.dtype, count=self._slots,
+            offset=BATTLE_LIST["start"].value - REGION_START,
+        )
+        self._alive = np.zeros(self._slots, dtype=bool)
+        self._respawn_at = np.full(self._slots, np.inf)
+        self._next_id = MONSTER_ID_BASE
+
+        self._bl[0]["id"] = PLAYER_ID
+        self._bl[0]["name"] = player_name.encode("latin-1")[:31]
+        self._bl[0]["hp_bar"] = 100
+        self._bl[0]["visible"] = 1
+        self._bl[0]["walk_speed"] = 220
+        for slot in range(1, min(creatures, self._slots - 1) + 1):
+            self._spawn(slot)
+
+        self._last_attack_count = self._u32(TARGET["attack_count"].value)
+        self._target_slot: Optional[int] = None
+        self._target_by_slot = False
+        self._next_hit = 0.0
+        self._sync_player()
+
+    # ------------------------------------------------------------------
+    # Memoria emulada
+    # ------------------------------------------------------------------
+
+    def _u32(self, address: int) -> int:
+        return _U32.unpack_from(self._mem, address - REGION_START)[0]
+
+    def _put_u32(self, address: int, value: int) -> None:
+        _U32.pack_into(self._mem, address - REGION_START, value & 0xFFFFFFFF)
+
+    def _put_i32(self, address: int, value: int) -> None:
+        _I32.pack_into(self._mem, address - REGION_START, value)
+
+    def _write_player_static(self, name: str) -> None:
+        raw = name.encode("latin-1")[:31] + b"\x00"
+        offset = PLAYER["name"].value - REGION_START
+        self._mem[offset:offset + len(raw)] = raw
+        self._put_u32(PLAYER["id"].value, PLAYER_ID)
+        self._put_i32(PLAYER["level"].value, 80)
+        self._put_i32(PLAYER["magic_level"].value, 40)
+        self._put_i32(PLAYER["experience"].value, 8_000_000)
+        self._put_i32(PLAYER["soul"].value, 100)
+        self._put_i32(PLAYER["stamina"].value, 2520)
+        self._mem[PLAYER["vocation"].value - REGION_START] = 6  # Elder Druid
+
+    def _sync_player(self) -> None:
+        self._put_i32(PLAYER["health"].value, self.health)
+        self._put_i32(PLAYER["health_max"].value, self.health_max)
+        self._put_i32(PLAYER["mana"].value, self.mana)
+        self._put_i32(PLAYER["mana_max"].value, self.mana_max)
+        player = self._bl[0]
+        player["x"], player["y"], player["z"] = self.player_x, self.player_y, self.player_z
+        player["hp_bar"] = self.health * 100 // self.health_max
+
+    # ------------------------------------------------------------------
+    # Mundo
+    # ------------------------------------------------------------------
+
+    def _spawn(self, slot: int) -> None:
+        rng = self._rng
+        row = self._bl[slot]
+        row["id"] = self._next_id
+        self._next_id += 1
+        row["name"] = MONSTER_NAMES[int(rng.integers(len(MONSTER_NAMES)))].encode()
+        row["x"] = self.player_x + int(rng.integers(-self.spread, self.spread + 1))
+        row["y"] = self.player_y + int(rng.integers(-self.spread, self.spread + 1))
+        row["z"] = self.player_z
+        row["hp_bar"] = 100
+        row["visible"] = 1
+        row["walking"] = 0
+        row["direction"] = int(rng.integers(4))
+        row["walk_speed"] = int(rng.integers(150, 300))
+        self._alive[slot] = True
+        self._respawn_at[slot] = np.inf
+
+    def _kill(self, slot: int) -> None:
+        row = self._bl[slot]
+        row["hp_bar"] = 0
+        row["visible"] = 0
+        row["walking"] = 0
+        self._alive[slot] = False
+        self._respawn_at[slot] = self.time + self.respawn_seconds
+        self.kills += 1
+
+    def _move_creatures(self, dt: float) -> None:
+        """Cada criatura da um passo com probabilidade ~ walk_speed * dt."""
+        bl, rng = self._bl, self._rng
+        p_step = bl["walk_speed"] / 220.0 * dt
+        moving = self._alive & (rng.random(self._slots) < p_step)
+        moving[0] = False
+        bl["walking"] = moving
+        idx = np.flatnonzero(moving)
+        if not len(idx):
+            return
+        dx = rng.integers(-1, 2, len(idx))
+        dy = rng.integers(-1, 2, len(idx))
+        # Mantem o bando em volta do player (criaturas perseguem o alvo).
+        far_x = np.abs(bl["x"][idx] + dx - self.player_x) > self.spread
+        far_y = np.abs(bl["y"][idx] + dy - self.player_y) > self.spread
+        dx[far_x] = -dx[far_x]
+        dy[far_y] = -dy[far_y]
+        bl["x"][idx] += dx
+        bl["y"][idx] += dy
+        # Direcao 8.60: 0=N, 1=E, 2=S, 3=W
+        bl["direction"][idx] = np.where(
+            dy < 0, 0, np.where(dx > 0, 1, np.where(dy > 0, 2, 3))
+        )
+
+    def _damage_player(self, dt: float) -> None:
+        """Criaturas adjacentes causam dano ficticio ao player."""
+        bl = self._bl
+        adjacent = (
+            self._alive
+            & (np.abs(bl["x"] - self.player_x) <= 1)
+            & (np.abs(bl["y"] - self.player_y) <= 1)
+            & (bl["z"] == self.player_z)
+        )
+        hits = int((adjacent & (self._rng.random(self._slots) < 0.5 * dt)).sum())
+        if hits:
+            damage = int(self._rng.integers(10, 60, hits).sum())
+            self.damage_taken += damage
+            self.health -= damage
+            if self.health <= 0:
+                self.deaths += 1
+                self.health = self.health_max  # "relogin" para o benchmark seguir
+        # Regeneracao
+        self.health = min(self.health_max, self.health + int(10 * dt) + 1)
+        self.mana = min(self.mana_max, self.mana + int(20 * dt) + 1)
+
+    def _resolve_target(self) -> Optional[int]:
+        """Slot do alvo apontado por TARGET (id ou slot da BattleList)."""
+        self._target_by_slot = False
+        target = self._u32(TARGET["target_id"].value) & _TYPE_MASK
+        if target:
+            ids = self._bl["id"] & _TYPE_MASK
+            found = np.flatnonzero(self._alive & (ids == target))
+            if len(found):
+                return int(found[0])
+        slot = (self._u32(TARGET["target_battlelist_id"].value) & _TYPE_MASK) - 1
+        if 0 < slot < self._slots and self._alive[slot]:
+            self._target_by_slot = True
+            return slot
+        return None
+
+    def _clear_target(self) -> None:
+        self._target_slot = None
+        self._put_u32(TARGET["target_id"].value, 0)
+        # target_battlelist_id cai dentro do buffer de nome do player
+        # (addresses_860): so e zerado se o ataque veio por ele.
+        if self._target_by_slot:
+            self._put_u32(TARGET["target_battlelist_id"].value, 0)
+
+    def _attack(self) -> None:
+        count = self._u32(TARGET["attack_count"].value)
+        if count != self._last_attack_count:
+            # Cliente processa o pedido de ataque (pacote 0xA1).
+            self._last_attack_count = count
+            self._target_slot = self._resolve_target()
+            self._next_hit = self.time
+            if self._target_slot is not None:
+                self.attacks += 1
+        slot = self._target_slot
+        if slot is None:
+            return
+        if not self._alive[slot]:
+            self._clear_target()
+            return
+        if self.time >= self._next_hit:
+            self._next_hit = self.time + 2.0
+            row = self._bl[slot]
+            row["hp_bar"] = max(0, int(row["hp_bar"]) - int(self._rng.integers(15, 40)))
+            if row["hp_bar"] == 0:
+                self._kill(slot)
+                self._clear_target()
+
+    def step(self, dt: Optional[float] = None) -> None:
+        """Avanca o mundo simulado em `dt` segundos (padrao: tick_seconds)."""
+        dt = self.tick_seconds if dt is None else dt
+        self.time += dt
+        for slot in np.flatnonzero(self._respawn_at <= self.time).tolist():
+            self._spawn(slot)
+        self._move_creatures(dt)
+        self._attack()
+        self._damage_player(dt)
+        self._sync_player()
+
+    # ------------------------------------------------------------------
+    # Acoes do "cliente" (usadas pelo SimulatedInjector)
+    # ------------------------------------------------------------------
+
+    def cast_spell(self, words: str) -> bool:
+        spell = HEALING_SPELLS.get(words.strip().lower())
+        self.spells_cast += 1
+        if spell is None:
+            return True
+        fraction, cost = spell
+        if self.mana < cost:
+            return False
+        self.mana -= cost
+        self.health = min(self.health_max, self.health + int(self.health_max * fraction))
+        self._sync_player()
+        return True
+
+    def move_player(self, dx: int, dy: int) -> None:
+        self.player_x += dx
+        self.player_y += dy
+        self._sync_player()
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "time": self.time,
+            "creatures": int(self._alive.sum()),
+            "kills": self.kills,
+            "attacks": self.attacks,
+            "deaths": self.deaths,
+            "damage_taken": self.damage_taken,
+            "spells_cast": self.spells_cast,
+        }
+
+    # ------------------------------------------------------------------
+    # IMemoryBackend
+    # ------------------------------------------------------------------
+
+    def begin_tick(self) -> None:
+        self.step()
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        return SIMULATED_PID
+
+    def open(self, pid: int) -> bool:
+        self._open = True
+        return True
+
+    def close(self) -> None:
+        self._open = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._open
+
+    @property
+    def handle(self) -> Optional[int]:
+        return SIMULATED_PID if self._open else None
+
+    def module_base(self, module_name: str) -> Optional[int]:
+        return 0x400000
+
+    def read_into(self, address: int, buffer) -> int:
+        offset = address - REGION_START
+        if not 0 <= offset < len(self._mem):
+            raise MemoryReadError(f"Endereco {hex(address)} fora da memoria simulada")
+        got = min(len(buffer), len(self._mem) - offset)
+        buffer[:got] = self._mem[offset:offset + got]
+        return got
+
+    def write(self, address: int, data: bytes) -> bool:
+        offset = address - REGION_START
+        if offset < 0 or offset + len(data) > len(self._mem):
+            return False
+        self._mem[offset:offset + len(data)] = data
+        return True
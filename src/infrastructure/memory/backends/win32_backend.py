@@ -0,0 +1,180 @@
+"""
+Backend de memoria Windows: Toolhelp32 + OpenProcess +
+ReadProcessMemory/WriteProcessMemory (kernel32).
+"""
+import ctypes
+import ctypes.wintypes as wintypes
+import threading
+from typing import Optional
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.infrastructure.logging.logger import get_logger
+
+PROCESS_RW_ACCESS = 0x1F0FFF        # PROCESS_ALL_ACCESS (leitura + escrita)
+
+# ---------------------------------------------------------------------------
+# WinAPI declarations
+# ---------------------------------------------------------------------------
+kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.OpenProcess.restype  = wintypes.HANDLE
+
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+kernel32.CloseHandle.restype  = wintypes.BOOL
+
+# CORREÇÃO DEFINITIVA: argtypes com c_uint32 para LPCVOID
+# Impede que Python 64-bit passe ponteiro de 8 bytes para processo 32-bit,
+# eliminando WinError 299 (ERROR_PARTIAL_COPY).
+kernel32.ReadProcessMemory.argtypes = [
+    wintypes.HANDLE,          # hProcess
+    ctypes.c_uint32,          # lpBaseAddress — FORÇADO 32-bit
+    ctypes.c_void_p,          # lpBuffer
+    ctypes.c_size_t,          # nSize
+    ctypes.POINTER(ctypes.c_size_t),  # lpNumberOfBytesRead
+]
+kernel32.ReadProcessMemory.restype = wintypes.BOOL
+
+kernel32.WriteProcessMemory.argtypes = [
+    wintypes.HANDLE,          # hProcess
+    ctypes.c_uint32,          # lpBaseAddress — FORÇADO 32-bit
+    ctypes.c_void_p,          # lpBuffer
+    ctypes.c_size_t,          # nSize
+    ctypes.POINTER(ctypes.c_size_t),  # lpNumberOfBytesWritten
+]
+kernel32.WriteProcessMemory.restype = wintypes.BOOL
+
+# --- Toolhelp32 para enumerar processos sem psutil ---
+TH32CS_SNAPPROCESS = 0x00000002
+
+class PROCESSENTRY32(ctypes.Structure):
+    _fields_ = [
+        ("dwSize",              wintypes.DWORD),
+        ("cntUsage",            wintypes.DWORD),
+        ("th32ProcessID",       wintypes.DWORD),
+        ("th32DefaultHeapID",   ctypes.POINTER(ctypes.c_ulong)),
+        ("th32ModuleID",        wintypes.DWORD),
+        ("cntThreads",          wintypes.DWORD),
+        ("th32ParentProcessID", wintypes.DWORD),
+        ("pcPriClassBase",      ctypes.c_long),
+        ("dwFlags",             wintypes.DWORD),
+        ("szExeFile",           ctypes.c_char * 260),
+    ]
+
+kernel32.CreateToolhelp32Snapshot.argtypes = [wintypes.DWORD, wintypes.DWORD]
+kernel32.CreateToolhelp32Snapshot.restype  = wintypes.HANDLE
+
+kernel32.Process32First.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32)]
+kernel32.Process32First.restype  = wintypes.BOOL
+
+kernel32.Process32Next.argtypes  = [wintypes.HANDLE, ctypes.POINTER(PROCESSENTRY32)]
+kernel32.Process32Next.restype   = wintypes.BOOL
+
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class Win32MemoryBackend(IMemoryBackend):
+    """Acesso a memoria via kernel32 — compatível com processos 32-bit."""
+
+    def __init__(self) -> None:
+        self._log = get_logger("Win32MemoryBackend")
+        self._handle: Optional[int] = None
+        self.last_error: Optional[int] = None
+        # contador do ReadProcessMemory reaproveitado, um por thread: o
+        # HealingLane le pelo mesmo backend que a thread do engine
+        self._scratch = threading.local()
+
+    # ------------------------------------------------------------------
+    # Busca de PID via CreateToolhelp32Snapshot
+    # ------------------------------------------------------------------
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        """Retorna o PID do primeiro processo cujo nome bate com process_name."""
+        snapshot = kernel32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+        if snapshot == INVALID_HANDLE_VALUE:
+            err = ctypes.get_last_error()
+            self._log.error(f"CreateToolhelp32Snapshot falhou: WinError {err}")
+            return None
+
+        entry = PROCESSENTRY32()
+        entry.dwSize = ctypes.sizeof(PROCESSENTRY32)
+
+        pid: Optional[int] = None
+        try:
+            ok = kernel32.Process32First(snapshot, ctypes.byref(entry))
+            while ok:
+                exe = entry.szExeFile.decode("utf-8", errors="ignore")
+                if exe.lower() == process_name.lower():
+                    pid = entry.th32ProcessID
+                    break
+                ok = kernel32.Process32Next(snapshot, ctypes.byref(entry))
+        finally:
+            kernel32.CloseHandle(snapshot)
+
+        return pid
+
+    # ------------------------------------------------------------------
+    # Handle
+    # ------------------------------------------------------------------
+
+    def open(self, pid: int) -> bool:
+        handle = kernel32.OpenProcess(PROCESS_RW_ACCESS, False, pid)
+        if not handle:
+            err = ctypes.get_last_error()
+            self.last_error = err
+            self._log.error(f"Falha ao abrir processo (PID={pid}): WinError {err}")
+            return False
+        self._handle = handle
+        return True
+
+    def close(self) -> None:
+        if self._handle:
+            kernel32.CloseHandle(self._handle)
+            self._handle = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._handle is not None
+
+    @property
+    def handle(self) -> Optional[int]:
+        return self._handle
+
+    # ------------------------------------------------------------------
+    # Leitura / escrita
+    # ------------------------------------------------------------------
+
+    def read_into(self, address: int, buffer) -> int:
+        """
+        ReadProcessMemory direto em `buffer`; o ctypes aponta para a
+        memoria dele via from_buffer, sem alocar nem copiar. Usa c_uint32
+        para o endereço (processo 32-bit / Python 64-bit).
+        """
+        size = len(buffer)
+        c_target = (ctypes.c_char * size).from_buffer(buffer)
+        scratch = self._scratch
+        bytes_read = getattr(scratch, "bytes_read", None)
+        if bytes_read is None:
+            bytes_read = scratch.bytes_read = ctypes.c_size_t(0)
+            scratch.ref = ctypes.byref(bytes_read)
+        ok = kernel32.ReadProcessMemory(
+            self._handle,
+            ctypes.c_uint32(address),   # endereço truncado a 32-bit
+            c_target,
+            size,
+            scratch.ref,
+        )
+        got = bytes_read.value
+        if not ok and got == 0:
+            raise MemoryReadError(f"WinError {ctypes.get_last_error()}")
+        return got
+
+    def write(self, address: int, data: bytes) -> bool:
+        size = len(data)
+        c_data = ctypes.create_string_buffer(bytes(data), size)
+        bytes_written = ctypes.c_size_t(0)
+        ok = kernel32.WriteProcessMemory(
+            self._handle, ctypes.c_uint32(address), c_data, size, ctypes.byref(bytes_written)
+        )
+        return bool(ok and bytes_written.value == size)
@@ -0,0 +1,126 @@
+"""
+Telemetria de I/O de memoria por rotulo ("inteiro", "uint", "string",
+"battle list"...): chamadas, bytes, falhas, hits de cache e histograma
+de latencia.
+
+MemoryReader/MemoryWriter registram cada acesso ao backend em um IOStats.
+O BotEngine chama take_tick() ao fim de cada tick: os contadores do tick
+sao devolvidos e acumulados no total, e o tick seguinte comeca zerado.
+"""
+from bisect import bisect_left
+from typing import Any, Dict, Optional
+
+# Limites superiores dos baldes do histograma, em microssegundos. O ultimo
+# balde (indice len(LATENCY_BUCKETS_US)) conta tudo acima de 10 ms.
+LATENCY_BUCKETS_US = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 10000)
+
+
+class LabelStats:
+    """Contadores de um rotulo de I/O."""
+
+    __slots__ = ("calls", "bytes", "failures", "cache_hits", "seconds", "histogram")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.bytes = 0
+        self.failures = 0
+        self.cache_hits = 0
+        self.seconds = 0.0
+        self.histogram = [0] * (len(LATENCY_BUCKETS_US) + 1)
+
+    def add(self, nbytes: int, elapsed: float, ok: bool) -> None:
+        self.calls += 1
+        self.bytes += nbytes
+        self.seconds += elapsed
+        if not ok:
+            self.failures += 1
+        self.histogram[bisect_left(LATENCY_BUCKETS_US, elapsed * 1e6)] += 1
+
+    def merge(self, other: "LabelStats") -> None:
+        self.calls += other.calls
+        self.bytes += other.bytes
+        self.failures += other.failures
+        self.cache_hits += other.cache_hits
+        self.seconds += other.seconds
+        for i, count in enumerate(other.histogram):
+            self.histogram[i] += count
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Latencia (us) do percentil `q` (0-100), estimada pelo limite superior
+        do balde. None sem chamadas; inf se cair no ultimo balde.
+        """
+        if not self.calls:
+            return None
+        rank = self.calls * q / 100.0
+        seen = 0
+        for i, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank and count:
+                return float(LATENCY_BUCKETS_US[i]) if i < len(LATENCY_BUCKETS_US) else float("inf")
+        return float("inf")
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "bytes": self.bytes,
+            "failures": self.failures,
+            "cache_hits": self.cache_hits,
+            "mean_us": (self.seconds / self.calls * 1e6) if self.calls else 0.0,
+            "p50_us": self.percentile(50),
+            "p95_us": self.percentile(95),
+            "p99_us": self.percentile(99),
+            "histogram": list(self.histogram),
+        }
+
+
+class IOStats:
+    """Contadores por rotulo do tick corrente e acumulados."""
+
+    def __init__(self) -> None:
+        self._tick: Dict[str, LabelStats] = {}
+        self._total: Dict[str, LabelStats] = {}
+
+    def _label(self, label: str) -> LabelStats:
+        stats = self._tick.get(label)
+        if stats is None:
+            stats = self._tick[label] = LabelStats()
+        return stats
+
+    def record(self, label: str, nbytes: int, elapsed: float, ok: bool = True) -> None:
+        """Registra um acesso ao backend (um read/write, ou um scatter inteiro)."""
+        self._label(label).add(nbytes, elapsed, ok)
+
+    def hit(self, label: str) -> None:
+        """Registra uma leitura atendida pelo cache, sem acesso ao backend."""
+        self._label(label).cache_hits += 1
+
+    def take_tick(self) -> Dict[str, LabelStats]:
+        """Devolve os contadores do tick, acumula no total e zera o tick."""
+        tick, self._tick = self._tick, {}
+        for label, stats in tick.items():
+            total = self._total.get(label)
+            if total is None:
+                total = self._total[label] = LabelStats()
+            total.merge(stats)
+        return tick
+
+    @property
+    def totals(self) -> Dict[str, LabelStats]:
+        """Acumulado desde a criacao (ou reset), sem o tick em andamento."""
+        return self._total
+
+    def reset(self) -> None:
+        self._tick = {}
+        self._total = {}
+
+
+def summarize(stats: Dict[str, LabelStats]) -> Dict[str, Any]:
+    """Soma de todos os rotulos: chamadas, bytes, falhas, hits e tempo (ms)."""
+    return {
+        "calls": sum(s.calls for s in stats.values()),
+        "bytes": sum(s.bytes for s in stats.values()),
+        "failures": sum(s.failures for s in stats.values()),
+        "cache_hits": sum(s.cache_hits for s in stats.values()),
+        "ms": sum(s.seconds for s in stats.values()) * 1000.0,
+    }
@@ -0,0 +1,130 @@
+"""
+Layouts compilados das estruturas repetidas do Tibia 8.60.
+
+Os offsets vem das tabelas de addresses_860; aqui so se declara o tipo de
+cada campo. Cada layout tem stride fixo e pode ser lido em bloco por um
+ArrayReader (um read para o array inteiro).
+"""
+from typing import Dict
+
+from src.core.constants.addresses_860 import (
+    BATTLE_LIST, CREATURE, CONTAINER, MAP, VIP, HOTKEY, PLAYER_SLOTS,
+)
+from src.infrastructure.memory.struct_layout import StructLayout, compile_layout
+
+# ---------------------------------------------------------------------------
+# BattleList
+# ---------------------------------------------------------------------------
+
+CREATURE_TYPES = {
+    "id":         "uint",    # DWORD — ver BUG #7 no CreatureReader
+    "name":       "string",  # ate o proximo campo (32 bytes)
+    "x":          "int",
+    "y":          "int",
+    "z":          "int",
+    "walking":    "int",
+    "direction":  "int",
+    "hp_bar":     "int",
+    "walk_speed": "int",
+    "visible":    "int",
+}
+
+
+def creature_layout(
+    offsets: Dict[str, int] = CREATURE, stride: int = BATTLE_LIST["step"]
+) -> StructLayout:
+    """Layout de um slot da BattleList para os campos presentes em `offsets`."""
+    types = {k: v for k, v in CREATURE_TYPES.items() if k in offsets}
+    return compile_layout("creature", offsets, types, stride)
+
+
+CREATURE_LAYOUT = creature_layout()
+
+# ---------------------------------------------------------------------------
+# Containers: cabecalho + array de itens (step_slot) a partir de item_id
+# ---------------------------------------------------------------------------
+
+CONTAINER_LAYOUT = compile_layout(
+    "container",
+    CONTAINER,
+    {"is_open": "int", "id": "int", "name": "string", "volume": "int", "amount": "int"},
+    stride=CONTAINER["step_container"],
+    prefix="distance_",
+)
+
+CONTAINER_ITEMS_OFFSET = CONTAINER["distance_item_id"]
+CONTAINER_MAX_ITEMS = (CONTAINER["step_container"] - CONTAINER_ITEMS_OFFSET) // CONTAINER["step_slot"]
+
+CONTAINER_ITEM_LAYOUT = compile_layout(
+    "container item",
+    {
+        "id": 0,
+        "count": CONTAINER["distance_item_count"] - CONTAINER_ITEMS_OFFSET,
+    },
+    {"id": "int", "count": "int"},
+    stride=CONTAINER["step_slot"],
+)
+
+# ---------------------------------------------------------------------------
+# Mapa: tile (contagem + objetos) e objeto do tile
+# ---------------------------------------------------------------------------
+
+MAP_TILE_LAYOUT = compile_layout(
+    "map tile",
+    MAP,
+    {"tile_object_count": "int"},
+    stride=MAP["step_tile"],
+    prefix="distance_",
+)
+
+MAP_OBJECTS_OFFSET = MAP["distance_tile_objects"]
+
+MAP_OBJECT_LAYOUT = compile_layout(
+    "map object",
+    MAP,
+    {"object_id": "int", "object_data": "int", "object_data_ex": "int"},
+    stride=MAP["step_tile_object"],
+    prefix="distance_",
+)
+
+# ---------------------------------------------------------------------------
+# VIP list
+# ---------------------------------------------------------------------------
+
+VIP_LAYOUT = compile_layout(
+    "vip",
+    VIP,
+    {"id": "uint", "name": "string", "status": "byte", "icon": "int"},
+    stride=VIP["step_players"],
+    prefix="distance_",
+)
+
+# ---------------------------------------------------------------------------
+# Hotkeys: arrays paralelos, um layout por array
+# ---------------------------------------------------------------------------
+
+HOTKEY_TEXT_LAYOUT = compile_layout(
+    "hotkey text", {"text": 0}, {"text": "string"}, stride=HOTKEY["text_step"]
+)
+HOTKEY_OBJECT_LAYOUT = compile_layout(
+    "hotkey object", {"object": 0}, {"object": "uint"}, stride=HOTKEY["object_step"]
+)
+HOTKEY_USE_TYPE_LAYOUT = compile_layout(
+    "hotkey use type", {"use_type": 0}, {"use_type": "uint"},
+    stride=HOTKEY["object_use_type_step"],
+)
+HOTKEY_SEND_AUTO_LAYOUT = compile_layout(
+    "hotkey send", {"send_automatically": 0}, {"send_automatically": "byte"},
+    stride=HOTKEY["send_automatically_step"],
+)
+
+# ---------------------------------------------------------------------------
+# Slots de equipamento (head ... ammo, 12 bytes cada)
+# ---------------------------------------------------------------------------
+
+PLAYER_SLOT_LAYOUT = compile_layout(
+    "player slot",
+    {"id": 0, "count": PLAYER_SLOTS["distance_slot_count"]},
+    {"id": "int", "count": "int"},
+    stride=PLAYER_SLOTS["slot_neck"].value - PLAYER_SLOTS["slot_head"].value,
+)
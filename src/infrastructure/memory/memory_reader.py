@@ -1,63 +1,117 @@
 """
-Leitor de memoria com cache inteligente.
+Leitor de memoria com cache de paginas.
 Compatível com processo 32-bit lido por Python 64-bit.
+
+O acesso cru vai pelo IMemoryBackend do ProcessManager (kernel32 no
+Windows, process_vm_readv no Linux/Wine).
+
+Cache: paginas de 4 KiB lidas inteiras e reaproveitadas durante a geracao
+corrente (um tick do BotEngine). Leituras tipadas sao struct.unpack_from
+direto sobre o buffer da pagina, sem copia.
 """
-import ctypes
-import ctypes.wintypes as wintypes
 import struct
 import time
-from typing import Optional, Any
+from typing import Optional, Any, Dict, Hashable
 
 from src.core.interfaces.memory_interface import IMemoryReader
 from src.core.value_objects.address import MemoryAddress
 from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.infrastructure.memory.read_plan import ReadPlan
+from src.infrastructure.memory.io_stats import IOStats
+
+# Granularidade do cache: pagina de memoria do Windows (4 KiB).
+PAGE_SIZE = 0x1000
+_PAGE_MASK = ~(PAGE_SIZE - 1)
+
+_I32 = struct.Struct("<i")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F32 = struct.Struct("<f")
 
-# CORREÇÃO DEFINITIVA: argtypes com c_uint32 para LPCVOID
-# Impede que Python 64-bit passe ponteiro de 8 bytes para processo 32-bit,
-# eliminando WinError 299 (ERROR_PARTIAL_COPY).
-kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+# Nomes no cliente 8.60 sao buffers fixos de 32 bytes (30 chars + NUL).
+DEFAULT_STRING_LENGTH = 32
+_MAX_POOLED_SIZES = 32
 
-kernel32.ReadProcessMemory.argtypes = [
-    wintypes.HANDLE,          # hProcess
-    ctypes.c_uint32,          # lpBaseAddress — FORÇADO 32-bit
-    ctypes.c_void_p,          # lpBuffer
-    ctypes.c_size_t,          # nSize
-    ctypes.POINTER(ctypes.c_size_t),  # lpNumberOfBytesRead
-]
-kernel32.ReadProcessMemory.restype = wintypes.BOOL
 
+class PageCache:
+    """
+    Cache de paginas de 4 KiB com validade por geracao.
+
+    Cada pagina guarda a geracao em que foi lida; advance() invalida todas
+    de uma vez (O(1)) ao iniciar um novo tick. Campos diferentes da mesma
+    pagina custam um unico ReadProcessMemory por geracao.
+
+    Sem um dono chamando advance() (uso avulso do MemoryReader), o cache
+    expira sozinho apos `ttl` segundos — o relogio so e consultado nesse
+    modo, nunca no caminho do BotEngine.
+    """
 
-class MemoryCache:
-    """Cache simples com TTL."""
     def __init__(self, ttl: float = 0.1):
-        self._cache: dict[int, tuple[Any, float]] = {}
+        self._pages: dict[int, tuple[int, bytearray]] = {}
         self._ttl = ttl
-
-    def get(self, address: MemoryAddress) -> Optional[Any]:
-        entry = self._cache.get(address.value)
-        if entry:
-            value, ts = entry
-            if time.perf_counter() - ts < self._ttl:
-                return value
-            del self._cache[address.value]
+        self._generation_start = time.perf_counter()
+        self._tick_driven = False
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    def advance(self) -> int:
+        """Inicia uma nova geracao (tick). Paginas antigas deixam de valer."""
+        self._tick_driven = True
+        self.generation += 1
+        # Evita crescimento indefinido: paginas velhas sao descartadas em lote.
+        if len(self._pages) > 256:
+            self._pages.clear()
+        return self.generation
+
+    def get(self, page_base: int) -> Optional[bytearray]:
+        if not self._tick_driven and self._ttl > 0:
+            now = time.perf_counter()
+            if now - self._generation_start >= self._ttl:
+                self.generation += 1
+                self._generation_start = now
+        entry = self._pages.get(page_base)
+        if entry is not None and entry[0] == self.generation:
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
         return None
 
-    def set(self, address: MemoryAddress, value: Any) -> None:
-        self._cache[address.value] = (value, time.perf_counter())
+    def buffer_for(self, page_base: int) -> bytearray:
+        """Buffer da pagina (mesmo expirado) para ser relido in-place."""
+        entry = self._pages.get(page_base)
+        return entry[1] if entry is not None else bytearray(PAGE_SIZE)
+
+    def put(self, page_base: int, data: bytearray) -> None:
+        self._pages[page_base] = (self.generation, data)
+
+    def invalidate(self, address: int) -> None:
+        self._pages.pop(address & _PAGE_MASK, None)
 
     def clear(self) -> None:
-        self._cache.clear()
+        self._pages.clear()
 
-    def invalidate(self, address: MemoryAddress) -> None:
-        self._cache.pop(address.value, None)
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0,
+            "pages": len(self._pages),
+            "generation": self.generation,
+        }
 
 
 class MemoryReader(IMemoryReader):
-    """Leitura de memória via Windows API — compatível com processos 32-bit."""
+    """Leitura de memória via backend do ProcessManager — compatível com processos 32-bit."""
 
     def __init__(self, process_manager, cache_ttl: float = 0.1):
         self._pm = process_manager
-        self._cache = MemoryCache(ttl=cache_ttl)
+        self._cache = PageCache(ttl=cache_ttl)
+        # Buffers reaproveitados entre leituras (sem create_string_buffer por campo)
+        self._pool: dict[int, bytearray] = {}
+        # Chamadas/bytes/falhas/latencia por rotulo; BotEngine agrega por tick.
+        self.io_stats = IOStats()
 
     def _check_handle(self) -> None:
         handle = getattr(self._pm, "process_handle", None)
@@ -68,12 +122,15 @@ class MemoryReader(IMemoryReader):
         # Tibia 8.60 / Kaldrox: endereços absolutos estáticos, sem delta ASLR
         return address.value
 
-    def _read_bytes_raw(self, address: MemoryAddress, size: int, label: str) -> bytes:
+    def _rpm_into(
+        self, address: MemoryAddress, target, label: str, allow_partial: bool = False
+    ) -> int:
         """
-        Núcleo da leitura. Retorna `size` bytes brutos do processo alvo.
+        Núcleo da leitura: lê direto em `target` pelo backend do processo.
 
-        Usa c_uint32 para o endereço (compatibilidade 32-bit processo / 64-bit Python).
-        Buffer alocado via create_string_buffer — ponteiro estável para RPM.
+        `target` e um buffer gravavel do chamador (bytearray ou memoryview
+        contiguo); o backend escreve na memoria dele, sem alocar nem copiar.
+        Retorna o numero de bytes lidos.
         """
         self._check_handle()
         real_address = self._get_real_address(address)
@@ -81,137 +138,184 @@ class MemoryReader(IMemoryReader):
         if real_address <= 0:
             raise MemoryReadError(f"Ponteiro nulo ao ler {label}.")
 
-        buf = ctypes.create_string_buffer(size)
-        bytes_read = ctypes.c_size_t(0)
-
-        ok = kernel32.ReadProcessMemory(
-            self._pm.process_handle,
-            ctypes.c_uint32(real_address),   # endereço truncado a 32-bit
-            buf,
-            ctypes.c_size_t(size),
-            ctypes.byref(bytes_read),
-        )
-
-        if not ok or bytes_read.value != size:
-            err = ctypes.get_last_error()
+        size = len(target)
+        start = time.perf_counter()
+        try:
+            got = self._pm.backend.read_into(real_address, target)
+        except MemoryReadError as e:
+            got, err = 0, e
+        else:
+            err = "leitura parcial"
+
+        failed = got == 0 or (not allow_partial and got != size)
+        self.io_stats.record(label, got, time.perf_counter() - start, not failed)
+        if failed:
             raise MemoryReadError(
                 f"Falha ao ler {label} em {address} "
-                f"(Real: {hex(real_address)}) - (WinError {err})"
+                f"(Real: {hex(real_address)}) - ({err})"
             )
+        return got
 
-        return buf.raw
+    def _scratch(self, size: int) -> bytearray:
+        """Buffer reutilizavel do pool do reader para leituras de `size` bytes."""
+        buf = self._pool.get(size)
+        if buf is None:
+            if len(self._pool) >= _MAX_POOLED_SIZES:
+                self._pool.clear()
+            buf = self._pool[size] = bytearray(size)
+        return buf
+
+    def _read_bytes_raw(self, address: MemoryAddress, size: int, label: str) -> bytes:
+        """Retorna `size` bytes brutos do processo alvo (lidos no buffer do pool)."""
+        buf = self._scratch(size)
+        self._rpm_into(address, buf, label)
+        return bytes(buf)
+
+    def read_into(self, address: MemoryAddress, target, label: str = "buffer") -> int:
+        """
+        Le len(target) bytes de `address` direto no buffer do chamador
+        (bytearray ou memoryview gravavel). Sem cache e sem alocacao:
+        pensado para os loops quentes dos readers, que mantem seus proprios
+        buffers entre ticks.
+        """
+        return self._rpm_into(address, target, label)
+
+    def execute_plan(self, plan: ReadPlan) -> Dict[Hashable, Any]:
+        """
+        Executa um ReadPlan: todas as faixas contiguas numa unica leitura
+        scatter do backend (uma syscall no Linux; um read por faixa no
+        Windows), nos buffers do proprio plano, e devolve {nome: valor}.
+        Levanta MemoryReadError se qualquer faixa falhar.
+        """
+        self._check_handle()
+        ranges = plan.ranges
+        buffers = plan.buffers
+        start = time.perf_counter()
+        counts = self._pm.backend.read_scatter(
+            [(rng.start, buf) for rng, buf in zip(ranges, buffers)]
+        )
+        ok = all(got == rng.size for rng, got in zip(ranges, counts))
+        self.io_stats.record(plan.label, sum(counts), time.perf_counter() - start, ok)
+        values: Dict[Hashable, Any] = {}
+        for index, (rng, got) in enumerate(zip(ranges, counts)):
+            if got != rng.size:
+                raise MemoryReadError(
+                    f"Falha ao ler {plan.label} em {hex(rng.start)} "
+                    f"({got}/{rng.size} bytes)"
+                )
+            plan.decode(index, buffers[index], values)
+        return values
+
+    # ------------------------------------------------------------------
+    # Cache de paginas
+    # ------------------------------------------------------------------
+
+    def _load_page(self, page_base: int, label: str) -> Optional[bytearray]:
+        """Retorna a pagina em cache ou a le inteira (None se ilegivel)."""
+        page = self._cache.get(page_base)
+        if page is not None:
+            self.io_stats.hit(label)
+        else:
+            # Reaproveita o buffer da geracao anterior desta pagina, se houver.
+            page = self._cache.buffer_for(page_base)
+            try:
+                self._rpm_into(MemoryAddress(page_base), page, label)
+            except MemoryReadError:
+                # Pagina parcialmente mapeada: o chamador le so o trecho pedido.
+                return None
+            self._cache.put(page_base, page)
+        return page
+
+    def _view(self, address: MemoryAddress, size: int, label: str, use_cache: bool):
+        """
+        Retorna (buffer, offset) contendo `size` bytes a partir de `address`.
+
+        Com cache, o buffer e a propria pagina cacheada (sem copia) quando o
+        campo cabe em uma pagina; campos que cruzam a fronteira juntam as
+        duas paginas. Sem cache, ou se a pagina nao puder ser lida inteira,
+        cai para um read exato do trecho.
+        """
+        if use_cache and size <= PAGE_SIZE:
+            real = self._get_real_address(address)
+            if real > 0:
+                page_base = real & _PAGE_MASK
+                offset = real - page_base
+                page = self._load_page(page_base, label)
+                if page is not None:
+                    if offset + size <= PAGE_SIZE:
+                        return page, offset
+                    nxt = self._load_page(page_base + PAGE_SIZE, label)
+                    if nxt is not None:
+                        return page[offset:] + nxt[: offset + size - PAGE_SIZE], 0
+        return self._read_bytes_raw(address, size, label), 0
+
+    def advance_generation(self) -> int:
+        """
+        Invalida o cache de paginas para um novo tick e avisa o backend.
+        Chamado pelo BotEngine no inicio de cada tick.
+        """
+        self._pm.backend.begin_tick()
+        return self._cache.advance()
+
+    @property
+    def cache_stats(self) -> dict[str, Any]:
+        """Contadores de hit/miss do cache de paginas."""
+        return self._cache.stats()
 
     # ------------------------------------------------------------------
     # Leituras tipadas
     # ------------------------------------------------------------------
 
     def read_int(self, address: MemoryAddress, use_cache: bool = True) -> int:
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached
-        raw = self._read_bytes_raw(address, 4, "inteiro")
-        value = struct.unpack_from("<i", raw)[0]
-        if use_cache:
-            self._cache.set(address, value)
-        return value
+        buf, off = self._view(address, 4, "inteiro", use_cache)
+        return _I32.unpack_from(buf, off)[0]
 
     def read_uint(self, address: MemoryAddress, use_cache: bool = True) -> int:
         """Unsigned 32-bit — útil para IDs de criaturas."""
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached
-        raw = self._read_bytes_raw(address, 4, "uint")
-        value = struct.unpack_from("<I", raw)[0]
-        if use_cache:
-            self._cache.set(address, value)
-        return value
+        buf, off = self._view(address, 4, "uint", use_cache)
+        return _U32.unpack_from(buf, off)[0]
 
     def read_int64(self, address: MemoryAddress, use_cache: bool = True) -> int:
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached
-        raw = self._read_bytes_raw(address, 8, "int64")
-        value = struct.unpack_from("<q", raw)[0]
-        if use_cache:
-            self._cache.set(address, value)
-        return value
+        buf, off = self._view(address, 8, "int64", use_cache)
+        return _I64.unpack_from(buf, off)[0]
 
     def read_byte(self, address: MemoryAddress, use_cache: bool = True) -> int:
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached & 0xFF
-        raw = self._read_bytes_raw(address, 1, "byte")
-        value = struct.unpack_from("<B", raw)[0]
-        if use_cache:
-            self._cache.set(address, value)
-        return value
+        buf, off = self._view(address, 1, "byte", use_cache)
+        return buf[off]
 
     def read_float(self, address: MemoryAddress, use_cache: bool = True) -> float:
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached
-        raw = self._read_bytes_raw(address, 4, "float")
-        value = struct.unpack_from("<f", raw)[0]
-        if use_cache:
-            self._cache.set(address, value)
-        return value
-
-    def read_string(self, address: MemoryAddress, max_length: int = 256, use_cache: bool = True) -> str:
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached
-
+        buf, off = self._view(address, 4, "float", use_cache)
+        return _F32.unpack_from(buf, off)[0]
+
+    def read_string(
+        self,
+        address: MemoryAddress,
+        max_length: int = DEFAULT_STRING_LENGTH,
+        use_cache: bool = True,
+    ) -> str:
         real_address = self._get_real_address(address)
         if real_address <= 0:
             return ""
 
-        self._check_handle()
-        buf = ctypes.create_string_buffer(max_length)
-        bytes_read = ctypes.c_size_t(0)
-
-        ok = kernel32.ReadProcessMemory(
-            self._pm.process_handle,
-            ctypes.c_uint32(real_address),
-            buf,
-            ctypes.c_size_t(max_length),
-            ctypes.byref(bytes_read),
-        )
-
-        if not ok:
-            err = ctypes.get_last_error()
-            raise MemoryReadError(
-                f"Falha ao ler string em {address} "
-                f"(Real: {hex(real_address)}) - WinError {err}"
-            )
-
-        try:
-            raw_data = buf.raw[: bytes_read.value]
-            value = raw_data.split(b"\x00", 1)[0].decode("latin-1", errors="ignore")
-        except Exception:
-            value = ""
-
         if use_cache:
-            self._cache.set(address, value)
-        return value
+            buf, off = self._view(address, max_length, "string", use_cache)
+            end = buf.find(b"\x00", off, off + max_length)
+            raw_data = buf[off:end if end >= 0 else off + max_length]
+            return raw_data.decode("latin-1", errors="ignore")
+
+        buf = self._scratch(max_length)
+        got = self._rpm_into(address, buf, "string", allow_partial=True)
+        end = buf.find(b"\x00", 0, got)
+        return buf[:end if end >= 0 else got].decode("latin-1", errors="ignore")
 
     def read_bytes(self, address: MemoryAddress, size: int, use_cache: bool = True) -> bytes:
-        if use_cache:
-            cached = self._cache.get(address)
-            if cached is not None:
-                return cached
-        raw = self._read_bytes_raw(address, size, f"{size} bytes")
-        if use_cache:
-            self._cache.set(address, raw)
-        return raw
+        buf, off = self._view(address, size, f"{size} bytes", use_cache)
+        if off == 0 and len(buf) == size:
+            return bytes(buf)
+        return bytes(buf[off:off + size])
 
     def clear_cache(self) -> None:
         self._cache.clear()
 
     def invalidate_cache(self, address: MemoryAddress) -> None:
-        self._cache.invalidate(address)
+        self._cache.invalidate(self._get_real_address(address))
@@ -1,42 +1,33 @@
-import ctypes
-import ctypes.wintypes as wintypes
+import time
+
 from src.core.interfaces.memory_interface import IMemoryWriter
 from src.core.value_objects.address import MemoryAddress
 from .process_manager import ProcessManager
-
-# CORRECAO: argtypes com c_uint32 para LPCVOID
-# Impede que Python 64-bit passe ponteiro de 8 bytes para processo 32-bit,
-# eliminando WinError 299 (ERROR_PARTIAL_COPY).
-kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
-
-kernel32.WriteProcessMemory.argtypes = [
-    wintypes.HANDLE,          # hProcess
-    ctypes.c_uint32,          # lpBaseAddress — FORÇADO 32-bit
-    ctypes.c_void_p,          # lpBuffer
-    ctypes.c_size_t,          # nSize
-    ctypes.POINTER(ctypes.c_size_t),  # lpNumberOfBytesWritten
-]
-kernel32.WriteProcessMemory.restype = wintypes.BOOL
+from .io_stats import IOStats
 
 
 class MemoryWriter(IMemoryWriter):
-    """Escritor de memória usando WinAPI — compatível com processos 32-bit."""
+    """Escritor de memória via backend do ProcessManager — compatível com processos 32-bit."""
 
     def __init__(self, process_manager: ProcessManager) -> None:
         self._pm = process_manager
+        self.io_stats = IOStats()
 
     @property
     def _handle(self):
         return self._pm.process_handle
 
+    def _write(self, address: MemoryAddress, data: bytes, label: str) -> bool:
+        if not self._handle:
+            return False
+        start = time.perf_counter()
+        ok = self._pm.backend.write(address.value, data)
+        self.io_stats.record(label, len(data) if ok else 0, time.perf_counter() - start, ok)
+        return ok
+
     def write_int(self, address: MemoryAddress, value: int) -> bool:
         """Escreve inteiro de 32 bits com sinal (signed)."""
-        data = int(value).to_bytes(4, "little", signed=True)
-        bytes_written = ctypes.c_size_t(0)
-        ok = kernel32.WriteProcessMemory(
-            self._handle, ctypes.c_uint32(address.value), data, len(data), ctypes.byref(bytes_written)
-        )
-        return bool(ok and bytes_written.value == len(data))
+        return self._write(address, int(value).to_bytes(4, "little", signed=True), "int")
 
     def write_uint(self, address: MemoryAddress, value: int) -> bool:
         """Escreve inteiro de 32 bits sem sinal (unsigned).
@@ -45,19 +36,8 @@ class MemoryWriter(IMemoryWriter):
         e qualquer valor que o Tibia armazena como DWORD/uint32. Evita
         OverflowError silencioso para IDs > 0x7FFFFFFF que ocorre com write_int.
         """
-        data = int(value).to_bytes(4, "little", signed=False)
-        bytes_written = ctypes.c_size_t(0)
-        ok = kernel32.WriteProcessMemory(
-            self._handle, ctypes.c_uint32(address.value), data, len(data), ctypes.byref(bytes_written)
-        )
-        return bool(ok and bytes_written.value == len(data))
+        return self._write(address, int(value).to_bytes(4, "little", signed=False), "uint")
 
     def write_bytes(self, address: MemoryAddress, data: bytes) -> bool:
         """Escreve bytes arbitrários."""
-        size = len(data)
-        c_data = ctypes.create_string_buffer(data, size)
-        bytes_written = ctypes.c_size_t(0)
-        ok = kernel32.WriteProcessMemory(
-            self._handle, ctypes.c_uint32(address.value), c_data, size, ctypes.byref(bytes_written)
-        )
-        return bool(ok and bytes_written.value == size)
+        return self._write(address, bytes(data), "bytes")
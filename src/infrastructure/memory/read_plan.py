@@ -0,0 +1,158 @@
+"""
+Planejador de leituras scatter/gather.
+
+Os modulos declaram um lote de campos (endereco + tipo) em um ReadPlan; o
+plano agrupa enderecos proximos no menor conjunto de faixas contiguas, e o
+MemoryReader faz UM read por faixa e decodifica todos os campos a partir
+dos buffers. Cada modulo deixa de ajustar seus proprios reads em bloco:
+basta declarar os campos.
+
+Exemplo:
+    plan = (
+        ReadPlan("player")
+        .add("hp", PLAYER["health"], "int")
+        .add("hp_max", PLAYER["health_max"], "int")
+        .add_string("name", PLAYER["name"], 30)
+    )
+    values = memory_reader.execute_plan(plan)   # 1 syscall
+"""
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from src.core.value_objects.address import MemoryAddress
+
+# Tipo -> struct precompilado. "string" e "bytes" tem tamanho variavel.
+FIELD_STRUCTS: Dict[str, struct.Struct] = {
+    "int":   struct.Struct("<i"),
+    "uint":  struct.Struct("<I"),
+    "int64": struct.Struct("<q"),
+    "byte":  struct.Struct("<B"),
+    "short": struct.Struct("<h"),
+    "float": struct.Struct("<f"),
+}
+
+# Distancia maxima (bytes) entre dois campos para que caiam na mesma faixa.
+# Ler alguns bytes a mais e muito mais barato que um ReadProcessMemory extra.
+DEFAULT_MAX_GAP = 64
+
+
+@dataclass(frozen=True)
+class PlanField:
+    """Campo declarado em um plano."""
+    name: Hashable
+    address: int
+    kind: str
+    size: int
+
+
+@dataclass(frozen=True)
+class ReadRange:
+    """Faixa contigua lida com um unico read; `fields` = (campo, offset)."""
+    start: int
+    size: int
+    fields: Tuple[Tuple[PlanField, int], ...]
+
+
+class ReadPlan:
+    """Lote de campos a ler, compilado em faixas contiguas."""
+
+    def __init__(self, label: str = "read plan", max_gap: int = DEFAULT_MAX_GAP):
+        self.label = label
+        self._max_gap = max_gap
+        self._fields: List[PlanField] = []
+        self._ranges: Optional[Tuple[ReadRange, ...]] = None
+        self._buffers: List[bytearray] = []
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def add(
+        self,
+        name: Hashable,
+        address: Union[MemoryAddress, int],
+        kind: str = "int",
+        size: Optional[int] = None,
+    ) -> "ReadPlan":
+        """
+        Declara um campo. `kind` e um de FIELD_STRUCTS, "string" ou "bytes"
+        (estes dois exigem `size`). Retorna o proprio plano (encadeavel).
+        """
+        if kind in FIELD_STRUCTS:
+            size = FIELD_STRUCTS[kind].size
+        elif kind in ("string", "bytes"):
+            if not size or size <= 0:
+                raise ValueError(f"Campo '{name}' do tipo {kind} exige size > 0.")
+        else:
+            raise ValueError(f"Tipo de campo desconhecido: {kind}")
+
+        addr = address.value if isinstance(address, MemoryAddress) else int(address)
+        self._fields.append(PlanField(name, addr, kind, size))
+        self._ranges = None  # recompila no proximo uso
+        return self
+
+    def add_string(
+        self, name: Hashable, address: Union[MemoryAddress, int], max_length: int = 32
+    ) -> "ReadPlan":
+        return self.add(name, address, "string", max_length)
+
+    # ------------------------------------------------------------------
+    # Compilacao
+    # ------------------------------------------------------------------
+
+    @property
+    def ranges(self) -> Tuple[ReadRange, ...]:
+        if self._ranges is None:
+            self._compile()
+        return self._ranges
+
+    @property
+    def buffers(self) -> List[bytearray]:
+        """Um buffer por faixa, reaproveitado em toda execucao do plano."""
+        if self._ranges is None:
+            self._compile()
+        return self._buffers
+
+    def _compile(self) -> None:
+        """Ordena os campos e funde os que estao a <= max_gap bytes de distancia."""
+        groups: List[List[PlanField]] = []
+        group_end = 0
+        for f in sorted(self._fields, key=lambda f: f.address):
+            if groups and f.address <= group_end + self._max_gap:
+                groups[-1].append(f)
+                group_end = max(group_end, f.address + f.size)
+            else:
+                groups.append([f])
+                group_end = f.address + f.size
+
+        ranges = []
+        for group in groups:
+            start = group[0].address
+            end = max(f.address + f.size for f in group)
+            ranges.append(
+                ReadRange(
+                    start=start,
+                    size=end - start,
+                    fields=tuple((f, f.address - start) for f in group),
+                )
+            )
+        self._ranges = tuple(ranges)
+        self._buffers = [bytearray(r.size) for r in self._ranges]
+
+    # ------------------------------------------------------------------
+    # Decodificacao
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def decode_field(field: PlanField, buf, offset: int) -> Any:
+        if field.kind == "string":
+            raw = bytes(buf[offset:offset + field.size]).split(b"\x00", 1)[0]
+            return raw.decode("latin-1", errors="ignore")
+        if field.kind == "bytes":
+            return bytes(buf[offset:offset + field.size])
+        return FIELD_STRUCTS[field.kind].unpack_from(buf, offset)[0]
+
+    def decode(self, index: int, buf, out: Dict[Hashable, Any]) -> None:
+        """Decodifica em `out` todos os campos da faixa `index` a partir de `buf`."""
+        for field, offset in self.ranges[index].fields:
+            out[field.name] = self.decode_field(field, buf, offset)
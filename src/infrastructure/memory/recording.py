@@ -0,0 +1,146 @@
+"""
+Formato de gravacao de memoria por tick (record-and-replay).
+
+Arquivo de dados (append-only):
+    cabecalho  : b"TBREC860" + versao (u32)
+    por tick   : tick (u32) | timestamp (f64) | n regioes (u16)
+                 n x [ endereco (u32) | tamanho (u32) | bytes ]
+
+Indice (<arquivo>.idx, append-only): um u64 por tick com o offset do
+registro no arquivo de dados. Se o indice faltar ou estiver incompleto
+(gravacao interrompida), ele e reconstruido varrendo os dados.
+
+A leitura usa mmap: as regioes de um tick sao memoryviews sobre o arquivo
+mapeado, sem copia.
+"""
+import mmap
+import os
+import struct
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, List, Optional, Sequence, Tuple
+
+MAGIC = b"TBREC860"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sI")
+_TICK = struct.Struct("<IdH")
+_REGION = struct.Struct("<II")
+_OFFSET = struct.Struct("<Q")
+
+
+@dataclass(frozen=True)
+class TickFrame:
+    """Regioes de memoria lidas em um tick: [(endereco, bytes)]."""
+    tick: int
+    timestamp: float
+    regions: Tuple[Tuple[int, memoryview], ...]
+
+
+class RecordingWriter:
+    """Grava ticks no arquivo de dados e no indice, sempre em append."""
+
+    def __init__(self, path: str):
+        self.path = path
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._data: BinaryIO = open(path, "ab")
+        self._index: BinaryIO = open(path + ".idx", "ab")
+        if new_file:
+            self._data.write(_HEADER.pack(MAGIC, VERSION))
+        self._tick = os.path.getsize(path + ".idx") // _OFFSET.size
+
+    @property
+    def tick_count(self) -> int:
+        return self._tick
+
+    def write_tick(
+        self, regions: Sequence[Tuple[int, bytes]], timestamp: Optional[float] = None
+    ) -> int:
+        """Acrescenta um tick com as regioes [(endereco, bytes)]. Retorna o indice."""
+        if len(regions) > 0xFFFF:
+            raise ValueError("Regioes demais em um tick.")
+        offset = self._data.tell()
+        parts = [_TICK.pack(self._tick, time.time() if timestamp is None else timestamp, len(regions))]
+        for address, data in regions:
+            parts.append(_REGION.pack(address, len(data)))
+            parts.append(data)
+        self._data.write(b"".join(parts))
+        self._data.flush()
+        self._index.write(_OFFSET.pack(offset))
+        self._index.flush()
+        self._tick += 1
+        return self._tick - 1
+
+    def close(self) -> None:
+        self._data.close()
+        self._index.close()
+
+
+class Recording:
+    """Leitura de uma gravacao via mmap, com acesso aleatorio por tick."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._map)
+        magic, version = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Arquivo de gravacao invalido: {path}")
+        self._offsets = self._load_index()
+
+    def _load_index(self) -> List[int]:
+        offsets: List[int] = []
+        idx_path = self.path + ".idx"
+        if os.path.exists(idx_path):
+            with open(idx_path, "rb") as f:
+                raw = f.read()
+            offsets = [o for (o,) in _OFFSET.iter_unpack(raw[: len(raw) - len(raw) % _OFFSET.size])]
+        # Descarta entradas que apontam alem do fim (gravacao interrompida)
+        # e completa varrendo o que veio depois do ultimo offset valido.
+        offsets = [o for o in offsets if self._frame_end(o) is not None]
+        pos = self._frame_end(offsets[-1]) if offsets else _HEADER.size
+        while pos is not None and pos < len(self._map):
+            end = self._frame_end(pos)
+            if end is None:
+                break
+            offsets.append(pos)
+            pos = end
+        return offsets
+
+    def _frame_end(self, offset: int) -> Optional[int]:
+        """Offset logo apos o tick em `offset`, ou None se estiver truncado."""
+        size = len(self._map)
+        if offset + _TICK.size > size:
+            return None
+        _, _, count = _TICK.unpack_from(self._map, offset)
+        pos = offset + _TICK.size
+        for _ in range(count):
+            if pos + _REGION.size > size:
+                return None
+            _, length = _REGION.unpack_from(self._map, pos)
+            pos += _REGION.size + length
+        return pos if pos <= size else None
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def frame(self, index: int) -> TickFrame:
+        offset = self._offsets[index]
+        tick, timestamp, count = _TICK.unpack_from(self._map, offset)
+        pos = offset + _TICK.size
+        regions = []
+        for _ in range(count):
+            address, length = _REGION.unpack_from(self._map, pos)
+            pos += _REGION.size
+            regions.append((address, self._view[pos:pos + length]))
+            pos += length
+        return TickFrame(tick, timestamp, tuple(regions))
+
+    def close(self) -> None:
+        try:
+            self._view.release()
+            self._map.close()
+        except BufferError:
+            pass  # ainda ha frames em uso; o mmap e fechado pelo GC
+        self._file.close()
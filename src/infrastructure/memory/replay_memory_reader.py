@@ -0,0 +1,43 @@
+"""
+MemoryReader servido por uma gravacao (replay offline, sem cliente).
+
+Uso:
+    reader = ReplayMemoryReader("hunt.tbrec")
+    engine = BotEngine(reader.process_manager, reader, injector,
+                       PLAYER, BATTLE_LIST, CREATURE)
+
+Cada tick do BotEngine (advance_generation) avanca um tick da gravacao,
+entao o loop roda tao rapido quanto a CPU permitir.
+"""
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.memory.recording import Recording
+from src.infrastructure.memory.backends.replay_backend import ReplayBackend
+
+
+class ReplayMemoryReader(MemoryReader):
+    """IMemoryReader que reproduz os bytes gravados por RecordingBackend."""
+
+    def __init__(self, path: str, loop: bool = False):
+        self.recording = Recording(path)
+        self.backend = ReplayBackend(self.recording, loop=loop)
+        self.process_manager = ProcessManager(backend=self.backend)
+        self.process_manager.attach()
+        # Sem TTL: a validade do cache segue apenas os ticks gravados.
+        super().__init__(self.process_manager, cache_ttl=0)
+
+    @property
+    def tick_index(self) -> int:
+        return self.backend.tick_index
+
+    @property
+    def tick_count(self) -> int:
+        return len(self.recording)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.backend.exhausted
+
+    def close(self) -> None:
+        self.process_manager.detach()
+        self.recording.close()
@@ -0,0 +1,197 @@
+"""
+Layouts declarativos de estruturas repetidas da memoria do cliente.
+
+Os offsets de addresses_860 (CREATURE, CONTAINER, VIP, ...) sao dicts que
+cada reader interpretava na mao, um with_offset por campo. Um StructLayout
+compila esses offsets + os tipos dos campos em:
+
+  - um struct.Struct unico, com padding, de tamanho == stride: um registro
+    inteiro sai de um unico unpack_from (ou iter_unpack para o array todo);
+  - opcionalmente um dtype estruturado do NumPy (mesmos offsets/itemsize),
+    para decodificar o array inteiro com np.frombuffer sem copia.
+
+O ArrayReader e o leitor generico: le `count * stride` bytes com UM read
+no buffer proprio e expoe os registros decodificados em bloco.
+"""
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+
+from src.core.value_objects.address import MemoryAddress
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tipo do campo -> (codigo struct, dtype NumPy). string/bytes usam o tamanho.
+_KINDS = {
+    "int":   ("i", "<i4"),
+    "uint":  ("I", "<u4"),
+    "int64": ("q", "<i8"),
+    "short": ("h", "<i2"),
+    "byte":  ("B", "u1"),
+    "float": ("f", "<f4"),
+}
+
+FieldType = Union[str, Tuple[str, int]]
+
+
+@dataclass(frozen=True)
+class LayoutField:
+    """Campo de um registro: nome, offset no registro, tipo e tamanho."""
+    name: str
+    offset: int
+    kind: str
+    size: int
+
+
+def decode_string(raw: bytes) -> str:
+    """Decodifica um campo string (bytes ate o primeiro NUL, latin-1)."""
+    return raw.split(b"\x00", 1)[0].decode("latin-1", errors="ignore")
+
+
+class StructLayout:
+    """Registro de stride fixo compilado em struct.Struct (+ dtype NumPy)."""
+
+    def __init__(self, name: str, fields: Tuple[LayoutField, ...], stride: int):
+        self.name = name
+        self.stride = stride
+        self.fields = tuple(sorted(fields, key=lambda f: f.offset))
+        self.names = tuple(f.name for f in self.fields)
+        # Posicao de cada campo na tupla retornada por unpack_from.
+        self.index: Dict[str, int] = {n: i for i, n in enumerate(self.names)}
+        self.struct = struct.Struct(self._format())
+        self._dtype = None
+
+    def _format(self) -> str:
+        fmt = ["<"]
+        cursor = 0
+        for f in self.fields:
+            if f.offset < cursor:
+                raise ValueError(
+                    f"Layout {self.name}: campo '{f.name}' sobrepoe o anterior "
+                    f"(offset {f.offset} < {cursor})."
+                )
+            if f.offset > cursor:
+                fmt.append(f"{f.offset - cursor}x")
+            fmt.append(f"{f.size}s" if f.kind in ("string", "bytes") else _KINDS[f.kind][0])
+            cursor = f.offset + f.size
+        if cursor > self.stride:
+            raise ValueError(f"Layout {self.name}: campos excedem o stride {self.stride}.")
+        if cursor < self.stride:
+            fmt.append(f"{self.stride - cursor}x")
+        return "".join(fmt)
+
+    def field(self, name: str) -> LayoutField:
+        return self.fields[self.index[name]]
+
+    def unpack_from(self, buffer, offset: int = 0) -> Tuple[Any, ...]:
+        """Tupla crua de um registro (strings como bytes) na ordem de `names`."""
+        return self.struct.unpack_from(buffer, offset)
+
+    def iter_unpack(self, buffer) -> Iterator[Tuple[Any, ...]]:
+        """Itera todos os registros de um buffer de len == count * stride."""
+        return self.struct.iter_unpack(buffer)
+
+    def decode(self, buffer, offset: int = 0) -> Dict[str, Any]:
+        """Registro como dict, com strings ja decodificadas."""
+        values = self.unpack_from(buffer, offset)
+        return {
+            f.name: decode_string(v) if f.kind == "string" else v
+            for f, v in zip(self.fields, values)
+        }
+
+    @property
+    def dtype(self):
+        """dtype estruturado do NumPy equivalente (None sem NumPy)."""
+        if np is None:
+            return None
+        if self._dtype is None:
+            self._dtype = np.dtype({
+                "names": list(self.names),
+                "formats": [
+                    f"S{f.size}" if f.kind == "string"
+                    else f"V{f.size}" if f.kind == "bytes"
+                    else _KINDS[f.kind][1]
+                    for f in self.fields
+                ],
+                "offsets": [f.offset for f in self.fields],
+                "itemsize": self.stride,
+            })
+        return self._dtype
+
+
+def compile_layout(
+    name: str,
+    offsets: Dict[str, Any],
+    types: Dict[str, FieldType],
+    stride: int,
+    prefix: str = "",
+) -> StructLayout:
+    """
+    Compila um layout a partir de uma tabela de offsets de addresses_860.
+
+    Args:
+        offsets: tabela crua (ex.: CREATURE, VIP). Chaves nao listadas em
+            `types` (start, step, max_*) sao ignoradas.
+        types: campo -> tipo ("int", "uint", "byte", ...) ou (tipo, tamanho).
+            Strings sem tamanho explicito vao ate o proximo campo da tabela.
+        stride: tamanho de um registro.
+        prefix: prefixo das chaves na tabela (ex.: "distance_" em VIP).
+    """
+    resolved = {field: offsets[prefix + field] for field in types}
+    fields = []
+    for field, spec in types.items():
+        kind, size = spec if isinstance(spec, tuple) else (spec, None)
+        off = resolved[field]
+        if kind in ("string", "bytes"):
+            if size is None:
+                following = [o for o in resolved.values() if o > off]
+                size = (min(following) if following else stride) - off
+        elif kind in _KINDS:
+            size = struct.calcsize("<" + _KINDS[kind][0])
+        else:
+            raise ValueError(f"Layout {name}: tipo desconhecido '{kind}' em '{field}'.")
+        fields.append(LayoutField(field, off, kind, size))
+    return StructLayout(name, tuple(fields), stride)
+
+
+class ArrayReader:
+    """
+    Leitor generico de arrays de registros de stride fixo (battle list,
+    containers, VIP...): um read por chamada, num buffer reaproveitado.
+    """
+
+    def __init__(
+        self,
+        memory_reader,
+        layout: StructLayout,
+        start: MemoryAddress,
+        count: int,
+        label: Optional[str] = None,
+    ):
+        self._memory = memory_reader
+        self.layout = layout
+        self.start = start
+        self.count = count
+        self._label = label or layout.name
+        self.buffer = bytearray(layout.stride * count)
+
+    def read(self) -> bytearray:
+        """Le o array inteiro no buffer proprio e o retorna."""
+        self._memory.read_into(self.start, self.buffer, self._label)
+        return self.buffer
+
+    def records(self) -> Iterator[Tuple[Any, ...]]:
+        """Le e itera os registros crus (tuplas na ordem de layout.names)."""
+        return self.layout.iter_unpack(self.read())
+
+    def as_array(self):
+        """
+        Le e devolve o array como ndarray estruturado (view do buffer,
+        valido ate a proxima leitura). Requer NumPy.
+        """
+        if np is None:
+            raise RuntimeError("NumPy nao instalado: as_array() indisponivel.")
+        return np.frombuffer(self.read(), dtype=self.layout.dtype, count=self.count)
@@ -3,5 +3,6 @@ Infrastructure Readers - módulo de leitura de estado do jogo.
 """
 from .player_reader import PlayerReader
 from .creature_reader import CreatureReader
+from .world_reader import WorldReader
 
-__all__ = ["PlayerReader", "CreatureReader"]
+__all__ = ["PlayerReader", "CreatureReader", "WorldReader"]
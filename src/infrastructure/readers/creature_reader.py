@@ -1,12 +1,38 @@
 """
 Leitor de dados das Criaturas (Battle List) na memoria do cliente Tibia.
+
+Modo snapshot (padrao):
+  A BattleList inteira (max_creatures * step = 250 * 0xA8 = ~41 KB) e lida
+  com UM unico ReadProcessMemory por tick e vista como array estruturado
+  NumPy (dtype do layout compilado dos offsets CREATURE). Slots vazios sao
+  descartados por mascara; as colunas dos ocupados formam a CreatureTable
+  do tick, usada nas consultas vetorizadas do aimbot.
+
+Slots inalterados:
+  Cada slot e comparado byte a byte com o tick anterior. Slots iguais
+  reaproveitam o Creature do tick anterior (sem novos Creature/Position/
+  Stats) e o nome so e decodificado quando o id do slot muda.
+  O modo antigo (um read por campo, ~7 syscalls por slot) continua disponivel
+  como fallback quando o read em bloco falha.
+
+Indice de slots:
+  Cada passada registra o mapa slot -> Creature em `slots`. O PlayerReader
+  usa esse mapa para achar a propria entrada do player sem revisitar a
+  BattleList (um unico passe por slot por tick).
 """
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
 from src.core.entities.creature import Creature
+from src.core.entities.creature_table import CreatureTable, CREATURE_TABLE_DTYPE
 from src.core.value_objects.position import Position
 from src.core.value_objects.stats import Stats
 from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.layouts_860 import creature_layout
+from src.infrastructure.memory.struct_layout import ArrayReader, decode_string
 from src.core.value_objects.address import MemoryAddress
+from src.core.exceptions.memory_exceptions import MemoryReadError
 from src.infrastructure.logging.logger import get_logger
 
 
@@ -18,14 +44,149 @@ class CreatureReader:
         memory_reader: MemoryReader,
         battle_list_addresses: Dict[str, Any],
         creature_offsets: Dict[str, int],
+        snapshot_mode: bool = True,
     ):
         self._memory = memory_reader
         self._addresses = battle_list_addresses
         self._offsets = creature_offsets
+        self._snapshot_mode = snapshot_mode
+        self._layout = creature_layout(creature_offsets, battle_list_addresses["step"])
+        self._array = ArrayReader(
+            memory_reader,
+            self._layout,
+            battle_list_addresses["start"],
+            battle_list_addresses["max_creatures"],
+            label="battle list",
+        )
+        self._slots: Dict[int, Creature] = {}
+        self._table: CreatureTable = CreatureTable.empty()
+        # Copia (slots x step) da BattleList do tick anterior, para detectar
+        # slots alterados.
+        self._previous: Optional[np.ndarray] = None
         self._log = get_logger("CreatureReader")
 
+    @property
+    def slots(self) -> Dict[int, Creature]:
+        """Mapa slot -> Creature da ultima passada pela BattleList."""
+        return self._slots
+
+    @property
+    def table(self) -> CreatureTable:
+        """Colunas NumPy da ultima passada, alinhadas com get_creatures()."""
+        return self._table
+
     def get_creatures(self) -> List[Creature]:
         """Le todos os slots da BattleList e retorna criaturas validas."""
+        creatures: List[Creature] = []
+        table_stale = True
+        if self._snapshot_mode:
+            try:
+                creatures = self._get_creatures_snapshot()
+                table_stale = False
+            except MemoryReadError as e:
+                self._log.debug(f"Snapshot da battle list falhou; lendo por campo: {e}")
+                self._previous = None
+                creatures = self._get_creatures_per_field()
+            except Exception as e:
+                self._log.error(f"Erro critico ao decodificar snapshot da battle list: {e}")
+        else:
+            creatures = self._get_creatures_per_field()
+
+        if table_stale:
+            self._table = CreatureTable.from_creatures(creatures)
+        self._slots = {c.battle_slot: c for c in creatures}
+        return creatures
+
+    # ------------------------------------------------------------------
+    # Modo snapshot: 1 read para a BattleList inteira
+    # ------------------------------------------------------------------
+
+    def _get_creatures_snapshot(self) -> List[Creature]:
+        # Le direto no buffer do ArrayReader: nenhuma alocacao por tick.
+        raw = self._array.read()
+        return self._decode_snapshot(raw, self._layout.stride, self._array.count)
+
+    def _dirty_slots(self, raw: bytearray, step: int, max_creatures: int) -> np.ndarray:
+        """
+        Mascara dos slots cujos bytes mudaram desde o tick anterior (byte
+        compare de cada slot contra a copia guardada). Atualiza a copia.
+        """
+        current = np.frombuffer(raw, dtype=np.uint8, count=step * max_creatures)
+        current = current.reshape(max_creatures, step)
+        previous = self._previous
+        if previous is None or previous.shape != current.shape:
+            self._previous = current.copy()
+            return np.ones(max_creatures, dtype=bool)
+        dirty = (current != previous).any(axis=1)
+        np.copyto(previous, current)
+        return dirty
+
+    def _decode_snapshot(self, raw: bytearray, step: int, max_creatures: int) -> List[Creature]:
+        """
+        Decodifica todos os slots a partir do buffer da BattleList.
+
+        O buffer e visto como array estruturado (dtype do layout): slots
+        vazios/invalidos sao descartados por mascara e so os ocupados viram
+        Creature. As colunas desses slots vao para a CreatureTable do tick.
+
+        Slots com os mesmos bytes do tick anterior reaproveitam o Creature
+        ja construido; o nome so e decodificado quando o id do slot muda.
+        """
+        rows = np.frombuffer(raw, dtype=self._layout.dtype, count=max_creatures)
+        dirty = self._dirty_slots(raw, step, max_creatures)
+        # IDs sao DWORD (uint32) — ver BUG #7 em _get_creatures_per_field
+        occupied = np.flatnonzero((rows["id"] != 0) & (rows["x"] > 0) & (rows["y"] > 0))
+        sel = rows[occupied]
+
+        table = np.zeros(len(sel), dtype=CREATURE_TABLE_DTYPE)
+        for column in CREATURE_TABLE_DTYPE.names:
+            if column in self._layout.index:
+                table[column] = sel[column]
+        table["hp_bar"] = np.clip(table["hp_bar"], 0, 100)
+
+        name_field = self._layout.field("name")
+        previous = self._slots
+        creatures = []
+        for row, slot_index, changed in zip(
+            table.tolist(), occupied.tolist(), dirty[occupied].tolist()
+        ):
+            before = previous.get(slot_index)
+            if not changed and before is not None:
+                creatures.append(before)
+                continue
+
+            creature_id, x, y, z, hp = row[0], row[1], row[2], row[3], row[4]
+            if before is not None and before.id == creature_id:
+                name = before.name
+            else:
+                start = slot_index * step + name_field.offset
+                name = decode_string(raw[start:start + name_field.size]).strip() or "Unknown"
+
+            creatures.append(
+                Creature(
+                    id=creature_id,
+                    name=name,
+                    position=Position(x, y, z),
+                    stats=Stats(
+                        health=hp,
+                        max_health=100,
+                        mana=0,
+                        max_mana=0,
+                    ),
+                    visible=True,
+                    walking=False,
+                    battle_slot=slot_index,
+                )
+            )
+
+        self._table = CreatureTable(table, creatures)
+        return creatures
+
+    # ------------------------------------------------------------------
+    # Modo legado: 1 read por campo (fallback)
+    # ------------------------------------------------------------------
+
+    def _get_creatures_per_field(self) -> List[Creature]:
         creatures = []
         try:
             start_addr: MemoryAddress = self._addresses["start"]
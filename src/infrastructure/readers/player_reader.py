@@ -17,31 +17,140 @@ CORREÇÃO POSIÇÃO (BUG-POS-B):
     read_int() recebe MemoryAddress diretamente; internamente chama
     _get_real_address(addr) que acessa addr.value.
     _get_position_from_battlelist() monta MemoryAddress(int) corretamente.
+
+LEITURA VIA READ PLAN:
+  Todos os campos de PLAYER (flags 0x63FE20 ... experience/id) e os
+  go_to_x/y/z de PLAYER_EXTRA (ate 0x63FEDC) sao declarados em um ReadPlan;
+  o planejador os funde numa faixa contigua de 0xC0 bytes e o get_player()
+  faz UM read por tick (~15 syscalls -> 1). Outros modulos (WorldReader:
+  TARGET) podem adicionar campos ao mesmo plano via `plan`. Campos fora do
+  plano, ou enderecos passados como int puro, continuam lidos um a um.
 """
-from typing import Dict, Optional
+import struct
+from typing import Dict, Optional, Any, Hashable
 
 from src.core.entities.player import Player
+from src.core.entities.creature import Creature
 from src.core.value_objects.position import Position
 from src.core.value_objects.stats import Stats
 from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.read_plan import ReadPlan
 from src.core.value_objects.address import MemoryAddress
 from src.core.exceptions.memory_exceptions import MemoryReadError
 from src.core.constants.addresses_860 import VOCATIONS, BATTLE_LIST, CREATURE
 from src.infrastructure.logging.logger import get_logger
 
+_INT32 = struct.Struct("<i")
+_UINT32 = struct.Struct("<I")
+
+# Campos do player declarados no plano -> (tipo, tamanho).
+_PLAN_FIELDS = {
+    "flags": ("int", None), "vocation": ("byte", None), "name": ("string", 30),
+    "capacity": ("int", None), "stamina": ("int", None), "soul": ("int", None),
+    "mana_max": ("int", None), "mana": ("int", None), "magic_level": ("int", None),
+    "level": ("int", None), "experience": ("int", None), "health_max": ("int", None),
+    "health": ("int", None), "id": ("int", None),
+    "hp": ("int", None), "max_hp": ("int", None), "mp": ("int", None),
+    "max_mana": ("int", None), "player_id": ("int", None),
+    "go_to_x": ("int", None), "go_to_y": ("int", None), "go_to_z": ("int", None),
+}
+
 
 class PlayerReader:
     """Responsavel por extrair as informacoes do jogador da memoria."""
 
-    def __init__(self, memory_reader: MemoryReader, addresses: Dict[str, MemoryAddress]):
+    def __init__(
+        self,
+        memory_reader: MemoryReader,
+        addresses: Dict[str, MemoryAddress],
+        block_read: bool = True,
+    ):
         self._memory = memory_reader
         self._addresses = addresses
         self._log = get_logger("PlayerReader")
 
+        # Indice do slot da BattleList onde o player foi visto por ultimo.
+        self._player_slot: int = -1
+
+        self._plan = ReadPlan("player")
+        if block_read:
+            for key, (kind, size) in _PLAN_FIELDS.items():
+                addr = addresses.get(key)
+                if isinstance(addr, MemoryAddress):
+                    self._plan.add(key, addr, kind, size)
+        self._slot_buf = bytearray()
+        self._battle_buf = bytearray()
+
+    # ------------------------------------------------------------------
+    # Read plan do player
+    # ------------------------------------------------------------------
+
+    @property
+    def plan(self) -> ReadPlan:
+        """Plano de leitura do player; aceita campos extras de outros modulos."""
+        return self._plan
+
+    def read_fields(self) -> Optional[Dict[Hashable, Any]]:
+        """
+        Executa o plano do player (1 read por faixa contigua) e devolve
+        {campo: valor}. None se o plano estiver vazio ou o read falhar.
+        """
+        if not len(self._plan):
+            return None
+        try:
+            return self._memory.execute_plan(self._plan)
+        except MemoryReadError as e:
+            self._log.debug(f"Read plan do player falhou; lendo por campo: {e}")
+            return None
+
+    def _key(self, *keys: str) -> Optional[str]:
+        """Primeira chave (entre aliases) presente no dicionario PLAYER."""
+        for key in keys:
+            if self._addresses.get(key):
+                return key
+        return None
+
+    def _read_int(
+        self, values: Optional[Dict[Hashable, Any]], key: str, use_cache: bool = True
+    ) -> int:
+        if values is not None and key in values:
+            return values[key]
+        return self._memory.read_int(self._addresses[key], use_cache=use_cache)
+
+    def _read_byte(self, values: Optional[Dict[Hashable, Any]], key: str) -> int:
+        if values is not None and key in values:
+            return values[key]
+        return self._memory.read_byte(self._addresses[key])
+
+    def _read_string(
+        self, values: Optional[Dict[Hashable, Any]], key: str, max_length: int
+    ) -> str:
+        if values is not None and key in values:
+            return values[key]
+        return self._memory.read_string(self._addresses[key], max_length=max_length)
+
     # ------------------------------------------------------------------
     # Posição via BattleList
     # ------------------------------------------------------------------
 
+    def _find_in_slots(
+        self, player_id: int, battle_list: Dict[int, Creature]
+    ) -> Optional[Creature]:
+        """
+        Localiza o player no resultado da passada do CreatureReader
+        (slot -> Creature), sem nenhum read extra de memoria.
+        Checa primeiro o slot em cache; so varre o dict se o id mudou.
+        """
+        entry = battle_list.get(self._player_slot)
+        if entry is not None and entry.id == player_id:
+            return entry
+        for slot, creature in battle_list.items():
+            if creature.id == player_id:
+                self._player_slot = slot
+                return creature
+        self._player_slot = -1
+        return None
+
     def _get_position_from_battlelist(self, player_id: int) -> Optional[Position]:
         """
         Busca a posição real do player na BattleList.
@@ -50,8 +159,10 @@ class PlayerReader:
         CREATURE["x"]=36, CREATURE["y"]=40, CREATURE["z"]=44
         dentro do slot cuja id == player_id.
 
-        MemoryAddress(int) é o construtor correto — o atributo do dataclass
-        é .value, usado internamente por MemoryReader._get_real_address().
+        Cache de slot: o indice do ultimo slot encontrado e checado primeiro
+        (1 read do cabecalho id..z). A varredura completa so acontece quando
+        o id desse slot nao bate mais, e usa 1 read em bloco da BattleList
+        em vez de 250 reads de id.
         """
         try:
             base_addr   = BATTLE_LIST["start"].value   # int: 0x63FEF8
@@ -62,43 +173,58 @@ class PlayerReader:
             off_x  = CREATURE["x"]  # 36
             off_y  = CREATURE["y"]  # 40
             off_z  = CREATURE["z"]  # 44
-
-            for i in range(max_entries):
-                slot_base = base_addr + i * step
-
-                slot_id = self._memory.read_int(
-                    MemoryAddress(slot_base + off_id)
+            header = max(off_id, off_x, off_y, off_z) + 4
+            player_id &= 0xFFFFFFFF
+
+            raw: Optional[bytearray] = None
+            slot_base = 0
+            if self._player_slot >= 0:
+                if len(self._slot_buf) != header:
+                    self._slot_buf = bytearray(header)
+                raw = self._slot_buf
+                self._memory.read_into(
+                    MemoryAddress(base_addr + self._player_slot * step), raw, "player slot"
                 )
-                if slot_id != player_id:
-                    continue
-
-                # Encontrou o slot do player
-                px = self._memory.read_int(MemoryAddress(slot_base + off_x))
-                py = self._memory.read_int(MemoryAddress(slot_base + off_y))
-                pz = self._memory.read_int(MemoryAddress(slot_base + off_z))
-
-                if px > 0 and py > 0:
-                    return Position(x=px, y=py, z=pz)
 
-                return None  # slot encontrado mas coordenadas inválidas
+            if raw is None or _UINT32.unpack_from(raw, off_id)[0] != player_id:
+                if len(self._battle_buf) != step * max_entries:
+                    self._battle_buf = bytearray(step * max_entries)
+                raw = self._battle_buf
+                self._memory.read_into(MemoryAddress(base_addr), raw, "battle list")
+                self._player_slot = -1
+                for i in range(max_entries):
+                    if _UINT32.unpack_from(raw, i * step + off_id)[0] == player_id:
+                        self._player_slot = i
+                        break
+                if self._player_slot < 0:
+                    return None
+                slot_base = self._player_slot * step
+
+            px = _INT32.unpack_from(raw, slot_base + off_x)[0]
+            py = _INT32.unpack_from(raw, slot_base + off_y)[0]
+            pz = _INT32.unpack_from(raw, slot_base + off_z)[0]
+
+            if px > 0 and py > 0:
+                return Position(x=px, y=py, z=pz)
+
+            return None  # slot encontrado mas coordenadas inválidas
 
         except Exception as e:
             self._log.debug(f"Falha ao ler posicao via BattleList: {e}")
         return None
 
-    def _get_position_fallback(self) -> Position:
+    def _get_position_fallback(
+        self, values: Optional[Dict[Hashable, Any]] = None
+    ) -> Position:
         """
         Fallback: lê go_to_x/y/z (PLAYER_EXTRA).
         Usado apenas se BattleList não retornar posição válida.
         """
-        addr_gx = self._addresses.get("go_to_x")
-        addr_gy = self._addresses.get("go_to_y")
-        addr_gz = self._addresses.get("go_to_z")
-        if addr_gx and addr_gy and addr_gz:
+        if self._key("go_to_x") and self._key("go_to_y") and self._key("go_to_z"):
             try:
-                px = self._memory.read_int(addr_gx, use_cache=False)
-                py = self._memory.read_int(addr_gy, use_cache=False)
-                pz = self._memory.read_int(addr_gz, use_cache=False)
+                px = self._read_int(values, "go_to_x", use_cache=False)
+                py = self._read_int(values, "go_to_y", use_cache=False)
+                pz = self._read_int(values, "go_to_z", use_cache=False)
                 if px > 0 and py > 0:
                     return Position(x=px, y=py, z=pz)
             except Exception as e:
@@ -109,68 +235,76 @@ class PlayerReader:
     # Leitura principal
     # ------------------------------------------------------------------
 
-    def get_player(self) -> Optional[Player]:
-        """Le os enderecos de memoria e constroi a entidade Player."""
+    def get_player(
+        self,
+        battle_list: Optional[Dict[int, Creature]] = None,
+        values: Optional[Dict[Hashable, Any]] = None,
+    ) -> Optional[Player]:
+        """
+        Le os enderecos de memoria e constroi a entidade Player.
+
+        Args:
+            battle_list: mapa slot -> Creature da passada do CreatureReader
+                neste tick. Quando informado, posicao e nome do player saem
+                dele (cada slot e visitado uma unica vez por tick); caso
+                contrario, a BattleList e consultada direto na memoria.
+            values: resultado de read_fields() ja executado neste tick
+                (WorldReader decodifica o target do mesmo plano).
+        """
         try:
-            addr_id = self._addresses.get("id") or self._addresses.get("player_id")
-            if not addr_id:
+            key_id = self._key("id", "player_id")
+            if not key_id:
                 self._log.error("Chave 'id' ausente no dicionario PLAYER.")
                 return None
 
-            player_id = self._memory.read_int(addr_id)
+            if values is None:
+                values = self.read_fields()
+
+            player_id = self._read_int(values, key_id)
             if player_id <= 0:
                 return None
 
             # Atributos vitais
-            addr_hp       = self._addresses.get("health",    self._addresses.get("hp"))
-            addr_hp_max   = self._addresses.get("health_max", self._addresses.get("max_hp"))
-            addr_mana     = self._addresses.get("mana",      self._addresses.get("mp"))
-            addr_mana_max = self._addresses.get("mana_max",  self._addresses.get("max_mana"))
+            key_hp       = self._key("health", "hp")
+            key_hp_max   = self._key("health_max", "max_hp")
+            key_mana     = self._key("mana", "mp")
+            key_mana_max = self._key("mana_max", "max_mana")
 
-            health     = self._memory.read_int(addr_hp)       if addr_hp       else 0
-            health_max = self._memory.read_int(addr_hp_max)   if addr_hp_max   else 0
-            mana       = self._memory.read_int(addr_mana)     if addr_mana     else 0
-            mana_max   = self._memory.read_int(addr_mana_max) if addr_mana_max else 0
+            health     = self._read_int(values, key_hp)       if key_hp       else 0
+            health_max = self._read_int(values, key_hp_max)   if key_hp_max   else 0
+            mana       = self._read_int(values, key_mana)     if key_mana     else 0
+            mana_max   = self._read_int(values, key_mana_max) if key_mana_max else 0
 
             if health < 0 or health_max <= 0 or mana < 0 or mana_max <= 0:
                 return None
 
-            # Stats gerais — fallback None (nao usar addr_id como fallback)
-            addr_level   = self._addresses.get("level")
-            addr_exp     = self._addresses.get("experience")
-            addr_mlvl    = self._addresses.get("magic_level")
-            addr_soul    = self._addresses.get("soul")
-            addr_stamina = self._addresses.get("stamina")
-            addr_cap     = self._addresses.get("capacity")
-
-            level       = self._memory.read_int(addr_level)   if addr_level   else 0
-            experience  = self._memory.read_int(addr_exp)     if addr_exp     else 0
-            magic_level = self._memory.read_int(addr_mlvl)    if addr_mlvl    else 0
-            soul        = self._memory.read_int(addr_soul)    if addr_soul    else 0
-            stamina     = self._memory.read_int(addr_stamina) if addr_stamina else 0
+            # Stats gerais — fallback 0 (nao usar o id como fallback)
+            level       = self._read_int(values, "level")       if self._key("level")       else 0
+            experience  = self._read_int(values, "experience")  if self._key("experience")  else 0
+            magic_level = self._read_int(values, "magic_level") if self._key("magic_level") else 0
+            soul        = self._read_int(values, "soul")        if self._key("soul")        else 0
+            stamina     = self._read_int(values, "stamina")     if self._key("stamina")     else 0
             # FIXME: capacity address overlaps with name buffer (addresses_860.py)
             # Retorna 0 como fallback seguro ate endereco real ser calibrado via CE.
             try:
-                capacity    = self._memory.read_int(addr_cap)     if addr_cap     else 0
+                capacity    = self._read_int(values, "capacity") if self._key("capacity") else 0
             except Exception:
                 capacity    = 0
 
             # Vocacao — lê 1 byte (read_int contamina com bytes adjacentes)
             vocation = "Unknown"
-            addr_voc = self._addresses.get("vocation")
-            if addr_voc:
+            if self._key("vocation"):
                 try:
-                    voc_id   = self._memory.read_byte(addr_voc)
+                    voc_id   = self._read_byte(values, "vocation")
                     vocation = VOCATIONS.get(voc_id, f"Unknown({voc_id})")
                 except Exception:
                     pass
 
             # Nome — placeholder ate bot_engine sincronizar com a BattleList
             player_name = "Carregando..."
-            addr_name = self._addresses.get("name")
-            if addr_name:
+            if self._key("name"):
                 try:
-                    raw = self._memory.read_string(addr_name, max_length=30)
+                    raw = self._read_string(values, "name", max_length=30)
                     if raw and raw.strip() and not raw.strip().isspace():
                         player_name = raw.strip()
                 except Exception:
@@ -183,12 +317,20 @@ class PlayerReader:
             # não o tile atual. A posição real está na BattleList, slot cuja
             # id == player_id, offsets x=36 / y=40 / z=44.
             # ----------------------------------------------------------
-            position = self._get_position_from_battlelist(player_id)
+            position = None
+            if battle_list is not None:
+                entry = self._find_in_slots(player_id, battle_list)
+                if entry is not None:
+                    position = entry.position
+                    if entry.name and entry.name not in ("Unknown", ""):
+                        player_name = entry.name
+            else:
+                position = self._get_position_from_battlelist(player_id)
             if position is None:
                 self._log.debug(
                     "Posicao via BattleList indisponivel; usando go_to_x/y/z como fallback."
                 )
-                position = self._get_position_fallback()
+                position = self._get_position_fallback(values)
 
             player = Player(
                 id=player_id,
@@ -211,7 +353,7 @@ class PlayerReader:
 
             if "flags" in self._addresses:
                 try:
-                    flags = self._memory.read_int(self._addresses["flags"])
+                    flags = self._read_int(values, "flags")
                     if hasattr(player, "flags"):
                         player.flags = flags
                 except Exception:
@@ -0,0 +1,136 @@
+"""
+Leitor unificado do estado do jogo: um snapshot imutavel por tick.
+
+Antes a BattleList era percorrida tres vezes por tick (PlayerReader para a
+posicao, CreatureReader para as criaturas e BotEngine._update_state para
+casar o player por id). O WorldReader faz o minimo de reads em bloco:
+
+  1. BattleList inteira (CreatureReader, modo snapshot)     -> 1 read
+  2. Read plan do player 0x63FE20..0x63FEE0 (PlayerReader)  -> 1 read
+     - TARGET target_id / target_battlelist_id sao adicionados ao mesmo
+       plano; o planejador os funde na faixa do player, sem read extra.
+
+A posicao e o nome do player saem da passada do passo 1 (slot em cache).
+
+read(creatures=False) e o caminho leve para ticks em que nenhum script
+devido usa criaturas: so o plano do player e o cabecalho do slot do player
+na BattleList; criaturas e tabela vem do snapshot anterior.
+
+Cada snapshot referencia o anterior (`previous`); a camada de eventos
+compara os dois em vez de guardar copias das listas.
+"""
+from typing import Dict, Any, Hashable, Optional
+
+from src.core.entities.world_snapshot import WorldSnapshot
+from src.core.value_objects.address import MemoryAddress
+from src.core.value_objects.target_state import TargetState
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.readers.player_reader import PlayerReader
+from src.infrastructure.readers.creature_reader import CreatureReader
+from src.infrastructure.logging.logger import get_logger
+
+
+class WorldReader:
+    """Produz um WorldSnapshot por tick a partir de reads em bloco."""
+
+    def __init__(
+        self,
+        memory_reader: MemoryReader,
+        player_addresses: Dict[str, Any],
+        battle_list_addresses: Dict[str, Any],
+        creature_offsets: Dict[str, int],
+        target_addresses: Optional[Dict[str, Any]] = None,
+    ):
+        self._memory = memory_reader
+        self._player_reader = PlayerReader(memory_reader, player_addresses)
+        self._creature_reader = CreatureReader(
+            memory_reader, battle_list_addresses, creature_offsets
+        )
+        self._log = get_logger("WorldReader")
+
+        # Target entra no plano do player (mesma faixa contigua).
+        self._target_addresses = target_addresses or {}
+        self._target_planned = False
+        addr_target = self._target_addresses.get("target_id")
+        addr_bl = self._target_addresses.get("target_battlelist_id")
+        if isinstance(addr_target, MemoryAddress) and isinstance(addr_bl, MemoryAddress):
+            (self._player_reader.plan
+                .add("target_id", addr_target, "uint")
+                .add("target_battlelist_id", addr_bl, "uint"))
+            self._target_planned = True
+
+        self._last: Optional[WorldSnapshot] = None
+
+    def read(
+        self,
+        creatures: bool = True,
+        tick: int = 0,
+        timestamp: float = 0.0,
+        engine: Any = None,
+    ) -> WorldSnapshot:
+        """
+        Le player, criaturas e target e devolve um snapshot imutavel.
+
+        Args:
+            creatures: False pula a BattleList inteira; criaturas e tabela
+                sao reaproveitadas do snapshot anterior.
+            tick, timestamp, engine: metadados gravados no snapshot.
+        """
+        if not creatures and self._last is not None:
+            return self._read_light(tick, timestamp, engine)
+        found = self._creature_reader.get_creatures()
+        values = self._player_reader.read_fields()
+        player = self._player_reader.get_player(
+            battle_list=self._creature_reader.slots,
+            values=values,
+        )
+        self._last = WorldSnapshot(
+            player=player,
+            creatures=tuple(found),
+            target=self._read_target(values),
+            table=self._creature_reader.table,
+            tick=tick,
+            timestamp=timestamp,
+            previous=self._last,
+            engine=engine,
+        )
+        return self._last
+
+    def _read_light(self, tick: int, timestamp: float, engine: Any) -> WorldSnapshot:
+        last = self._last
+        values = self._player_reader.read_fields()
+        player = self._player_reader.get_player(values=values)
+        # O buffer de nome do player e sobreposto por outros campos; o nome
+        # confiavel vem da BattleList, entao mantem o do ultimo snapshot.
+        if player is not None and last.player is not None and player.id == last.player.id:
+            player.name = last.player.name
+        self._last = WorldSnapshot(
+            player=player,
+            creatures=last.creatures,
+            target=self._read_target(values),
+            table=last.table,
+            tick=tick,
+            timestamp=timestamp,
+            previous=last,
+            by_id=last.by_id,
+            creatures_fresh=False,
+            engine=engine,
+        )
+        return self._last
+
+    def _read_target(self, values: Optional[Dict[Hashable, Any]]) -> TargetState:
+        if not self._target_planned:
+            return TargetState()
+        try:
+            if values is None:
+                # Plano falhou neste tick: le os dois DWORDs direto.
+                values = {
+                    key: self._memory.read_uint(self._target_addresses[key], use_cache=False)
+                    for key in ("target_id", "target_battlelist_id")
+                }
+            return TargetState.from_dwords(
+                values["target_id"], values["target_battlelist_id"]
+            )
+        except Exception as e:
+            self._log.debug(f"Falha ao ler estado de target: {e}")
+            return TargetState()
@@ -24,7 +24,12 @@ from src.core.constants.addresses_860 import (
 )
 
 def _is_admin() -> bool:
-    """Verifica se o processo possui privilégios de administrador no Windows."""
+    """
+    Verifica se o processo possui privilégios de administrador no Windows.
+    No Linux (cliente sob Wine) a permissao de ptrace e checada no attach.
+    """
+    if sys.platform != "win32":
+        return True
     try:
         return ctypes.windll.shell32.IsUserAnAdmin() != 0
     except Exception:
@@ -44,6 +44,8 @@ class BotApp:
             "stamina":  0,
             "capacity": 0,
         }
+        # Telemetria de I/O do ultimo tick (BotEngine.io_stats)
+        self._io_data = {}
 
         self._build_ui()
         self._bind_events()
@@ -171,11 +173,14 @@ class BotApp:
 
     def _start_engine_loop(self) -> None:
         engine = self.bot_engine
+        # Cura fora do tick: thread propria lendo so HP/mana
+        engine.start_healing_lane()
 
         def _loop():
             while self.bot_running and engine:
                 try:
                     engine.tick()
+                    self._io_data = engine.io_stats()
                     if engine.player:
                         self.update_from_engine(engine.player)
                 except Exception as exc:
@@ -185,7 +190,8 @@ class BotApp:
                             f"Erro: {e}", COLORS["warn_yellow"]
                         ),
                     )
-                time.sleep(0.15)
+                time.sleep(engine.time_to_next_tick(0.15))
+            engine.stop_healing_lane()
 
         threading.Thread(target=_loop, daemon=True, name="BotEngineLoop").start()
 
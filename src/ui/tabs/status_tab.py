@@ -24,6 +24,9 @@ class StatusTab(ctk.CTkFrame):
         self._var_mana_val = ctk.StringVar(value="0 / 1")
         self._var_mana_bar = ctk.DoubleVar(value=0.0)
 
+        self._var_io_summary = ctk.StringVar(value="Sem dados de I/O")
+        self._var_io_labels  = ctk.StringVar(value="")
+
         self._build()
         self.refresh()
 
@@ -50,6 +53,10 @@ class StatusTab(ctk.CTkFrame):
         self._build_id_card(id_card)
         self._build_vitals_card(vitals_card)
 
+        io_card = self._make_card(body, 1, 0)
+        io_card.grid(columnspan=2, pady=(12, 0))
+        self._build_io_card(io_card)
+
     def _make_card(self, parent, row, col, padx=(0, 0)):
         card = ctk.CTkFrame(
             parent, fg_color=COLORS["bg_card"],
@@ -126,6 +133,47 @@ class StatusTab(ctk.CTkFrame):
 
         ctk.CTkFrame(card, fg_color="transparent", height=12).grid(row=5, column=0)
 
+    def _build_io_card(self, card):
+        ctk.CTkLabel(
+            card, text="I/O DE MEMORIA (ULTIMO TICK)",
+            font=FONTS["badge"], text_color=COLORS["accent_light"]
+        ).grid(row=0, column=0, padx=16, pady=(14, 4), sticky="w")
+        ctk.CTkFrame(card, fg_color=COLORS["border"], height=1).grid(
+            row=1, column=0, sticky="ew", padx=16, pady=(0, 8))
+        ctk.CTkLabel(
+            card, textvariable=self._var_io_summary,
+            font=FONTS["subhead"], text_color=COLORS["text_label"], anchor="w"
+        ).grid(row=2, column=0, padx=16, pady=(0, 4), sticky="w")
+        ctk.CTkLabel(
+            card, textvariable=self._var_io_labels,
+            font=FONTS["mono"], text_color=COLORS["text_muted"],
+            anchor="w", justify="left"
+        ).grid(row=3, column=0, padx=16, pady=(0, 12), sticky="w")
+
+    def _refresh_io(self):
+        io = getattr(self.app, "_io_data", None)
+        if not io:
+            return
+        reads = io["summary"]["reads"]
+        writes = io["summary"]["writes"]
+        cache = io.get("cache", {})
+        self._var_io_summary.set(
+            f"Tick {io['tick_ms']:.1f} ms  |  {reads['calls']} reads "
+            f"({reads['bytes']:,} B, {reads['ms']:.2f} ms)  |  "
+            f"{writes['calls']} writes  |  {reads['failures'] + writes['failures']} falhas  |  "
+            f"cache {cache.get('hit_rate', 0.0) * 100:.0f}%"
+        )
+        lines = [f"{'rotulo':<18}{'calls':>6}{'bytes':>9}{'hits':>6}{'falhas':>7}{'p95 us':>9}"]
+        for kind, labels in (("r", io["reads"]), ("w", io["writes"])):
+            for label, st in sorted(labels.items()):
+                p95 = st["p95_us"]
+                p95_txt = "-" if p95 is None else (">10000" if p95 == float("inf") else f"{p95:.0f}")
+                lines.append(
+                    f"{kind} {label[:16]:<16}{st['calls']:>6}{st['bytes']:>9}"
+                    f"{st['cache_hits']:>6}{st['failures']:>7}{p95_txt:>9}"
+                )
+        self._var_io_labels.set("\n".join(lines))
+
     def _build_vital_block(self, parent, row, icon, label,
                            var_pct, var_val, var_bar,
                            bar_color, bar_bg, val_color):
@@ -187,3 +235,5 @@ class StatusTab(ctk.CTkFrame):
         self._var_mana_pct.set(f"{mana_pct * 100:.0f}%")
         self._var_mana_val.set(f"{mana:,} / {mana_max:,}".replace(",", "."))
         self._var_mana_bar.set(mana_pct)
+
+        self._refresh_io()
@@ -0,0 +1,101 @@
+import threading
+import time
+import unittest
+
+from src.application.action_arbiter import ActionArbiter
+from src.core.constants.spells_860 import spell_group
+from src.infrastructure.injection.input_dispatcher import InputDispatcher
+
+
+class _Recorder:
+    def __init__(self):
+        self.sent = []
+
+    def cast_spell(self, words):
+        self.sent.append(words)
+
+    def send_hotkey(self, key):
+        self.sent.append(key)
+        return True
+
+
+class _SlowDispatcher:
+    """Dispatcher cujo submit demora: alarga a janela entre is_queued e submit."""
+
+    def __init__(self):
+        self.keys = set()
+        self.lock = threading.Lock()
+
+    def is_queued(self, key):
+        with self.lock:
+            return key in self.keys
+
+    def submit(self, steps, priority=0, ttl=None, key=None):
+        time.sleep(0.05)
+        with self.lock:
+            if key in self.keys:
+                return False
+            self.keys.add(key)
+            return True
+
+
+class TestActionArbiter(unittest.TestCase):
+    """Testes do arbitro de acoes com exhaust por grupo."""
+
+    def setUp(self):
+        self.now = [100.0]
+        self.inner = _Recorder()
+        self.dispatcher = InputDispatcher(self.inner)
+        self.arbiter = ActionArbiter(self.dispatcher, clock=lambda: self.now[0])
+
+    def tearDown(self):
+        self.dispatcher.stop()
+
+    def test_spell_groups(self):
+        self.assertEqual(spell_group("Exura  Vita"), "healing")
+        self.assertEqual(spell_group("utani gran hur"), "healing")
+        self.assertEqual(spell_group("exevo gran mas vis"), "attack")
+        self.assertEqual(spell_group("exori moe ico"), "attack")  # por prefixo
+        self.assertIsNone(spell_group("F1"))
+
+    def test_exhaust_drops_or_defers(self):
+        """Mesmo grupo: descarta se a janela esta longe, adia se esta perto."""
+        self.assertTrue(self.arbiter.cast("exori"))
+        self.assertTrue(self.arbiter.cast("exura"))        # outro grupo
+        self.assertFalse(self.arbiter.cast("exori gran"))  # attack: 2s de exhaust
+        self.now[0] += 1.8
+        self.assertTrue(self.arbiter.cast("exori gran"))   # abre em 0.2s: adiada
+        self.assertFalse(self.arbiter.hotkey("F3", group="attack"))
+        self.assertTrue(self.arbiter.hotkey("F3"))         # sem grupo: passa
+
+        snapshot = self.arbiter.snapshot()
+        self.assertEqual((snapshot["sent"], snapshot["deferred"], snapshot["exhausted"]), (4, 1, 2))
+        self.assertAlmostEqual(snapshot["exhaust"]["attack"], 2.2)
+        self.assertEqual(self.inner.sent, ["exori", "exura", "exori gran", "F3"])
+
+    def test_concurrent_duplicate_does_not_hold_exhaust(self):
+        """Duas threads pedindo a mesma magia: uma envia, a outra coalesce sem reservar."""
+        arbiter = ActionArbiter(_SlowDispatcher(), clock=lambda: self.now[0], max_defer=5.0)
+        threads = [threading.Thread(target=arbiter.cast, args=("exura",)) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        snapshot = arbiter.snapshot()
+        self.assertEqual((snapshot["sent"], snapshot["coalesced"], snapshot["deferred"]), (1, 1, 0))
+        self.assertAlmostEqual(snapshot["exhaust"]["healing"], 1.0)
+
+    def test_duplicate_queued_action_is_coalesced(self):
+        """A mesma acao ainda na fila nao e enfileirada de novo."""
+        self.dispatcher.start()
+        self.assertTrue(self.arbiter.hotkey("F5", delay=0.5))
+        self.assertTrue(self.arbiter.hotkey("f5"))
+        self.assertTrue(self.arbiter.cast("Exura", delay=0.5))
+        self.assertTrue(self.arbiter.cast("exura"))
+        self.assertEqual(self.arbiter.coalesced, 2)
+        self.assertEqual(self.dispatcher.pending, 2)
+        self.assertEqual(self.arbiter.snapshot()["exhausted"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
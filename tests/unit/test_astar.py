@@ -0,0 +1,79 @@
+import time
+import unittest
+
+from src.ai.pathfinding.astar import AStar
+from src.ai.pathfinding.pathfinder import Pathfinder
+from src.ai.pathfinding.tile_grid import TileGrid
+from src.core.value_objects.position import Position
+
+
+def _cost(path):
+    cost = 0
+    for a, b in zip(path, path[1:]):
+        cost += 14 if a.x != b.x and a.y != b.y else 10
+    return cost
+
+
+class TestAStar(unittest.TestCase):
+    """Testes do A* com open set indexado."""
+
+    def test_long_open_route(self):
+        """Rota de 400 tiles sem o antigo corte de 1000 iteracoes."""
+        astar = AStar()
+        start = time.perf_counter()
+        path = astar.find_path(Position(1000, 1000, 7), Position(1400, 1150, 7))
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(path), 401)
+        self.assertEqual(_cost(path), 150 * 14 + 250 * 10)
+        self.assertLess(elapsed, 0.1)
+
+    def test_detour_is_optimal(self):
+        """Parede com uma passagem: contorna pelo caminho de menor custo."""
+        astar = AStar()
+        for y in range(90, 111):
+            if y != 108:
+                astar.add_blocked(Position(105, y, 7))
+        path = astar.find_path(Position(100, 100, 7), Position(110, 100, 7))
+        self.assertIn(Position(105, 108, 7), path)
+        self.assertEqual(_cost(path), 2 * (5 * 14 + 3 * 10))
+        for a, b in zip(path, path[1:]):
+            self.assertEqual(a.distance_chebyshev(b), 1)
+        self.assertFalse(set(path) & {Position(105, y, 7) for y in range(90, 108)})
+
+    def test_unreachable_and_restricted(self):
+        astar = AStar()
+        self.assertIsNone(astar.find_path(Position(1, 1, 7), Position(5, 5, 6)))
+        astar.set_walkable([Position(x, 10, 7) for x in range(10, 20)])
+        path = astar.find_path(Position(10, 10, 7), Position(19, 10, 7))
+        self.assertEqual(len(path), 10)
+        self.assertIsNone(astar.find_path(Position(10, 10, 7), Position(19, 11, 7)))
+        self.assertIn((12, 10, 7), astar.walkable_tiles)
+
+    def test_restricted_ignores_learned_walkable(self):
+        """Tiles marcados caminhaveis na grade nao ampliam a area restrita."""
+        grid = TileGrid()
+        for y in range(10, 13):
+            grid.mark_walkable(15, y, 7)
+        astar = AStar(grid)
+        astar.set_walkable([Position(x, 10, 7) for x in range(10, 20)])
+        self.assertFalse(astar.is_walkable(Position(15, 11, 7)))
+        self.assertIsNone(astar.find_path(Position(10, 10, 7), Position(15, 12, 7)))
+
+        grid.mark_blocked(15, 10, 7)  # bloqueio da grade vale na area
+        self.assertIsNone(astar.find_path(Position(10, 10, 7), Position(19, 10, 7)))
+        self.assertTrue(grid.is_walkable(15, 11, 7))
+
+        astar.set_walkable([])
+        self.assertFalse(astar.restricted)
+        self.assertEqual(len(astar.find_path(Position(10, 10, 7), Position(15, 12, 7))), 6)
+
+    def test_pathfinder_api(self):
+        pathfinder = Pathfinder()
+        path = pathfinder.find_path(Position(100, 100, 7), Position(103, 100, 7))
+        self.assertEqual(path[0], Position(100, 100, 7))
+        self.assertEqual(path[-1], Position(103, 100, 7))
+        self.assertIs(pathfinder.find_path(Position(100, 100, 7), Position(103, 100, 7)), path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import struct
+import unittest
+from unittest import mock
+
+from src.core.constants.addresses_860 import BATTLE_LIST, CREATURE
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.readers.creature_reader import CreatureReader
+
+
+class TestCreatureReaderSlotCache(unittest.TestCase):
+    """Testes do reaproveitamento de slots inalterados no modo snapshot."""
+
+    def setUp(self):
+        # tick_seconds=0: as criaturas ficam paradas entre ticks
+        self.backend = SimulatedBackend(creatures=20, seed=3, tick_seconds=0.0)
+        pm = ProcessManager(backend=self.backend)
+        self.assertTrue(pm.attach())
+        self.memory = MemoryReader(pm)
+        self.reader = CreatureReader(self.memory, BATTLE_LIST, CREATURE)
+
+    def _read(self):
+        self.memory.advance_generation()
+        return {c.battle_slot: c for c in self.reader.get_creatures()}
+
+    def _write(self, slot, field, data):
+        address = BATTLE_LIST["start"].value + slot * BATTLE_LIST["step"] + CREATURE[field]
+        self.assertTrue(self.backend.write(address, data))
+
+    def test_unchanged_slots_keep_creature(self):
+        first = self._read()
+        second = self._read()
+        self.assertEqual(len(second), 21)
+        for slot, creature in second.items():
+            self.assertIs(creature, first[slot])
+
+    def test_hp_change_rebuilds_slot(self):
+        first = self._read()
+        self._write(3, "hp_bar", struct.pack("<i", 40))
+        second = self._read()
+        self.assertIsNot(second[3], first[3])
+        self.assertEqual(second[3].stats.health, 40)
+        self.assertEqual(second[3].name, first[3].name)
+        self.assertTrue(all(second[s] is first[s] for s in second if s != 3))
+
+    def test_new_id_decodes_name(self):
+        first = self._read()
+        self._write(4, "id", struct.pack("<I", 0x40009999))
+        self._write(4, "name", b"Hydra\x00")
+        second = self._read()
+        self.assertEqual(second[4].id, 0x40009999)
+        self.assertEqual(second[4].name, "Hydra")
+        self.assertNotEqual(first[4].name, "Hydra")
+
+    def test_per_field_fallback_resets_previous(self):
+        """Apos o fallback por campo, o proximo snapshot reconstroi todos os slots."""
+        self._read()
+        with mock.patch.object(self.reader._array, "read", side_effect=MemoryReadError("falha")):
+            fallback = self._read()
+        self.assertIsNone(self.reader._previous)
+        self.assertEqual(len(fallback), 21)
+
+        rebuilt = self._read()
+        self.assertEqual(set(rebuilt), set(fallback))
+        for slot, creature in rebuilt.items():
+            self.assertIsNot(creature, fallback[slot])
+            self.assertEqual(creature.id, fallback[slot].id)
+        self.assertIs(self._read()[5], rebuilt[5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import unittest
+from unittest import mock
+
+from src.ai.combat.combat_ai import CombatAI
+from src.ai.combat.threat_analyzer import aligned_table
+from src.core.entities.creature import Creature
+from src.core.entities.creature_table import CreatureTable
+from src.core.entities.player import Player
+from src.core.value_objects.position import Position
+from src.core.value_objects.stats import Stats
+
+
+def _creature(cid, x, y, z, hp):
+    return Creature(cid, f"c{cid}", Position(x, y, z), Stats(hp, 100, 0, 0), True, False)
+
+
+class TestCreatureTable(unittest.TestCase):
+    """Testes para as consultas vetorizadas da CreatureTable."""
+
+    def setUp(self):
+        self.creatures = [
+            _creature(1, 105, 100, 7, 80),
+            _creature(2, 101, 101, 7, 30),
+            _creature(3, 100, 100, 8, 10),
+        ]
+        self.table = CreatureTable.from_creatures(self.creatures)
+        self.origin = Position(100, 100, 7)
+
+    def test_distances_match_position(self):
+        """Distancias devem seguir Position.distance_chebyshev (3D)."""
+        expected = [self.origin.distance_chebyshev(c.position) for c in self.creatures]
+        self.assertEqual(self.table.distances(self.origin).tolist(), expected)
+
+    def test_closest_and_lowest_hp(self):
+        """Deve selecionar a mais proxima e a de menor HP."""
+        self.assertIs(self.table.closest(self.origin), self.creatures[1])
+        self.assertIs(self.table.lowest_hp(), self.creatures[2])
+
+    def test_lowest_hp_with_mask(self):
+        """A mascara deve restringir os candidatos."""
+        mask = self.table.rows["z"] == 7
+        self.assertIs(self.table.lowest_hp(mask), self.creatures[1])
+        self.assertIsNone(self.table.lowest_hp(self.table.rows["z"] == 6))
+
+    def test_subset_keeps_alignment(self):
+        """subset deve manter linhas e criaturas alinhadas."""
+        sub = self.table.subset([2, 0])
+        self.assertEqual([c.id for c in sub.creatures], [3, 1])
+        self.assertEqual(sub.rows["id"].tolist(), [3, 1])
+
+    def test_combat_ai_reuses_tick_table(self):
+        """Com a tabela do tick, a decisao nao remonta a CreatureTable."""
+        player = Player(0, "Druid", self.origin, Stats(100, 100, 100, 100), 50, 0, 30, 100, 2520, 1000)
+        ai = CombatAI()
+        with mock.patch.object(CreatureTable, "from_creatures") as build:
+            analysis = ai.analyze_situation(player, self.creatures, self.table)
+            build.assert_not_called()
+        self.assertIs(analysis["highest_threat"], self.creatures[1])
+        with mock.patch.object(CreatureTable, "from_creatures", wraps=CreatureTable.from_creatures) as build:
+            ai.analyze_situation(player, self.creatures)
+            self.assertEqual(build.call_count, 1)
+
+    def test_aligned_table_checks_entities(self):
+        """Mesmo tamanho nao basta: lista reordenada ou trocada remonta a tabela."""
+        self.assertIs(aligned_table(list(self.creatures), self.table), self.table)
+        reordered = self.creatures[::-1]
+        rebuilt = aligned_table(reordered, self.table)
+        self.assertIsNot(rebuilt, self.table)
+        self.assertEqual(rebuilt.creatures, tuple(reordered))
+        self.assertEqual(rebuilt.lowest_hp(), self.creatures[2])
+        other = [_creature(9, 100, 100, 7, 50)] + self.creatures[1:]
+        self.assertEqual(aligned_table(other, self.table).creatures[0].id, 9)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import struct
+import unittest
+
+from src.application.action_cooldown import ActionCooldown
+from src.application.bot_engine import BotEngine
+from src.application.scripts.healing_script import HealingScript
+from src.core.constants.addresses_860 import BATTLE_LIST, CREATURE, PLAYER
+from src.infrastructure.injection.simulated_injector import SimulatedInjector
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+
+
+class TestActionCooldown(unittest.TestCase):
+    """Testes do cooldown global de acoes."""
+
+    def test_try_acquire_blocks_until_window_passes(self):
+        now = [10.0]
+        cooldown = ActionCooldown(1.0, clock=lambda: now[0])
+        self.assertTrue(cooldown.try_acquire())
+        self.assertFalse(cooldown.try_acquire())
+        now[0] = 10.5
+        self.assertAlmostEqual(cooldown.remaining(), 0.5)
+        now[0] = 11.0
+        self.assertTrue(cooldown.try_acquire())
+
+
+class TestHealingLane(unittest.TestCase):
+    """Testes da lane de cura de baixa latencia."""
+
+    def setUp(self):
+        self.backend = SimulatedBackend(creatures=0)
+        pm = ProcessManager(backend=self.backend)
+        self.engine = BotEngine(
+            process_manager=pm,
+            memory_reader=MemoryReader(pm),
+            keyboard_injector=SimulatedInjector(self.backend),
+            player_addresses=PLAYER,
+            battle_list_addresses=BATTLE_LIST,
+            creature_offsets=CREATURE,
+        )
+        self.healing = HealingScript()
+        self.healing.enabled = True
+        self.engine.script_engine.register(self.healing)
+        self.assertTrue(self.engine.start())
+        self.engine.enabled = True
+        self.engine.tick()  # player carregado, HP cheio
+
+    def tearDown(self):
+        self.engine.stop()
+
+    def _set_health(self, hp):
+        self.backend.write(PLAYER["health"].value, struct.pack("<i", hp))
+
+    def test_lane_reads_fresh_hp_and_heals(self):
+        """A lane ve o HP atual sem esperar o tick e lanca a cura."""
+        self.assertTrue(self.engine.start_healing_lane(interval=60.0))
+        lane = self.engine.healing_lane
+        self.assertTrue(self.healing.detached)
+
+        self._set_health(300)
+        self.assertEqual(lane.read_player().stats.health, 300)
+        self.assertTrue(lane.step())
+        self.assertTrue(self.engine.injector.flush())
+        self.assertEqual(self.backend.stats["spells_cast"], 1)
+        reads = lane.io_stats.take_tick()["healing lane"]
+        self.assertEqual((reads.calls, reads.bytes), (2, 80))  # 1 read de 40 bytes por passo
+
+        self.engine.stop_healing_lane()
+        self.assertFalse(self.healing.detached)
+
+    def test_shared_cooldown_prevents_double_cast(self):
+        """Tick e lane nao lancam duas magias dentro do cooldown global."""
+        self.engine.start_healing_lane(interval=60.0)
+        self._set_health(300)
+        self.assertTrue(self.engine.healing_lane.step())
+        self.assertFalse(self.engine.cast_spell("exura"))
+        self.engine.stop_healing_lane()
+        self.healing.config["last_heal_time"] = 0
+        self.engine.tick()  # script volta ao tick, mas o exhaust ainda vale
+        self.assertTrue(self.engine.injector.flush())
+        self.assertEqual(self.backend.stats["spells_cast"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
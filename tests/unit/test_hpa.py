@@ -0,0 +1,119 @@
+import random
+import time
+import unittest
+
+from src.ai.pathfinding.astar import AStar
+from src.ai.pathfinding.hpa import HierarchicalMap
+from src.ai.pathfinding.pathfinder import Pathfinder
+from src.ai.pathfinding.tile_grid import TileGrid
+from src.core.value_objects.position import Position
+
+ORIGIN = 32000
+
+
+def _cost(path):
+    return sum(14 if a.x != b.x and a.y != b.y else 10 for a, b in zip(path, path[1:]))
+
+
+def _walled_city(grid):
+    """Paredes verticais a cada 100 tiles, com uma passagem de 2 tiles alternada."""
+    for k in range(1, 15):
+        gap = ORIGIN + (10 if k % 2 else 180)
+        for y in range(ORIGIN - 50, ORIGIN + 250):
+            if not gap <= y < gap + 2:
+                grid.mark_blocked(ORIGIN + k * 100, y, 7)
+
+
+class TestHierarchicalMap(unittest.TestCase):
+    """Testes do HPA* (grafo de clusters sobre a TileGrid)."""
+
+    def _check_path(self, grid, path, start, goal=None):
+        self.assertEqual(path[0], start)
+        if goal is not None:
+            self.assertEqual(path[-1], goal)
+        for a, b in zip(path, path[1:]):
+            self.assertEqual(a.distance_chebyshev(b), 1)
+            self.assertFalse(grid.is_blocked(b.x, b.y, b.z))
+
+    def test_near_optimal_against_astar(self):
+        rnd = random.Random(5)
+        grid = TileGrid()
+        for _ in range(3000):
+            grid.mark_blocked(ORIGIN + rnd.randrange(256), ORIGIN + rnd.randrange(256), 7)
+        astar, hpa = AStar(grid), HierarchicalMap(grid)
+        checked = 0
+        while checked < 10:
+            start = Position(ORIGIN + rnd.randrange(64), ORIGIN + rnd.randrange(256), 7)
+            goal = Position(ORIGIN + rnd.randrange(192, 256), ORIGIN + rnd.randrange(256), 7)
+            grid.forget(start.x, start.y, 7)
+            grid.forget(goal.x, goal.y, 7)
+            path, expected = hpa.find_path(start, goal), astar.find_path(start, goal)
+            self._check_path(grid, path, start, goal)
+            self.assertLessEqual(_cost(path), _cost(expected) * 1.1)
+            checked += 1
+
+    def test_cross_city_route_is_fast_when_warm(self):
+        grid = TileGrid()
+        _walled_city(grid)
+        hpa = HierarchicalMap(grid)
+        start, goal = Position(ORIGIN, ORIGIN + 100, 7), Position(ORIGIN + 1550, ORIGIN + 100, 7)
+        path = hpa.find_path(start, goal)
+        self._check_path(grid, path, start, goal)
+        builds = hpa.builds
+        began = time.perf_counter()
+        self.assertEqual(hpa.find_path(start, goal), path)
+        self.assertLess(time.perf_counter() - began, 0.2)
+        self.assertEqual(hpa.builds, builds)  # nada reconstruido
+
+    def test_partial_refinement(self):
+        grid = TileGrid()
+        _walled_city(grid)
+        hpa = HierarchicalMap(grid)
+        start, goal = Position(ORIGIN, ORIGIN + 100, 7), Position(ORIGIN + 1550, ORIGIN + 100, 7)
+        path = hpa.find_path(start, goal, max_clusters=2)
+        self._check_path(grid, path, start)
+        self.assertNotEqual(path[-1], goal)
+        clusters = {(p.x // hpa.size, p.y // hpa.size) for p in path}
+        self.assertEqual(len(clusters), 3)  # o de start + 2 atravessados
+
+    def test_incremental_rebuild(self):
+        grid = TileGrid()
+        for y in range(ORIGIN - 100, ORIGIN + 200):
+            if y != ORIGIN + 40:
+                grid.mark_blocked(ORIGIN + 100, y, 7)
+        hpa = HierarchicalMap(grid)
+        start, goal = Position(ORIGIN + 20, ORIGIN + 40, 7), Position(ORIGIN + 200, ORIGIN + 40, 7)
+        self.assertIn(Position(ORIGIN + 100, ORIGIN + 40, 7), hpa.find_path(start, goal))
+        clusters = hpa.cluster_count
+
+        grid.mark_blocked(ORIGIN + 100, ORIGIN + 40, 7)  # fecha a porta
+        self.assertEqual(hpa.cluster_count, clusters - 1)
+        self.assertIsNone(hpa.find_path(start, goal))
+
+        clusters = hpa.cluster_count
+        grid.forget(ORIGIN + 100, ORIGIN + 150, 7)  # abre outra passagem
+        self.assertEqual(hpa.cluster_count, clusters - 1)
+        path = hpa.find_path(start, goal)
+        self._check_path(grid, path, start, goal)
+        self.assertIn(Position(ORIGIN + 100, ORIGIN + 150, 7), path)
+
+    def test_same_cluster_or_floor_is_left_to_local_search(self):
+        hpa = HierarchicalMap(TileGrid())
+        self.assertIsNone(hpa.find_path(Position(ORIGIN, ORIGIN, 7), Position(ORIGIN + 5, ORIGIN + 5, 7)))
+        self.assertIsNone(hpa.find_path(Position(ORIGIN, ORIGIN, 7), Position(ORIGIN + 500, ORIGIN, 6)))
+
+    def test_pathfinder_uses_hierarchy_for_long_routes(self):
+        pathfinder = Pathfinder()
+        _walled_city(pathfinder.grid)
+        start, goal = Position(ORIGIN, ORIGIN + 100, 7), Position(ORIGIN + 1550, ORIGIN + 100, 7)
+        path = pathfinder.find_path(start, goal)
+        self.assertEqual(path[0], start)
+        self.assertLessEqual(len(path), 3 * pathfinder.hpa.size)
+
+        pathfinder.hierarchical = False
+        near = Position(ORIGIN + 50, ORIGIN + 100, 7)
+        self.assertEqual(pathfinder.find_path(start, near)[-1], near)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import threading
+import time
+import unittest
+
+from src.infrastructure.injection.input_dispatcher import InputDispatcher
+from src.infrastructure.injection.memory_walker import MemoryWalker
+from src.core.constants.virtual_keys import VK_LEFT, VK_UP
+from src.core.value_objects.position import Position
+
+
+class _SlowInjector:
+    """Injector que registra (instante, comando) e demora em cast_spell."""
+
+    def __init__(self, cast_seconds=0.0):
+        self.sent = []
+        self.cast_seconds = cast_seconds
+        self.casting = threading.Event()
+
+    def cast_spell(self, words):
+        self.casting.set()
+        time.sleep(self.cast_seconds)
+        self.sent.append((time.monotonic(), words))
+
+    def send_hotkey(self, key):
+        self.sent.append((time.monotonic(), key))
+        return True
+
+    def send_key_background(self, vk):
+        self.sent.append((time.monotonic(), vk))
+        return True
+
+
+class TestInputDispatcher(unittest.TestCase):
+    """Testes da fila de input nao bloqueante."""
+
+    def setUp(self):
+        self.inner = _SlowInjector(cast_seconds=0.1)
+        self.dispatcher = InputDispatcher(self.inner)
+        self.dispatcher.start()
+
+    def tearDown(self):
+        self.dispatcher.stop()
+
+    def test_enqueue_returns_immediately(self):
+        """cast_spell nao espera o injector: o custo fica no worker."""
+        start = time.perf_counter()
+        self.dispatcher.cast_spell("exori")
+        self.assertLess(time.perf_counter() - start, 0.05)
+        self.assertTrue(self.dispatcher.flush())
+        self.assertEqual([c for _, c in self.inner.sent], ["exori"])
+
+    def test_priority_and_delay(self):
+        """Com o worker ocupado, o comando de maior prioridade sai primeiro."""
+        self.dispatcher.cast_spell("exori")
+        self.assertTrue(self.inner.casting.wait(1.0))
+        self.dispatcher.send_hotkey("F5", delay=0.0)
+        self.dispatcher.cast_spell("exura", priority=100)
+        self.dispatcher.send_hotkey("F1", delay=0.3)
+        self.assertTrue(self.dispatcher.flush())
+        self.assertEqual([c for _, c in self.inner.sent], ["exori", "exura", "F5", "F1"])
+
+    def test_walker_diagonal_sequence(self):
+        """Diagonal: duas setas espacadas, sem bloquear quem chamou."""
+        walker = MemoryWalker()
+        walker.set_injector(self.dispatcher)
+        start = time.perf_counter()
+        self.assertTrue(walker.walk_to(Position(100, 100, 7), Position(99, 99, 7)))
+        self.assertLess(time.perf_counter() - start, 0.02)
+        self.assertTrue(self.dispatcher.flush())
+        (t1, first), (t2, second) = self.inner.sent
+        self.assertEqual((first, second), (VK_LEFT, VK_UP))
+        self.assertGreaterEqual(t2 - t1, 0.029)
+
+    def test_synchronous_without_worker(self):
+        """Sem start() o dispatcher executa na hora (simulador/benchmark)."""
+        inner = _SlowInjector()
+        InputDispatcher(inner).send_hotkey("F2", delay=5.0)
+        self.assertEqual([c for _, c in inner.sent], ["F2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+
+from src.core.value_objects.address import MemoryAddress
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.infrastructure.memory.io_stats import IOStats, summarize
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.memory_writer import MemoryWriter
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend
+
+
+class TestIOStats(unittest.TestCase):
+    """Testes da telemetria de I/O de memoria."""
+
+    def test_take_tick_accumulates_totals(self):
+        """take_tick deve zerar o tick e acumular no total."""
+        stats = IOStats()
+        stats.record("uint", 4, 2e-6)
+        stats.record("uint", 0, 30e-6, ok=False)
+        stats.hit("uint")
+
+        tick = stats.take_tick()
+        self.assertEqual((tick["uint"].calls, tick["uint"].bytes), (2, 4))
+        self.assertEqual((tick["uint"].failures, tick["uint"].cache_hits), (1, 1))
+        self.assertEqual(tick["uint"].percentile(50), 5.0)
+        self.assertEqual(tick["uint"].percentile(99), 50.0)
+
+        stats.record("uint", 4, 1e-6)
+        self.assertEqual(stats.take_tick()["uint"].calls, 1)
+        self.assertEqual(stats.totals["uint"].calls, 3)
+        self.assertEqual(summarize(stats.take_tick())["calls"], 0)
+
+    def test_reader_and_writer_labels(self):
+        """Reader e writer devem contar por rotulo, incluindo hits e falhas."""
+        pm = ProcessManager(backend=SimulatedBackend(creatures=0))
+        pm.attach()
+        reader, writer = MemoryReader(pm), MemoryWriter(pm)
+        reader.advance_generation()
+
+        reader.read_int(MemoryAddress(0x63FE94))
+        reader.read_int(MemoryAddress(0x63FE98))
+        reader.read_uint(MemoryAddress(0x63FE64), use_cache=False)
+        with self.assertRaises(MemoryReadError):
+            reader.read_bytes(MemoryAddress(0x100), 4)
+        writer.write_uint(MemoryAddress(0x63DA40), 1)
+
+        reads = reader.io_stats.take_tick()
+        self.assertEqual(reads["inteiro"].calls, 1)  # uma pagina lida
+        self.assertEqual(reads["inteiro"].bytes, 0x1000)
+        self.assertEqual(reads["inteiro"].cache_hits, 1)
+        self.assertEqual(reads["uint"].bytes, 4)
+        self.assertEqual(sum(s.failures for s in reads.values()), 1)
+        writes = writer.io_stats.take_tick()
+        self.assertEqual((writes["uint"].calls, writes["uint"].bytes), (1, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
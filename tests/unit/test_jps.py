@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from src.ai.pathfinding.astar import AStar
+from src.ai.pathfinding.jps import JumpPointSearch
+from src.ai.pathfinding.pathfinder import Pathfinder
+from src.ai.pathfinding.tile_grid import TileGrid
+from src.core.value_objects.position import Position
+
+
+def _cost(path):
+    return sum(14 if a.x != b.x and a.y != b.y else 10 for a, b in zip(path, path[1:]))
+
+
+class TestJumpPointSearch(unittest.TestCase):
+    """Testes do modo JPS contra o A*."""
+
+    def _check_path(self, grid, path, start, goal):
+        self.assertEqual((path[0], path[-1]), (start, goal))
+        for a, b in zip(path, path[1:]):
+            self.assertEqual(a.distance_chebyshev(b), 1)
+            self.assertFalse(grid.is_blocked(b.x, b.y, b.z))
+
+    def test_same_cost_as_astar(self):
+        """Obstaculos aleatorios cruzando bordas de chunk: custo otimo igual."""
+        rnd = random.Random(7)
+        grid = TileGrid()
+        for x in range(200, 300):
+            for y in range(230, 290):
+                if rnd.random() < 0.3:
+                    grid.mark_blocked(x, y, 7)
+        astar, jps = AStar(grid), JumpPointSearch(grid, margin=100)
+        for _ in range(30):
+            start = Position(rnd.randrange(200, 300), rnd.randrange(230, 290), 7)
+            goal = Position(rnd.randrange(200, 300), rnd.randrange(230, 290), 7)
+            grid.forget(start.x, start.y, 7)
+            grid.forget(goal.x, goal.y, 7)
+            expected, path = astar.find_path(start, goal), jps.find_path(start, goal)
+            self.assertEqual(expected is None, path is None)
+            if path:
+                self._check_path(grid, path, start, goal)
+                self.assertEqual(_cost(path), _cost(expected))
+
+    def test_diagonal_between_blocked_corners(self):
+        """Tibia permite a diagonal mesmo com os dois ortogonais bloqueados."""
+        grid = TileGrid()
+        for x in range(80, 122):
+            grid.mark_blocked(x, 201 - x, 7)  # parede diagonal x + y = 201
+        start, goal = Position(100, 100, 7), Position(101, 101, 7)
+        self.assertEqual(JumpPointSearch(grid).find_path(start, goal), [start, goal])
+        self.assertEqual(AStar(grid).find_path(start, goal), [start, goal])
+
+    def test_pathfinder_mode(self):
+        pathfinder = Pathfinder(mode="jps")
+        for y in range(0, 200):
+            pathfinder.add_obstacle(Position(1000, 900 + y, 7))
+        start, goal = Position(990, 1000, 7), Position(1010, 1000, 7)
+        # Parede maior que o retangulo do JPS: cai no A*
+        path = pathfinder.find_path(start, goal)
+        self.assertEqual(path[-1], goal)
+        self.assertEqual(pathfinder.jps.find_path(start, goal), None)
+        with self.assertRaises(ValueError):
+            pathfinder.mode = "dijkstra"
+
+
+if __name__ == '__main__':
+    unittest.main()
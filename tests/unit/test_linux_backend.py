@@ -0,0 +1,82 @@
+import ctypes
+import os
+import sys
+import threading
+import unittest
+
+from src.core.exceptions.memory_exceptions import MemoryReadError
+
+
+@unittest.skipUnless(sys.platform.startswith("linux"), "backend Linux")
+class TestLinuxMemoryBackend(unittest.TestCase):
+    """Testes do backend Linux lendo a memoria do proprio processo."""
+
+    def setUp(self):
+        from src.infrastructure.memory.backends.linux_backend import LinuxMemoryBackend
+        self.backend = LinuxMemoryBackend()
+        self.assertTrue(self.backend.open(os.getpid()))
+        self.source = ctypes.create_string_buffer(b"Rotworm\x00Dragon\x00", 16)
+        self.address = ctypes.addressof(self.source)
+
+    def tearDown(self):
+        self.backend.close()
+
+    def test_read_into(self):
+        """Deve ler bytes do processo direto no buffer."""
+        buf = bytearray(7)
+        self.assertEqual(self.backend.read_into(self.address, buf), 7)
+        self.assertEqual(buf, b"Rotworm")
+
+    def test_read_scatter_skips_bad_range(self):
+        """Uma faixa invalida nao deve impedir a leitura das seguintes."""
+        a, bad, b = bytearray(3), bytearray(4), bytearray(6)
+        counts = self.backend.read_scatter([(self.address, a), (0x10, bad), (self.address + 8, b)])
+        self.assertEqual(counts, [3, 0, 6])
+        self.assertEqual((a, b), (b"Rot", b"Dragon"))
+
+    def test_read_into_invalid_address(self):
+        """Endereco nao mapeado deve levantar MemoryReadError."""
+        with self.assertRaises(MemoryReadError):
+            self.backend.read_into(0x10, bytearray(4))
+
+    def test_write(self):
+        """Deve escrever na memoria do processo."""
+        self.assertTrue(self.backend.write(self.address, b"Demon"))
+        self.assertEqual(self.source.raw[:7], b"Demonrm")
+
+    def test_concurrent_read_scatter(self):
+        """Duas threads no mesmo backend (engine + HealingLane) nao trocam buffers."""
+        sources = [
+            ctypes.create_string_buffer(bytes([tag]) * 4096, 4096) for tag in (0x11, 0x22)
+        ]
+        errors = []
+
+        def worker(source, tag, ranges):
+            base = ctypes.addressof(source)
+            for _ in range(2000):
+                buffers = [bytearray(64 + i) for i in range(ranges)]
+                counts = self.backend.read_scatter(
+                    [(base + 64 * i, buf) for i, buf in enumerate(buffers)]
+                )
+                if counts != [len(b) for b in buffers] or any(b.strip(bytes([tag])) for b in buffers):
+                    errors.append(tag)
+                    return
+
+        threads = [
+            threading.Thread(target=worker, args=(sources[0], 0x11, 3)),
+            threading.Thread(target=worker, args=(sources[1], 0x22, 40)),
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(errors, [])
+
+    def test_regions(self):
+        """Deve listar as regioes mapeadas via /proc/<pid>/maps."""
+        regions = self.backend.regions()
+        self.assertTrue(any(r.start <= self.address < r.end for r in regions))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+from src.ai.pathfinding.map_store import MapStore, chunk_filename
+from src.ai.pathfinding.pathfinder import Pathfinder
+from src.ai.pathfinding.tile_grid import BLOCKED, CHUNK_TILES, WALKABLE
+from src.application.scripts.cavebot_script import CavebotScript
+from src.core.value_objects.position import Position
+
+
+class TestMapStore(unittest.TestCase):
+    """Testes do mapa persistente em chunks mmap."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = self._tmp.name
+        self.stores = []
+
+    def tearDown(self):
+        for store in self.stores:
+            store.close()
+        self._tmp.cleanup()
+
+    def _open(self):
+        store = MapStore(self.directory)
+        self.stores.append(store)
+        return store
+
+    def test_persists_fixed_size_chunks(self):
+        store = self._open()
+        store.mark_blocked(32100, 32200, 7)
+        store.mark_walkable(32101, 32200, 7)
+        self.assertEqual(store.dirty, 1)
+        self.assertEqual(store.flush(), 1)
+        store.close()
+
+        path = os.path.join(self.directory, chunk_filename(32100 >> 8, 32200 >> 8, 7))
+        self.assertEqual(os.path.getsize(path), CHUNK_TILES)
+
+        reopened = self._open()
+        self.assertEqual(reopened.chunk_count, 0)  # nada mapeado ainda
+        self.assertTrue(reopened.is_blocked(32100, 32200, 7))
+        self.assertTrue(reopened.is_walkable(32101, 32200, 7))
+        self.assertEqual(reopened.chunk_count, 1)
+        self.assertEqual(reopened.get(40000, 40000, 7), 0)
+        self.assertEqual(reopened.chunk_count, 1)  # chunk inexistente nao cria arquivo
+
+    def test_shared_between_stores(self):
+        """Dois bots no mesmo diretorio veem as marcas um do outro."""
+        first, second = self._open(), self._open()
+        first.mark_walkable(1000, 1000, 7)
+        self.assertTrue(second.is_walkable(1000, 1000, 7))
+        second.mark_blocked(1001, 1000, 7)
+        self.assertEqual(first.get(1001, 1000, 7), BLOCKED)
+        self.assertEqual(set(first.tiles(WALKABLE | BLOCKED)), {(1000, 1000, 7), (1001, 1000, 7)})
+
+    def test_walkable_area_does_not_touch_store(self):
+        """set_walkable_area restringe so a busca: o mapa aprendido fica."""
+        store = self._open()
+        learned = {(200 + i, 300, 7 + i % 2) for i in range(11)}
+        for x, y, z in learned:
+            store.mark_walkable(x, y, z)
+        Pathfinder(store).set_walkable_area([Position(500, 500, 7)])
+        store.close()
+
+        self.assertEqual(set(self._open().tiles(WALKABLE)), learned)
+
+    def test_pathfinder_and_cavebot_learn_into_store(self):
+        store = self._open()
+        for y in range(95, 106):
+            store.mark_blocked(105, y, 7)
+        cavebot = CavebotScript()
+        cavebot.attach_map(store)
+        cavebot._learn_position(Position(100, 100, 7))
+        for now in (0.0, 30.0, 61.0):
+            cavebot._learn_blocked(Position(100, 101, 7), now)
+        cavebot._learn_blocked(Position(100, 100, 7))  # ja pisado: continua livre
+        store.close()
+
+        reopened = self._open()
+        path = Pathfinder(reopened).find_path(Position(100, 100, 7), Position(110, 100, 7))
+        self.assertTrue(all(p.x != 105 or not 95 <= p.y <= 105 for p in path))
+        self.assertEqual(reopened.get(100, 100, 7), WALKABLE)
+        self.assertEqual(reopened.get(100, 101, 7), BLOCKED)
+
+    def test_transient_block_is_not_persisted(self):
+        """Falhas seguidas (magic wall, passo perdido) nao gravam bloqueio."""
+        store = self._open()
+        cavebot = CavebotScript()
+        cavebot.attach_map(store)
+        tile = Position(100, 101, 7)
+        for now in (0.0, 0.7, 1.4, 2.1):
+            cavebot._learn_blocked(tile, now)
+        self.assertEqual(store.get(100, 101, 7), 0)
+
+        cavebot._learn_position(tile)  # passou: zera a contagem
+        store.forget(100, 101, 7)
+        cavebot._learn_blocked(tile, 100.0)
+        cavebot._learn_blocked(tile, 200.0)
+        self.assertEqual(store.get(100, 101, 7), 0)
+        cavebot._learn_blocked(tile, 200.1)
+        self.assertEqual(store.get(100, 101, 7), BLOCKED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import struct
+import time
+import unittest
+from typing import Optional
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.core.value_objects.address import MemoryAddress
+from src.infrastructure.memory.memory_reader import PAGE_SIZE, MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+
+BASE = 0x10000
+
+
+class _FakeBackend(IMemoryBackend):
+    """2 paginas e meia mapeadas a partir de BASE; registra cada leitura."""
+
+    def __init__(self):
+        self.mem = bytearray(2 * PAGE_SIZE + PAGE_SIZE // 2)
+        self.reads = []
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        return 1
+
+    def open(self, pid: int) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def is_open(self) -> bool:
+        return True
+
+    @property
+    def handle(self) -> Optional[int]:
+        return 1
+
+    def read_into(self, address: int, buffer) -> int:
+        self.reads.append((address, len(buffer)))
+        offset = address - BASE
+        if not 0 <= offset < len(self.mem):
+            raise MemoryReadError(hex(address))
+        got = min(len(buffer), len(self.mem) - offset)
+        buffer[:got] = self.mem[offset:offset + got]
+        return got
+
+    def write(self, address: int, data: bytes) -> bool:
+        offset = address - BASE
+        self.mem[offset:offset + len(data)] = data
+        return True
+
+    def put_int(self, address: int, value: int) -> None:
+        struct.pack_into("<i", self.mem, address - BASE, value)
+
+
+class TestPageCache(unittest.TestCase):
+    """Testes do cache de paginas do MemoryReader (PageCache + _view)."""
+
+    def setUp(self):
+        self.backend = _FakeBackend()
+        pm = ProcessManager(backend=self.backend)
+        self.assertTrue(pm.attach())
+        self.reader = MemoryReader(pm)
+
+    def test_cached_within_generation(self):
+        hp, mana = BASE + 0x10, BASE + 0x20
+        self.backend.put_int(hp, 5)
+        self.backend.put_int(mana, 9)
+        self.reader.advance_generation()
+        self.assertEqual(self.reader.read_int(MemoryAddress(hp)), 5)
+        self.assertEqual(self.reader.read_int(MemoryAddress(mana)), 9)
+        self.assertEqual(self.backend.reads, [(BASE, PAGE_SIZE)])
+
+        self.backend.put_int(hp, 7)
+        self.assertEqual(self.reader.read_int(MemoryAddress(hp)), 5)
+        self.reader.advance_generation()
+        self.assertEqual(self.reader.read_int(MemoryAddress(hp)), 7)
+        self.assertEqual(len(self.backend.reads), 2)
+
+    def test_ttl_expiry_without_ticks(self):
+        """Sem advance_generation, a pagina expira pelo ttl."""
+        pm = ProcessManager(backend=self.backend)
+        pm.attach()
+        reader = MemoryReader(pm, cache_ttl=0.02)
+        address = MemoryAddress(BASE + 0x10)
+        self.backend.put_int(address.value, 1)
+        self.assertEqual(reader.read_int(address), 1)
+        self.backend.put_int(address.value, 2)
+        self.assertEqual(reader.read_int(address), 1)
+        time.sleep(0.03)
+        self.assertEqual(reader.read_int(address), 2)
+
+    def test_field_crossing_page_boundary(self):
+        address = BASE + PAGE_SIZE - 2
+        self.backend.put_int(address, -123456)
+        self.reader.advance_generation()
+        self.assertEqual(self.reader.read_int(MemoryAddress(address)), -123456)
+        self.assertEqual(self.backend.reads, [(BASE, PAGE_SIZE), (BASE + PAGE_SIZE, PAGE_SIZE)])
+
+    def test_partially_mapped_page_reads_exact(self):
+        """Ultima pagina so meio mapeada: cai para o read exato do campo."""
+        address = BASE + 2 * PAGE_SIZE + 0x10
+        self.backend.put_int(address, 42)
+        self.reader.advance_generation()
+        self.assertEqual(self.reader.read_int(MemoryAddress(address)), 42)
+        self.assertEqual(self.backend.reads[-1], (address, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
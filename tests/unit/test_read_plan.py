@@ -0,0 +1,55 @@
+import struct
+import unittest
+from src.core.value_objects.address import MemoryAddress
+from src.infrastructure.memory.read_plan import ReadPlan
+
+
+class TestReadPlan(unittest.TestCase):
+    """Testes para o planejador de leituras ReadPlan."""
+
+    def test_merges_nearby_fields(self):
+        """Campos proximos devem cair numa unica faixa."""
+        plan = (
+            ReadPlan()
+            .add("a", MemoryAddress(0x1000), "int")
+            .add("b", MemoryAddress(0x1010), "uint")
+            .add_string("name", 0x1004, 8)
+        )
+
+        self.assertEqual(len(plan.ranges), 1)
+        self.assertEqual(plan.ranges[0].start, 0x1000)
+        self.assertEqual(plan.ranges[0].size, 0x14)
+
+    def test_splits_distant_fields(self):
+        """Campos alem do max_gap devem gerar faixas separadas."""
+        plan = ReadPlan(max_gap=16).add("a", 0x1000).add("b", 0x2000)
+
+        self.assertEqual([r.start for r in plan.ranges], [0x1000, 0x2000])
+        self.assertEqual([len(b) for b in plan.buffers], [4, 4])
+
+    def test_decode(self):
+        """Deve decodificar cada campo no offset correto da faixa."""
+        plan = (
+            ReadPlan()
+            .add("hp", 0x100, "int")
+            .add("id", 0x104, "uint")
+            .add("voc", 0x108, "byte")
+            .add_string("name", 0x109, 6)
+        )
+        buf = struct.pack("<iIB", -5, 0xFFFFFFFE, 3) + b"Knight"
+
+        values = {}
+        plan.decode(0, buf, values)
+
+        self.assertEqual(values, {"hp": -5, "id": 0xFFFFFFFE, "voc": 3, "name": "Knight"})
+
+    def test_invalid_kind(self):
+        """Tipos desconhecidos ou strings sem tamanho devem falhar."""
+        with self.assertRaises(ValueError):
+            ReadPlan().add("x", 0x10, "double")
+        with self.assertRaises(ValueError):
+            ReadPlan().add("x", 0x10, "string")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import os
+import struct
+import tempfile
+import unittest
+from typing import Optional
+
+from src.core.interfaces.memory_backend import IMemoryBackend
+from src.core.exceptions.memory_exceptions import MemoryReadError
+from src.core.value_objects.address import MemoryAddress
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.memory.recording import Recording, RecordingWriter
+from src.infrastructure.memory.replay_memory_reader import ReplayMemoryReader
+from src.infrastructure.memory.backends.recording_backend import RecordingBackend
+from src.infrastructure.memory.backends.replay_backend import ReplayBackend
+
+HP = 0x63FE94
+
+
+class _BufferBackend(IMemoryBackend):
+    """Backend sobre um bytearray que comeca no endereco 0x63F000."""
+
+    BASE = 0x63F000
+
+    def __init__(self):
+        self.mem = bytearray(0x2000)
+
+    def find_process(self, process_name: str) -> Optional[int]:
+        return 1
+
+    def open(self, pid: int) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    @property
+    def is_open(self) -> bool:
+        return True
+
+    @property
+    def handle(self) -> Optional[int]:
+        return 1
+
+    def read_into(self, address: int, buffer) -> int:
+        offset = address - self.BASE
+        if not 0 <= offset < len(self.mem):
+            raise MemoryReadError(hex(address))
+        got = min(len(buffer), len(self.mem) - offset)
+        buffer[:got] = self.mem[offset:offset + got]
+        return got
+
+    def write(self, address: int, data: bytes) -> bool:
+        offset = address - self.BASE
+        self.mem[offset:offset + len(data)] = data
+        return True
+
+
+class TestRecording(unittest.TestCase):
+    """Testes do formato de gravacao e do replay por tick."""
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".tbrec")
+        os.close(fd)
+        os.remove(self.path)
+
+    def tearDown(self):
+        for path in (self.path, self.path + ".idx"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_round_trip(self):
+        """Ticks gravados devem ser lidos de volta com regioes e timestamp."""
+        writer = RecordingWriter(self.path)
+        writer.write_tick([(0x1000, b"abcd"), (0x2000, b"xy")], timestamp=1.5)
+        writer.write_tick([(0x1000, b"efgh")], timestamp=2.0)
+        writer.close()
+
+        rec = Recording(self.path)
+        self.assertEqual(len(rec), 2)
+        frame = rec.frame(0)
+        self.assertEqual((frame.tick, frame.timestamp), (0, 1.5))
+        self.assertEqual([(a, bytes(d)) for a, d in frame.regions],
+                         [(0x1000, b"abcd"), (0x2000, b"xy")])
+        self.assertEqual(bytes(rec.frame(1).regions[0][1]), b"efgh")
+        del frame
+        rec.close()
+
+    def test_rebuilds_missing_index(self):
+        """Sem o .idx, o indice deve ser reconstruido varrendo os dados."""
+        writer = RecordingWriter(self.path)
+        for i in range(3):
+            writer.write_tick([(0x1000, bytes([i]) * 4)])
+        writer.close()
+        os.remove(self.path + ".idx")
+        with open(self.path, "ab") as f:
+            f.write(b"\x05\x00")  # tick truncado no fim
+
+        rec = Recording(self.path)
+        self.assertEqual(len(rec), 3)
+        self.assertEqual(bytes(rec.frame(2).regions[0][1]), b"\x02" * 4)
+        rec.close()
+
+    def test_replay_prefers_region_covering_whole_read(self):
+        """Regioes sobrepostas: usa a que cobre a faixa toda, nao a primeira."""
+        writer = RecordingWriter(self.path)
+        writer.write_tick([(0x1000, b"abcd"), (0x0FF0, bytes(range(0x20, 0x40)))])
+        writer.close()
+
+        rec = Recording(self.path)
+        backend = ReplayBackend(rec)
+        backend.begin_tick()
+        buf = bytearray(8)
+        self.assertEqual(backend.read_into(0x1002, buf), 8)
+        self.assertEqual(bytes(buf), bytes(range(0x32, 0x3A)))
+        # sem regiao completa, continua a leitura parcial
+        self.assertEqual(backend.read_into(0x100E, bytearray(8)), 2)
+        del backend
+        rec.close()
+
+    def test_record_and_replay(self):
+        """Replay deve servir, tick a tick, os bytes lidos na gravacao."""
+        source = _BufferBackend()
+        reader = MemoryReader(ProcessManager(backend=RecordingBackend(source, self.path)))
+        for hp in (100, 80, 55):
+            struct.pack_into("<i", source.mem, HP - source.BASE, hp)
+            reader.advance_generation()
+            self.assertEqual(reader.read_int(MemoryAddress(HP)), hp)
+        reader._pm.backend.close()
+
+        replay = ReplayMemoryReader(self.path)
+        self.assertEqual(replay.tick_count, 3)
+        seen = []
+        for _ in range(3):
+            replay.advance_generation()
+            seen.append(replay.read_int(MemoryAddress(HP)))
+        self.assertEqual(seen, [100, 80, 55])
+        self.assertTrue(replay.exhausted)
+        with self.assertRaises(MemoryReadError):
+            replay.read_int(MemoryAddress(0x100))
+        replay.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+
+from src.application.scripts.script_engine import ScriptEngine
+from src.application.scripts.base_script import BaseScript
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend
+from src.infrastructure.readers.world_reader import WorldReader
+from src.core.constants.addresses_860 import BATTLE_LIST, CREATURE, PLAYER
+
+
+class _CountScript(BaseScript):
+    def __init__(self, name, interval, priority=0, acts=False, needs_creatures=True):
+        super().__init__(name)
+        self.enabled = True
+        self.interval = interval
+        self.priority = priority
+        self.needs_creatures = needs_creatures
+        self.acts = acts
+        self.runs = []
+
+    def execute(self, context):
+        self.runs.append(context["now"])
+        return self.acts
+
+
+class TestScriptScheduler(unittest.TestCase):
+    """Testes do agendamento por periodo do ScriptEngine."""
+
+    def _run(self, engine, times):
+        for now in times:
+            engine.execute_all({"now": now}, now)
+
+    def test_each_script_runs_at_its_own_rate(self):
+        """Cada script so executa quando seu periodo venceu."""
+        engine = ScriptEngine()
+        fast = _CountScript("Fast", 0.03)
+        slow = _CountScript("Slow", 0.2)
+        engine.register(fast)
+        engine.register(slow)
+
+        self._run(engine, [i * 0.01 for i in range(41)])  # 0.00 .. 0.40
+        self.assertEqual(len(fast.runs), 14)
+        self.assertEqual(len(slow.runs), 3)
+        self.assertAlmostEqual(engine.next_due(), 0.42)
+
+    def test_preempted_script_runs_next_tick(self):
+        """Script preemptado por acao critica continua devido."""
+        engine = ScriptEngine()
+        heal = _CountScript("Heal", 1.0, priority=100, acts=True)
+        aim = _CountScript("Aim", 1.0, priority=50)
+        engine.register(aim)
+        engine.register(heal)
+
+        self._run(engine, [0.0, 0.01])
+        self.assertEqual(heal.runs, [0.0])
+        self.assertEqual(aim.runs, [0.01])
+
+    def test_needs_creatures_and_enable(self):
+        """needs_creatures olha so os scripts devidos; enable reagenda para ja."""
+        engine = ScriptEngine()
+        heal = _CountScript("Heal", 0.03, needs_creatures=False)
+        aim = _CountScript("Aim", 0.1)
+        engine.register(heal)
+        engine.register(aim)
+
+        self._run(engine, [0.0])
+        self.assertFalse(engine.needs_creatures(0.05))
+        self.assertTrue(engine.needs_creatures(0.1))
+
+        engine.disable_script("Aim")
+        self.assertFalse(engine.needs_creatures(0.5))
+        engine.enable_script("Aim")
+        self.assertTrue(engine.needs_creatures(0.06))
+
+    def test_enable_after_register_runs_once_per_period(self):
+        """register + enable_script (aba do aimbot) nao duplica o timer."""
+        engine = ScriptEngine()
+        aim = _CountScript("Aim", 0.1)
+        engine.register(aim)
+        engine.enable_script("Aim")
+
+        self._run(engine, [i * 0.1 for i in range(10)])
+        self.assertEqual(len(aim.runs), 10)
+
+    def test_world_reader_light_path(self):
+        """read(creatures=False) le so o player e reaproveita as criaturas."""
+        pm = ProcessManager(backend=SimulatedBackend(creatures=50, seed=2))
+        pm.attach()
+        reader = MemoryReader(pm)
+        world = WorldReader(reader, PLAYER, BATTLE_LIST, CREATURE)
+        reader.advance_generation()
+        full = world.read()
+        reader.io_stats.take_tick()
+
+        reader.advance_generation()
+        light = world.read(creatures=False)
+        reads = reader.io_stats.take_tick()
+        self.assertIs(light.creatures, full.creatures)
+        self.assertEqual(light.player.name, full.player.name)
+        self.assertNotIn("battle list", reads)
+
+
+if __name__ == '__main__':
+    unittest.main()
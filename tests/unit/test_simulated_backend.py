@@ -0,0 +1,77 @@
+import struct
+import unittest
+
+from src.core.constants.addresses_860 import BATTLE_LIST, CREATURE, PLAYER, TARGET
+from src.infrastructure.memory.backends.simulated_backend import (
+    PLAYER_ID,
+    SimulatedBackend,
+)
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.readers.world_reader import WorldReader
+
+
+class TestSimulatedBackend(unittest.TestCase):
+    """Testes do processo 8.60 simulado."""
+
+    def setUp(self):
+        self.backend = SimulatedBackend(creatures=249, seed=1)
+        self.pm = ProcessManager(backend=self.backend)
+        self.assertTrue(self.pm.attach())
+        self.reader = MemoryReader(self.pm)
+        self.world = WorldReader(self.reader, PLAYER, BATTLE_LIST, CREATURE)
+
+    def _target_slot(self, snapshot):
+        return next(c for c in snapshot.creatures if c.id != PLAYER_ID).battle_slot
+
+    def _hp_bar(self, slot):
+        address = BATTLE_LIST["start"].value + slot * BATTLE_LIST["step"] + CREATURE["hp_bar"]
+        buf = bytearray(4)
+        self.backend.read_into(address, buf)
+        return struct.unpack("<i", buf)[0]
+
+    def test_world_reader(self):
+        """WorldReader deve ler o player e a BattleList cheia."""
+        self.reader.advance_generation()
+        snapshot = self.world.read()
+        self.assertEqual(snapshot.player.id, PLAYER_ID)
+        self.assertEqual(snapshot.player.name, "Simbot")
+        self.assertEqual(len(snapshot.creatures), 250)
+
+    def test_creatures_move(self):
+        """Criaturas devem andar entre ticks."""
+        self.reader.advance_generation()
+        before = {c.id: c.position for c in self.world.read().creatures}
+        for _ in range(20):
+            self.reader.advance_generation()
+        after = {c.id: c.position for c in self.world.read().creatures}
+        self.assertTrue(any(after[i] != before[i] for i in before))
+
+    def test_target_requires_attack_count(self):
+        """Escrever o target sem incrementar attack_count nao ataca."""
+        self.reader.advance_generation()
+        slot = self._target_slot(self.world.read())
+        creature_id = self.world.read().creatures[slot].id
+        self.backend.write(TARGET["target_id"].value, struct.pack("<I", creature_id & 0xFFFFFF | 1 << 24))
+        for _ in range(30):
+            self.backend.step()
+        self.assertEqual(self._hp_bar(slot), 100)
+        self.assertEqual(self.backend.attacks, 0)
+
+    def test_attack_kills_and_clears_target(self):
+        """Com attack_count incrementado o alvo apanha, morre e o target zera."""
+        self.reader.advance_generation()
+        slot = self._target_slot(self.world.read())
+        creature_id = self.world.read().creatures[slot].id
+        self.backend.write(TARGET["target_id"].value, struct.pack("<I", creature_id & 0xFFFFFF | 1 << 24))
+        self.backend.write(TARGET["attack_count"].value, struct.pack("<I", 1))
+        self.backend.step()
+        self.assertLess(self._hp_bar(slot), 100)
+        for _ in range(200):
+            self.backend.step()
+        self.assertEqual(self.backend.kills, 1)
+        self.assertEqual(self.reader.read_uint(TARGET["target_id"], use_cache=False), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
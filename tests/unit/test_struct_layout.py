@@ -0,0 +1,48 @@
+import struct
+import unittest
+from src.infrastructure.memory.struct_layout import compile_layout, np
+from src.infrastructure.memory.layouts_860 import CREATURE_LAYOUT, VIP_LAYOUT
+
+
+class TestStructLayout(unittest.TestCase):
+    """Testes para os layouts compilados de addresses_860."""
+
+    def test_struct_size_matches_stride(self):
+        """O struct compilado deve ter exatamente o tamanho do stride."""
+        self.assertEqual(CREATURE_LAYOUT.struct.size, 0xA8)
+        self.assertEqual(VIP_LAYOUT.struct.size, 0x2C)
+
+    def test_string_size_until_next_field(self):
+        """Strings sem tamanho vao ate o proximo campo da tabela."""
+        self.assertEqual(CREATURE_LAYOUT.field("name").size, 32)
+        self.assertEqual(VIP_LAYOUT.field("name").size, 30)
+
+    def test_decode_records(self):
+        """Deve decodificar varios registros de um unico buffer."""
+        layout = compile_layout(
+            "test", {"distance_id": 0, "distance_name": 4, "distance_hp": 12},
+            {"id": "uint", "name": "string", "hp": "int"}, stride=16, prefix="distance_",
+        )
+        buf = struct.pack("<I8si", 7, b"Rat\x00", 50) + struct.pack("<I8si", 8, b"Troll", -1)
+
+        records = list(layout.iter_unpack(buf))
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(layout.decode(buf, 16), {"id": 8, "name": "Troll", "hp": -1})
+        self.assertEqual(records[0][layout.index["hp"]], 50)
+
+    def test_overlapping_fields(self):
+        """Campos sobrepostos devem ser rejeitados."""
+        with self.assertRaises(ValueError):
+            compile_layout("bad", {"a": 0, "b": 2}, {"a": "int", "b": "int"}, stride=8)
+
+    @unittest.skipIf(np is None, "NumPy nao instalado")
+    def test_numpy_dtype(self):
+        """O dtype NumPy deve usar os mesmos offsets e itemsize."""
+        dtype = CREATURE_LAYOUT.dtype
+        self.assertEqual(dtype.itemsize, 0xA8)
+        self.assertEqual(dtype.fields["hp_bar"][1], 136)
+
+
+if __name__ == '__main__':
+    unittest.main()
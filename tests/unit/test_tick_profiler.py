@@ -0,0 +1,64 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.application.tick_profiler import TickProfiler
+from src.application.scripts.script_engine import ScriptEngine
+from src.application.scripts.base_script import BaseScript
+
+
+class _NoopScript(BaseScript):
+    def __init__(self):
+        super().__init__("Noop")
+        self.enabled = True
+
+    def execute(self, context):
+        return False
+
+
+class TestTickProfiler(unittest.TestCase):
+    """Testes do profiler de fases do tick."""
+
+    def test_ring_buffer_keeps_last_samples(self):
+        """A janela deve conter so as ultimas `capacity` amostras."""
+        profiler = TickProfiler(capacity=4)
+        for ms in (100, 100, 1, 2, 3, 4):
+            profiler.record("tick", ms / 1000)
+
+        stats = profiler.phase_stats("tick")
+        self.assertEqual((stats["samples"], stats["total"]), (4, 6))
+        self.assertAlmostEqual(stats["max_ms"], 4.0)
+        self.assertAlmostEqual(stats["last_ms"], 4.0)
+        self.assertAlmostEqual(stats["p50_ms"], 2.5)
+        self.assertIsNone(profiler.phase_stats("run_scripts"))
+
+    def test_snapshot_and_export(self):
+        """snapshot ordena por p95; export grava JSON com as fases."""
+        profiler = TickProfiler()
+        profiler.record("process_events", 0.001)
+        profiler.record("update_state", 0.004)
+        self.assertEqual(list(profiler.snapshot()), ["update_state", "process_events"])
+
+        fd, path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        try:
+            profiler.export(path, include_samples=True)
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        finally:
+            os.remove(path)
+        self.assertIn("update_state", data["phases"])
+        self.assertEqual(data["samples_ms"]["process_events"], [1.0])
+
+    def test_script_engine_records_each_script(self):
+        """ScriptEngine deve registrar a duracao de cada script executado."""
+        engine = ScriptEngine()
+        engine.profiler = TickProfiler()
+        engine.register(_NoopScript())
+        engine.execute_all({})
+        self.assertEqual(engine.profiler.phase_stats("script:Noop")["samples"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from src.ai.pathfinding.astar import AStar
+from src.ai.pathfinding.map_analyzer import MapAnalyzer
+from src.ai.pathfinding.pathfinder import Pathfinder
+from src.ai.pathfinding.tile_grid import BLOCKED, WALKABLE, TileGrid
+from src.core.value_objects.position import Position
+
+
+class TestTileGrid(unittest.TestCase):
+    """Testes da grade de tiles em chunks."""
+
+    def test_flags_cost_and_chunks(self):
+        grid = TileGrid()
+        self.assertEqual(grid.get(32000, 32000, 7), 0)
+        grid.mark_blocked(32000, 32000, 7)
+        grid.set_cost(32000, 32000, 7, 3)
+        grid.mark_walkable(32000, 32000, 7)
+        self.assertEqual(grid.get(32000, 32000, 7), WALKABLE | (3 << 4))
+        grid.mark_blocked(32255, 32256, 7)  # outro chunk
+        grid.mark_blocked(32255, 32256, 8)  # outro andar
+        self.assertEqual(grid.chunk_count, 3)
+        self.assertEqual(set(grid.tiles(BLOCKED)), {(32255, 32256, 7), (32255, 32256, 8)})
+        self.assertEqual(grid.count(WALKABLE | BLOCKED), 3)
+        self.assertTrue(grid.has_flag(BLOCKED, z=8))
+        self.assertFalse(grid.has_flag(WALKABLE, z=8))
+
+    def test_map_analyzer_on_grid(self):
+        analyzer = MapAnalyzer()
+        center = Position(256, 100, 7)  # area cruza a borda de chunk
+        for y in range(98, 103):
+            analyzer.mark_blocked(Position(255, y, 7))
+            analyzer.mark_blocked(Position(256, y, 7))
+        analyzer.mark_walkable(Position(256, 100, 7))
+        self.assertEqual(len(analyzer.get_blocked_positions()), 9)
+        self.assertIn((256, 100, 7), analyzer.known_walkable)
+        self.assertTrue(analyzer.is_area_safe(center, 2, 0.64))
+        self.assertFalse(analyzer.is_area_safe(center, 2, 0.65))
+
+    def test_astar_uses_grid_costs_across_chunks(self):
+        """Tile caro e evitado; caminho atravessa a borda do chunk."""
+        astar = AStar()
+        for x in range(250, 262):
+            astar.grid.set_cost(x, 511, 7, 5)
+            astar.grid.set_cost(x, 512, 7, 5)
+        astar.grid.mark_blocked(256, 510, 7)
+        path = astar.find_path(Position(250, 512, 7), Position(261, 512, 7))
+        self.assertEqual((path[0], path[-1]), (Position(250, 512, 7), Position(261, 512, 7)))
+        self.assertTrue(all(p.y not in (511, 512) for p in path[1:-1]))
+        self.assertNotIn(Position(256, 510, 7), path)
+
+    def test_shared_grid_invalidates_pathfinder_cache(self):
+        grid = TileGrid()
+        pathfinder = Pathfinder(grid)
+        analyzer = MapAnalyzer(grid)
+        start, goal = Position(100, 100, 7), Position(102, 100, 7)
+        self.assertIn(Position(101, 100, 7), pathfinder.find_path(start, goal))
+        analyzer.mark_blocked(Position(101, 100, 7))
+        self.assertNotIn(Position(101, 100, 7), pathfinder.find_path(start, goal))
+
+
+if __name__ == '__main__':
+    unittest.main()
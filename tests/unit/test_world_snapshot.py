@@ -0,0 +1,58 @@
+import unittest
+
+from src.core.constants.addresses_860 import BATTLE_LIST, CREATURE, PLAYER
+from src.core.entities.world_snapshot import WorldSnapshot
+from src.infrastructure.memory.backends.simulated_backend import SimulatedBackend
+from src.infrastructure.memory.memory_reader import MemoryReader
+from src.infrastructure.memory.process_manager import ProcessManager
+from src.infrastructure.readers.world_reader import WorldReader
+
+
+class TestWorldSnapshot(unittest.TestCase):
+    """Testes do snapshot imutavel compartilhado por tick."""
+
+    def setUp(self):
+        pm = ProcessManager(backend=SimulatedBackend(creatures=50, seed=3))
+        pm.attach()
+        self.reader = MemoryReader(pm)
+        self.world = WorldReader(self.reader, PLAYER, BATTLE_LIST, CREATURE)
+
+    def _read(self, tick, creatures=True):
+        self.reader.advance_generation()
+        return self.world.read(creatures=creatures, tick=tick, timestamp=tick * 0.1, engine="bot")
+
+    def test_immutable_and_indexed(self):
+        snapshot = self._read(1)
+        with self.assertRaises(AttributeError):
+            snapshot.player = None
+        with self.assertRaises(TypeError):
+            snapshot.by_id[1] = None
+        self.assertIsInstance(snapshot.creatures, tuple)
+        creature = snapshot.creatures[5]
+        self.assertIs(snapshot.creature(creature.id), creature)
+        self.assertFalse(hasattr(snapshot, "__dict__"))
+
+    def test_script_context_access(self):
+        """O snapshot substitui o dict de contexto dos scripts."""
+        snapshot = self._read(1)
+        self.assertIs(snapshot.get("player"), snapshot.player)
+        self.assertIs(snapshot["creatures"], snapshot.creatures)
+        self.assertIs(snapshot["creature_table"], snapshot.table)
+        self.assertEqual(snapshot.get("bot_engine"), "bot")
+        self.assertEqual(snapshot.get("missing", []), [])
+        self.assertIn("world", snapshot)
+
+    def test_previous_keeps_one_level(self):
+        first = self._read(1)
+        light = self._read(2, creatures=False)
+        third = self._read(3)
+        self.assertIs(light.previous, first)
+        self.assertFalse(light.creatures_fresh)
+        self.assertIs(light.by_id, first.by_id)
+        self.assertEqual((third.tick, third.previous.tick), (3, 2))
+        self.assertIsNone(third.previous.previous)
+        self.assertIs(third.previous.creatures, first.creatures)
+
+
+if __name__ == '__main__':
+    unittest.main()